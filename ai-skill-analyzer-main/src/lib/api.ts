@@ -1,18 +1,24 @@
 // Lightweight API client for OptiResume backend
 // Endpoints:
 // - POST /analyze-resume (multipart: file, job_role, job_description?)
-// - GET  /export-pdf
+// - POST /analyze-resume/stream (same form, NDJSON events)
+// - GET  /export-pdf?result_id=...
 
 export type AnalysisResult = {
   match_percentage: number;
   matched_skills: string[];
   missing_skills: string[];
+  // Semantic match mode only: missing job skills covered by a similar resume skill
+  semantic_matches?: { job_skill: string; resume_skill: string; similarity: number }[];
   recommendations: string[];
+  // "fallback" when the recommendations were built from templates because the LLM was slow or failing
+  recommendations_source?: "llm" | "fallback";
   estimated_time_saved_minutes: number;
 };
 
 export type AnalyzeResumeResponse = {
   result: AnalysisResult;
+  result_id: string;
 };
 
 // Backend URL configuration with fallbacks
@@ -74,9 +80,59 @@ export async function analyzeResume(params: {
   }
 }
 
-export async function exportPdf(): Promise<Blob> {
+export type AnalyzeStreamEvent =
+  | { type: "analysis"; result: AnalysisResult }
+  | { type: "recommendation"; index: number; text: string }
+  | { type: "done"; result: AnalysisResult; result_id: string };
+
+// Streams the analysis: onEvent gets the scores first, then each recommendation line as it is generated
+export async function analyzeResumeStream(
+  params: { file: File; jobRole: string; jobDescription?: string },
+  onEvent: (event: AnalyzeStreamEvent) => void,
+): Promise<AnalyzeResumeResponse> {
+  const form = new FormData();
+  form.append("file", params.file);
+  form.append("job_role", params.jobRole);
+  if (params.jobDescription && params.jobDescription.trim()) {
+    form.append("job_description", params.jobDescription.trim());
+  }
+
+  const base = getBackendBaseUrl();
+  const url = base ? `${base}/analyze-resume/stream` : "/analyze-resume/stream";
+  const res = await fetch(url, { method: "POST", body: form });
+  if (!res.ok || !res.body) {
+    const text = await res.text().catch(() => "");
+    throw new Error(`Analyze failed (${res.status}): ${text || res.statusText}`);
+  }
+
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffered = "";
+  let final: AnalyzeResumeResponse | null = null;
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffered += value;
+    const lines = buffered.split("\n");
+    buffered = lines.pop() ?? "";
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      const event = JSON.parse(line) as AnalyzeStreamEvent;
+      onEvent(event);
+      if (event.type === "done") {
+        final = { result: event.result, result_id: event.result_id };
+      }
+    }
+  }
+  if (!final) {
+    throw new Error("Analysis stream ended before the result was complete");
+  }
+  return final;
+}
+
+export async function exportPdf(resultId: string): Promise<Blob> {
   const base = getBackendBaseUrl();
-  const url = base ? `${base}/export-pdf` : "/export-pdf";
+  const path = `/export-pdf?result_id=${encodeURIComponent(resultId)}`;
+  const url = base ? `${base}${path}` : path;
   
   console.log("Exporting PDF from:", url);
   
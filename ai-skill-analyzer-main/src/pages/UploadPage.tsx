@@ -155,7 +155,7 @@ const UploadPage = () => {
       });
   
       // Navigate to results page passing backend data
-      navigate("/results", { state: { result: analysisResult } });
+      navigate("/results", { state: { result: analysisResult, resultId: response?.result_id } });
     } catch (error) {
       console.error(error);
       setIsAnalyzing(false);
@@ -0,0 +1,135 @@
+import re
+
+# Rule tables for the ATS compatibility score. Every term is a lowercase substring of
+# the resume text, so "experienced" also counts as "experience".
+
+ATS_WEIGHTS = {
+    "structure": 0.35,
+    "formatting": 0.25,
+    "keyword_density": 0.25,
+    "contact": 0.15,
+}
+
+# Each section found scores 100/8 points
+SECTION_TERMS = ("experience", "education", "skills", "summary", "objective", "contact", "phone", "email")
+SECTION_POINTS = 12.5
+
+# (name, terms, points): a rule scores once when any of its terms is found
+FORMATTING_RULES = (
+    ("bullet points", ("•", "-"), 20),
+    ("action words", ("years", "experience", "worked"), 20),
+    ("education keywords", ("bachelor", "master", "degree", "certification"), 20),
+    ("action verbs", ("developed", "managed", "led", "created", "implemented"), 20),
+)
+# Scored when the text contains any digit (quantified achievements)
+QUANTIFIED_POINTS = 20
+
+# Each contact element found scores 100/6 points
+CONTACT_TERMS = ("email", "phone", "linkedin", "github", "portfolio", "website")
+CONTACT_POINTS = 16.67
+
+# Job description terms the resume is checked against, in this order
+JD_IMPORTANT_WORDS = ("experience", "skills", "knowledge", "proficiency", "expertise", "familiarity", "understanding")
+JD_TECH_TERMS = ("python", "javascript", "react", "angular", "vue", "node", "sql", "database", "api", "cloud", "aws", "azure", "docker", "kubernetes")
+
+# Score used when the job description has none of the terms above
+NO_KEYWORDS_SCORE = 50
+
+_ASCII_DIGIT = re.compile(r"\d")
+
+
+# Function to list the job description terms that the resume is scored against
+def extract_ats_keywords(job_description: str) -> list:
+    job_description_lower = job_description.lower()
+    return [term for term in JD_IMPORTANT_WORDS + JD_TECH_TERMS if term in job_description_lower]
+
+
+# Function to check a text for digits with the same result as any(c.isdigit() for c in text)
+def has_digit(text: str) -> bool:
+    # \d (decimal digits) is a subset of str.isdigit, so a hit is final; superscripts
+    # and other non-decimal digits can only hide in non-ASCII text
+    if _ASCII_DIGIT.search(text):
+        return True
+    if text.isascii():
+        return False
+    return any(char.isdigit() for char in set(text))
+
+
+# Function to list the running totals of a rule that adds `points` per term found
+def _running_totals(points: float, count: int) -> tuple:
+    # Totals[k] is k additions in a row, the exact float the per-term loop arrives at
+    totals = [0]
+    for _ in range(count):
+        totals.append(totals[-1] + points)
+    return tuple(totals)
+
+
+_SECTION_TOTALS = _running_totals(SECTION_POINTS, len(SECTION_TERMS))
+_CONTACT_TOTALS = _running_totals(CONTACT_POINTS, len(CONTACT_TERMS))
+_SECTION_SET = frozenset(SECTION_TERMS)
+_CONTACT_SET = frozenset(CONTACT_TERMS)
+
+# Terms every resume is searched for: each section and contact element scores on its own.
+# Terms shared by several groups ("experience", "email", ...) are searched for once.
+SCANNED_TERMS = tuple(dict.fromkeys(SECTION_TERMS + CONTACT_TERMS))
+_SCANNED_SET = frozenset(SCANNED_TERMS)
+
+# Formatting rules as (terms already scanned, other terms in table order, points). A rule
+# scores on its first hit, so the other terms are only searched for until one is found.
+_FORMATTING_PLAN = tuple(
+    (frozenset(term for term in rule_terms if term in _SCANNED_SET),
+     tuple(term for term in rule_terms if term not in _SCANNED_SET),
+     points)
+    for _, rule_terms, points in FORMATTING_RULES
+)
+
+
+# Function to compute the four ATS component scores and their weighted total
+def score_ats(resume_text: str, job_keywords: list) -> dict:
+    """
+    resume_text must already be lowercased. Shared terms are searched for once, formatting
+    terms only until their rule is decided; the groups then read the set of terms found.
+    """
+    found = {term for term in SCANNED_TERMS if term in resume_text}
+
+    keyword_matches = 0
+    for keyword in job_keywords:
+        if keyword in found or (keyword not in _SCANNED_SET and keyword in resume_text):
+            found.add(keyword)
+            keyword_matches += 1
+
+    structure_score = _SECTION_TOTALS[len(found & _SECTION_SET)]
+
+    formatting_score = 0
+    for scanned, other_terms, points in _FORMATTING_PLAN:
+        if scanned.isdisjoint(found):
+            for term in other_terms:
+                if term in resume_text:
+                    found.add(term)
+                    break
+            else:
+                continue
+        formatting_score += points
+    if has_digit(resume_text):
+        formatting_score += QUANTIFIED_POINTS
+
+    if job_keywords:
+        keyword_density_score = min(100, (keyword_matches / len(job_keywords)) * 100)
+    else:
+        keyword_density_score = NO_KEYWORDS_SCORE
+
+    contact_score = _CONTACT_TOTALS[len(found & _CONTACT_SET)]
+
+    overall = (
+        structure_score * ATS_WEIGHTS["structure"] +
+        formatting_score * ATS_WEIGHTS["formatting"] +
+        keyword_density_score * ATS_WEIGHTS["keyword_density"] +
+        contact_score * ATS_WEIGHTS["contact"]
+    )
+    return {
+        "overall": overall,
+        "structure": structure_score,
+        "formatting": formatting_score,
+        "keyword_density": keyword_density_score,
+        "contact": contact_score,
+    }
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+calculate_ats_score on resumes of growing size: table-driven engine vs the original
+per-rule substring scans (kept in test_ats_engine as the reference).
+
+Run from the backend folder:  python -m benchmarks.bench_ats_score
+"""
+import statistics
+import time
+
+from benchmarks.corpus import SAMPLE_RESUME_TEXT
+from core import calculate_ats_score
+from test_ats_engine import legacy_calculate_ats_score
+
+JOB_DESCRIPTION = "Python backend engineer with Docker, Kubernetes, AWS, SQL and API experience"
+COPIES = [1, 10, 60]
+REPEATS = 200
+
+
+def _p50_us(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(timings)
+
+
+def main():
+    no_digits = str.maketrans("", "", "0123456789")
+    print(f"{'resume':>22} {'chars':>8} {'engine us':>10} {'legacy us':>10}")
+    for copies in COPIES:
+        for label, text in [("sample", SAMPLE_RESUME_TEXT), ("sample, no digits", SAMPLE_RESUME_TEXT.translate(no_digits))]:
+            resume = {"text": text * copies}
+            engine_us = _p50_us(lambda: calculate_ats_score(resume, JOB_DESCRIPTION), REPEATS)
+            legacy_us = _p50_us(lambda: legacy_calculate_ats_score(resume, JOB_DESCRIPTION), REPEATS)
+            print(f"{label:>22} {len(resume['text']):>8} {engine_us:>10.1f} {legacy_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
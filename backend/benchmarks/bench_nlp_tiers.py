@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Load time, resident memory and per-document latency for each NLP extraction tier.
+Every tier is measured in a fresh subprocess so RSS numbers do not bleed into each other.
+
+Run from the backend folder:  python -m benchmarks.bench_nlp_tiers [--tiers rule sm md]
+"""
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+SHORT_JD = """
+We are looking for a Software Developer skilled in Python, Django, REST API, Docker, and Kubernetes.
+Experience in cloud infrastructure, CI/CD pipelines, and relational databases like PostgreSQL is a plus.
+"""
+LONG_JD = (SHORT_JD + """
+You will work with Google Cloud, Terraform and Jenkins to ship microservices, mentor engineers
+at Acme Corp, and own observability with Prometheus and Grafana.
+""") * 40
+REPEATS = 20
+
+
+def _rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # ru_maxrss is KiB on Linux
+
+
+def _measure(tier: str) -> dict:
+    from nlp_pipeline import load_nlp, parse_entities, annotate_pos
+
+    rss_before = _rss_mb()
+    start = time.perf_counter()
+    nlp = load_nlp(tier)
+    load_s = time.perf_counter() - start
+
+    result = {"tier": tier, "components": nlp.pipe_names, "load_s": round(load_s, 3)}
+    for label, text in (("short", SHORT_JD), ("long", LONG_JD)):
+        parse_entities(nlp, text)  # warm-up
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            parse_entities(nlp, text)
+            timings.append((time.perf_counter() - start) * 1000)
+        result[f"{label}_ms_p50"] = round(statistics.median(timings), 2)
+
+    start = time.perf_counter()
+    annotate_pos(nlp, parse_entities(nlp, SHORT_JD))
+    result["fallback_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    result["rss_mb"] = round(_rss_mb(), 1)
+    result["rss_model_mb"] = round(_rss_mb() - rss_before, 1)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tiers", nargs="+", default=["rule", "sm", "md"])
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_measure(args.child)))
+        return
+
+    print(f"{'tier':>5} {'load s':>8} {'RSS MB':>8} {'model MB':>9} {'short ms':>9} {'long ms':>9} {'fallback ms':>12}  components")
+    for tier in args.tiers:
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_nlp_tiers", "--child", tier],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{tier:>5} failed: {proc.stderr.strip().splitlines()[-1]}")
+            continue
+        r = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(f"{r['tier']:>5} {r['load_s']:>8} {r['rss_mb']:>8} {r['rss_model_mb']:>9} "
+              f"{r['short_ms_p50']:>9} {r['long_ms_p50']:>9} {r['fallback_ms']:>12}  {','.join(r['components'])}")
+
+
+if __name__ == "__main__":
+    main()
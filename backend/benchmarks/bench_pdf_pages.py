@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Single-threaded vs page-parallel PDF text extraction, to pick PDF_PARALLEL_MIN_PAGES.
+
+Besides the crossover observed on this host, it fits both timings to fixed + per-page
+cost and prints the crossover those costs give on a host with --workers idle cores:
+    parallel_fixed + pages * parallel_per_page / workers < pages * serial_per_page
+On a single core the workers run one after another, so the parallel line measures the
+total work of the fan-out (temp file, hand-off, every worker opening the document).
+
+Run from the backend folder:  python -m benchmarks.bench_pdf_pages [--workers 4]
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz
+
+from benchmarks.corpus import SAMPLE_RESUME_TEXT, make_resume_pdf
+from pdf_extract import extract_pages_parallel
+
+# Up to MAX_PDF_PAGES (50 by default): longer uploads are rejected before extraction
+PAGE_COUNTS = [1, 2, 4, 8, 12, 16, 24, 32, 48]
+REPEATS = 15
+
+
+def _serial(raw: bytes) -> list:
+    with fitz.open(stream=raw, filetype="pdf") as doc:
+        return [page.get_text("text") for page in doc]
+
+
+def _p50_ms(fn) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    pool = ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn"))
+    # Start the workers up front, the service keeps its page pool alive between requests
+    list(pool.map(abs, range(args.workers * 4)))
+
+    crossover = None
+    serial_points, parallel_points = [], []
+    print(f"{'pages':>6} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+    for pages in PAGE_COUNTS:
+        raw = make_resume_pdf(SAMPLE_RESUME_TEXT * 3, pages=pages)
+        assert _serial(raw) == extract_pages_parallel(raw, pages, pool, args.workers, 60)
+        serial_ms = _p50_ms(lambda: _serial(raw))
+        parallel_ms = _p50_ms(lambda: extract_pages_parallel(raw, pages, pool, args.workers, 60))
+        if crossover is None and parallel_ms < serial_ms:
+            crossover = pages
+        # The fit uses the documents that every worker gets a share of
+        if pages >= args.workers:
+            serial_points.append((pages, serial_ms))
+            parallel_points.append((pages, parallel_ms))
+        print(f"{pages:>6} {serial_ms:>10.2f} {parallel_ms:>12.2f} {serial_ms / parallel_ms:>7.2f}x")
+    pool.shutdown()
+    print(f"\nParallel extraction wins from {crossover} pages with {args.workers} workers" if crossover
+          else "\nParallel extraction never won in this range")
+
+    cores = len(os.sched_getaffinity(0))
+    serial = statistics.linear_regression(*zip(*serial_points))
+    parallel = statistics.linear_regression(*zip(*parallel_points))
+    print(f"Serial {serial.intercept:.2f} ms + {serial.slope:.2f} ms/page, parallel {parallel.intercept:.2f} ms "
+          f"+ {parallel.slope:.2f} ms/page of work ({cores} cores here)")
+    if cores < args.workers:
+        per_page_saving = serial.slope - parallel.slope / args.workers
+        projected = math.floor(parallel.intercept / per_page_saving) + 1 if per_page_saving > 0 else None
+        print(f"With {args.workers} idle cores parallel extraction would win from {projected} pages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the analysis pipeline on a synthetic corpus, LLM stubbed.
+
+Times every stage of /analyze-resume + /export-pdf (parse_resume, extract_job_skills,
+analyze_skill_match, calculate_ats_score, generate_llm_recommendations,
+format_for_ui_and_pdf, export_to_pdf) and the whole pipeline, and reports latency
+percentiles, throughput and peak RSS. Results can be saved as JSON, compared with a
+previous run and checked against stored thresholds (exit code 1 on a violation).
+
+Run from the backend folder:
+    python -m benchmarks.bench_pipeline [--samples 200] [--output run.json]
+        [--compare previous.json] [--check benchmarks/thresholds.json]
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.stubs import install_stub_llm
+
+PERCENTILES = (50, 90, 95, 99)
+DEFAULT_THRESHOLDS = os.path.join(os.path.dirname(__file__), "thresholds.json")
+
+
+# Function to summarize a list of millisecond timings
+def summarize(timings_ms: list) -> dict:
+    ordered = sorted(timings_ms)
+    summary = {f"p{p}_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))], 3) for p in PERCENTILES}
+    summary["mean_ms"] = round(statistics.fmean(ordered), 3)
+    summary["max_ms"] = round(ordered[-1], 3)
+    return summary
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+# Function to run the pipeline once per sample, timing each stage
+def run_pipeline(corpus: list) -> dict:
+    import core
+
+    stages = {name: [] for name in (
+        "parse_resume", "extract_job_skills", "analyze_skill_match", "calculate_ats_score",
+        "generate_llm_recommendations", "format_for_ui_and_pdf", "export_to_pdf",
+    )}
+    pipeline = []
+
+    def timed(name, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        stages[name].append((time.perf_counter() - start) * 1000)
+        return result
+
+    wall_start = time.perf_counter()
+    for sample in corpus:
+        start = time.perf_counter()
+        resume_data = timed("parse_resume", core.parse_resume, sample["pdf"])
+        required_skills = timed("extract_job_skills", core.extract_job_skills, sample["job_description"])
+        match_info = timed("analyze_skill_match", core.analyze_skill_match, resume_data, required_skills)
+        ats_data = timed("calculate_ats_score", core.calculate_ats_score, resume_data, sample["job_description"])
+        recommendations = timed("generate_llm_recommendations", core.generate_llm_recommendations,
+                                resume_data, sample["job_description"], match_info)
+        formatted = timed("format_for_ui_and_pdf", core.format_for_ui_and_pdf, match_info, recommendations, ats_data)
+        timed("export_to_pdf", core.export_to_pdf, formatted)
+        pipeline.append((time.perf_counter() - start) * 1000)
+    wall_s = time.perf_counter() - wall_start
+
+    return {
+        "stages": {name: summarize(timings) for name, timings in stages.items()},
+        "pipeline": {**summarize(pipeline), "throughput_per_s": round(len(corpus) / wall_s, 2)},
+    }
+
+
+# Function to list every threshold a result breaks; thresholds mirror the result layout
+def check_thresholds(result: dict, thresholds: dict) -> list:
+    """
+    Keys ending in _ms or _mb are upper bounds, keys starting with min_ are lower
+    bounds on the metric without the prefix, e.g. {"pipeline": {"p95_ms": 250,
+    "min_throughput_per_s": 5}, "peak_rss_mb": 600}.
+    """
+    violations = []
+
+    def walk(expected: dict, actual: dict, path: str):
+        for key, limit in expected.items():
+            if isinstance(limit, dict):
+                walk(limit, actual.get(key, {}), f"{path}{key}.")
+            elif key.startswith("min_"):
+                value = actual.get(key[len("min_"):])
+                if value is not None and value < limit:
+                    violations.append(f"{path}{key[len('min_'):]} = {value} < {limit}")
+            else:
+                value = actual.get(key)
+                if value is not None and value > limit:
+                    violations.append(f"{path}{key} = {value} > {limit}")
+
+    walk(thresholds, result, "")
+    return violations
+
+
+def _print_table(result: dict, previous: dict = None):
+    print(f"{'stage':>30} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'p95 vs prev':>12}")
+    rows = list(result["stages"].items()) + [("pipeline", result["pipeline"])]
+    for name, summary in rows:
+        delta = ""
+        if previous:
+            before = previous["stages"].get(name) if name != "pipeline" else previous.get("pipeline")
+            if before and before.get("p95_ms"):
+                delta = f"{(summary['p95_ms'] / before['p95_ms'] - 1) * 100:+.1f}%"
+        print(f"{name:>30} {summary['p50_ms']:>9.2f} {summary['p95_ms']:>9.2f} {summary['p99_ms']:>9.2f} "
+              f"{summary['max_ms']:>9.2f} {delta:>12}")
+    print(f"throughput: {result['pipeline']['throughput_per_s']} resumes/s, peak RSS: {result['peak_rss_mb']} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-pages", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=5, help="samples run first and left out of the results")
+    parser.add_argument("--llm-delay", type=float, default=0.0, help="seconds the stub LLM sleeps per call")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="previous results JSON to compare p95 latencies with")
+    parser.add_argument("--check", nargs="?", const=DEFAULT_THRESHOLDS, help="thresholds JSON to enforce")
+    args = parser.parse_args()
+
+    import core
+    install_stub_llm(args.llm_delay)
+    core.warm_up(["nlp", "fonts"])
+
+    corpus = generate_corpus(args.samples + args.warmup, seed=args.seed, max_pages=args.max_pages)
+    run_pipeline(corpus[:args.warmup])
+    result = run_pipeline(corpus[args.warmup:])
+    result["peak_rss_mb"] = _peak_rss_mb()
+    result["run"] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "samples": args.samples,
+        "seed": args.seed,
+        "max_pages": args.max_pages,
+        "llm_delay_s": args.llm_delay,
+        "nlp_tier": core.NLP_TIER,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as fh:
+            previous = json.load(fh)
+    _print_table(result, previous)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(result, fh, indent=2)
+
+    if args.check:
+        with open(args.check) as fh:
+            violations = check_thresholds(result, json.load(fh))
+        for violation in violations:
+            print(f"THRESHOLD EXCEEDED: {violation}")
+        if violations:
+            sys.exit(1)
+        print(f"all thresholds in {args.check} met")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Ranking one resume against every role: RoleIndex vs one analyze_skill_match call per role.
+
+Run from the backend folder:  python -m benchmarks.bench_role_index
+"""
+import random
+import statistics
+import time
+
+from core import analyze_skill_match, build_role_index, get_skill_taxonomy
+
+ROLE_COUNTS = [3, 1000, 10000, 100000]
+VOCAB_SIZE = 3000
+SKILLS_PER_ROLE = (5, 15)
+REPEATS = 50
+
+
+def _synthetic_roles(count: int, vocab: list, rng: random.Random) -> dict:
+    return {f"Role {i}": rng.sample(vocab, rng.randint(*SKILLS_PER_ROLE)) for i in range(count)}
+
+
+def _p50_ms(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    rng = random.Random(7)
+    known = get_skill_taxonomy().ids()
+    vocab = known + [f"skill-{i}" for i in range(VOCAB_SIZE - len(known))]
+    resume_skills = rng.sample(vocab, 40)
+
+    print(f"{'roles':>8} {'build ms':>10} {'index ms':>10} {'top10 ms':>10} {'loop ms':>10}")
+    for count in ROLE_COUNTS:
+        roles = _synthetic_roles(count, vocab, rng)
+        start = time.perf_counter()
+        index = build_role_index(roles)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        index_ms = _p50_ms(lambda: index.match_percentages(resume_skills), REPEATS)
+        top_ms = _p50_ms(lambda: index.rank(resume_skills, top_k=10), REPEATS)
+        resume = {"skills": resume_skills}
+        loop_ms = _p50_ms(lambda: [analyze_skill_match(resume, skills) for skills in roles.values()], 3)
+        print(f"{count:>8} {build_ms:>10.1f} {index_ms:>10.3f} {top_ms:>10.3f} {loop_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Role name lookups in the indexed RoleStore at 10k and 100k roles: bulk JSONL import,
+exact lookups, suggestions for misspelled names and prefix searches. A "fuzzy hit" is a
+misspelling whose top suggestion is the intended role; the synthetic names differ only
+by a serial number, so a miss is usually a neighbouring serial just as close to it.
+
+Run from the backend folder:  python -m benchmarks.bench_role_store
+"""
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from core import get_skill_taxonomy
+from role_store import RoleStore
+
+ROLE_COUNTS = [10000, 100000]
+REPEATS = 300
+SENIORITY = ["Junior", "Senior", "Lead", "Principal", "Staff", "Associate", ""]
+AREAS = ["Backend", "Frontend", "Data", "Cloud", "Platform", "Security", "Mobile", "Machine Learning", "QA", "Embedded"]
+TITLES = ["Engineer", "Developer", "Scientist", "Analyst", "Architect", "Administrator", "Consultant", "Manager"]
+
+
+def _role_names(count: int, rng: random.Random) -> list:
+    names = []
+    for i in range(count):
+        parts = [rng.choice(SENIORITY), rng.choice(AREAS), rng.choice(TITLES), f"{i:06d}"]
+        names.append(" ".join(part for part in parts if part))
+    return names
+
+
+def _write_jsonl(path: str, names: list, rng: random.Random):
+    skills = get_skill_taxonomy().ids()
+    with open(path, "w", encoding="utf-8") as handle:
+        for name in names:
+            role_skills = rng.sample(skills, 8)
+            handle.write(json.dumps({
+                "name": name,
+                "description": f"We are hiring a {name} with {', '.join(role_skills)}.",
+                "skills": role_skills,
+                "keywords": [skill for skill in role_skills if " " not in skill],
+            }) + "\n")
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    letters = list(name.lower())
+    position = rng.randrange(len(letters) - 1)
+    letters[position], letters[position + 1] = letters[position + 1], letters[position]
+    return "".join(letters)
+
+
+def _percentiles_ms(fn, queries: list) -> tuple:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+
+def main():
+    rng = random.Random(11)
+    print(f"{'roles':>8} {'import s':>9} {'exact p50/p99 ms':>18} {'fuzzy p50/p99 ms':>18} {'prefix p50/p99 ms':>18} {'fuzzy hit':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in ROLE_COUNTS:
+            names = _role_names(count, rng)
+            jsonl = os.path.join(tmp, f"roles-{count}.jsonl")
+            _write_jsonl(jsonl, names, rng)
+
+            store = RoleStore(os.path.join(tmp, f"roles-{count}.sqlite3"))
+            start = time.perf_counter()
+            store.import_jsonl(jsonl)
+            import_s = time.perf_counter() - start
+
+            sample = rng.sample(names, REPEATS)
+            typos = [_typo(name, rng) for name in sample]
+            prefixes = [name[:rng.randint(3, 12)] for name in sample]
+            exact = _percentiles_ms(lambda name: store.get(name.upper()), sample)
+            fuzzy = _percentiles_ms(store.search, typos)
+            prefix = _percentiles_ms(store.search, prefixes)
+            hits = sum(1 for typo, name in zip(typos, sample) if [role["name"] for role in store.search(typo, 1)] == [name])
+            store.close()
+
+            print(f"{count:>8} {import_s:>9.2f} {exact[0]:>8.3f}/{exact[1]:<9.3f} {fuzzy[0]:>8.3f}/{fuzzy[1]:<9.3f} "
+                  f"{prefix[0]:>8.3f}/{prefix[1]:<9.3f} {hits / REPEATS:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+analyze_skill_match latency, exact vs semantic mode, as resumes and job descriptions
+grow. Word vectors are random 300-d stand-ins (the shape of en_core_web_md), so only
+the timings are meaningful, not which skills pair up.
+
+Run from the backend folder:  python -m benchmarks.bench_semantic_match
+"""
+import random
+import statistics
+import time
+
+import numpy as np
+
+import core
+from semantic_match import SkillVectors
+
+DIM = 300
+# (resume skills, job skills); about a third of each side is outside the taxonomy
+SKILL_COUNTS = [(10, 5), (30, 15), (80, 40)]
+REPEATS = 500
+
+
+def _p50_ms(fn) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    rng = random.Random(9)
+    np_rng = np.random.default_rng(9)
+    table = {}
+
+    def lookup(word: str):
+        if word not in table:
+            table[word] = np_rng.normal(size=DIM).astype(np.float32)
+        return table[word]
+
+    taxonomy = core.get_skill_taxonomy()
+    ids = taxonomy.ids()
+    start = time.perf_counter()
+    vectors = SkillVectors(lookup, DIM, {skill_id: taxonomy.name(skill_id) for skill_id in ids})
+    build_ms = (time.perf_counter() - start) * 1000
+    core.get_skill_vectors = lambda: vectors
+    print(f"skill matrix: {vectors.matrix.shape[0]} x {DIM}, built in {build_ms:.1f} ms")
+
+    print(f"{'resume':>7} {'job':>5} {'exact ms':>9} {'semantic ms':>12} {'overhead ms':>12}")
+    for resume_count, job_count in SKILL_COUNTS:
+        extra = [f"custom skill {i}" for i in range(max(resume_count, job_count))]
+        resume = {"skills": rng.sample(ids, min(len(ids), resume_count * 2 // 3)) + extra[:resume_count // 3]}
+        job_skills = [taxonomy.name(skill_id) for skill_id in rng.sample(ids, min(len(ids), job_count * 2 // 3))]
+        job_skills += [skill.title() for skill in extra[-(job_count // 3):]]
+        core.analyze_skill_match(resume, job_skills, semantic=True)  # warm the per-text vector cache
+
+        exact = _p50_ms(lambda: core.analyze_skill_match(resume, job_skills, semantic=False))
+        semantic = _p50_ms(lambda: core.analyze_skill_match(resume, job_skills, semantic=True))
+        print(f"{resume_count:>7} {job_count:>5} {exact:>9.3f} {semantic:>12.3f} {semantic - exact:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
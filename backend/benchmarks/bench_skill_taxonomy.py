@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Skill taxonomy sizes from the built-in file up to 100k canonical skills (two aliases
+each): compile time, compiled trie size against the same forms held in a Python dict,
+resume scan time (SkillTaxonomy.find) against the old one-regex-per-skill loop, and
+canonical() lookups.
+
+Run from the backend folder:  python -m benchmarks.bench_skill_taxonomy
+"""
+import json
+import os
+import random
+import re
+import string
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import SAMPLE_RESUME_TEXT
+from core import SKILL_TAXONOMY_PATH
+from skill_taxonomy import SkillTaxonomy, normalize_form
+
+TAXONOMY_SIZES = [None, 10000, 50000, 100000]
+# One regex search per form takes seconds per resume past this size
+LEGACY_MAX_SIZE = 10000
+REPEATS = 20
+LOOKUPS = 10000
+
+
+def _entries(size: int, rng: random.Random) -> list:
+    with open(SKILL_TAXONOMY_PATH, encoding="utf-8") as handle:
+        entries = [json.loads(line) for line in handle if line.strip()]
+    while size is not None and len(entries) < size:
+        name = " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 3)))
+        aliases = [name.replace(" ", "-"), "".join(word[0] for word in name.split()) + str(len(entries))]
+        entries.append({"id": name, "name": name.title(), "aliases": aliases})
+    return entries
+
+
+def _file_kb(path: str) -> float:
+    return (os.path.getsize(path) + os.path.getsize(path.replace(".marisa", ".forms.marisa"))) / 1024
+
+
+def _dict_bytes(forms: dict) -> int:
+    return sys.getsizeof(forms) + sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in forms.items())
+
+
+# The matching loop core.py used before the taxonomy: one regex search per skill form
+def _legacy_match(forms, text_norm: str) -> set:
+    found = set()
+    for form in forms:
+        if re.search(r"\b" + re.escape(form) + r"\b", text_norm, flags=re.IGNORECASE):
+            found.add(form)
+    return found
+
+
+def _ms_per_call(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    rng = random.Random(5)
+    text_norm = re.sub(r"\s+", " ", SAMPLE_RESUME_TEXT)
+    print(f"{'skills':>8} {'forms':>8} {'compile ms':>11} {'trie KB':>9} {'dict KB':>9} "
+          f"{'scan ms':>9} {'legacy ms':>10} {'lookup us':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in TAXONOMY_SIZES:
+            entries = _entries(size, rng)
+            start = time.perf_counter()
+            compiled = SkillTaxonomy.from_entries(entries)
+            compile_ms = (time.perf_counter() - start) * 1000
+
+            # Workers memory-map the compiled file, so its pages are shared between processes
+            path = os.path.join(tmp, f"skills-{len(entries)}.marisa")
+            compiled.save(path)
+            taxonomy = SkillTaxonomy.load(path)
+            forms = {normalize_form(form): entry["id"] for entry in entries
+                     for form in [entry["id"], entry["name"]] + entry["aliases"]}
+
+            scan_ms = _ms_per_call(lambda: taxonomy.find(text_norm), REPEATS)
+            # re caches only a few hundred patterns, so large vocabularies recompile every call
+            legacy_ms = float("nan")
+            if len(entries) <= LEGACY_MAX_SIZE:
+                legacy_ms = _ms_per_call(lambda: _legacy_match(forms, text_norm), 3)
+            # Resolve any surface form, upper-cased so the lookup has to normalize it
+            queries = [form.upper() for form in rng.choices(list(forms), k=LOOKUPS)]
+            start = time.perf_counter()
+            for query in queries:
+                taxonomy._canonical(query)
+            lookup_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+            print(f"{len(taxonomy):>8} {len(taxonomy.forms):>8} {compile_ms:>11.1f} {_file_kb(path):>9.0f} "
+                  f"{_dict_bytes(forms) / 1024:>9.0f} {scan_ms:>9.3f} {legacy_ms:>10.3f} {lookup_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
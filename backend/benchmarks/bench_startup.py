@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark: spawns the API in a fresh process and measures
+time-to-first-/health, time-to-/ready and time-to-first-analysis (LLM stubbed).
+
+Run from the backend folder:  python -m benchmarks.bench_startup
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.corpus import make_resume_pdf
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(port: int):
+    import uvicorn
+    from benchmarks.stubs import install_stub_llm
+    import main
+
+    install_stub_llm()
+    uvicorn.run(main.app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _wait_for(client, path: str, deadline: float) -> float:
+    while time.perf_counter() < deadline:
+        try:
+            if client.get(path).status_code == 200:
+                return time.perf_counter()
+        except httpx.TransportError:
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(path)
+
+
+def _measure(warm_up: bool, cpu_workers: int) -> dict:
+    port = _free_port()
+    env = dict(os.environ, WARM_UP_ON_STARTUP="1" if warm_up else "0", ANALYSIS_CPU_WORKERS=str(cpu_workers))
+    env.setdefault("GEMINI_API_KEY", "benchmark")
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-m", "benchmarks.bench_startup", "--serve", str(port)], env=env)
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=120) as client:
+            deadline = start + 120
+            health = _wait_for(client, "/health", deadline)
+            ready = _wait_for(client, "/ready", deadline) if warm_up else None
+            response = client.post(
+                "/analyze-resume",
+                files={"file": ("resume.pdf", make_resume_pdf(), "application/pdf")},
+                data={"job_role": "Software Developer"},
+            )
+            response.raise_for_status()
+            analysis = time.perf_counter()
+    finally:
+        proc.terminate()
+        proc.wait()
+    return {
+        "health_s": health - start,
+        "ready_s": (ready - start) if ready else None,
+        "first_analysis_s": analysis - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--cpu-workers", type=int, default=2)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve)
+        return
+
+    print(f"{'warm-up':>8} {'cpu workers':>12} {'first /health s':>16} {'/ready s':>9} {'first analysis s':>17}")
+    for warm_up in (False, True):
+        for cpu_workers in (0, args.cpu_workers):
+            r = _measure(warm_up, cpu_workers)
+            ready = f"{r['ready_s']:.2f}" if r["ready_s"] is not None else "-"
+            print(f"{str(warm_up):>8} {cpu_workers:>12} {r['health_s']:>16.2f} {ready:>9} {r['first_analysis_s']:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
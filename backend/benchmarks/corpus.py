@@ -0,0 +1,124 @@
+"""
+Synthetic resumes for the benchmarks.
+"""
+import fitz
+
+SAMPLE_RESUME_TEXT = """John Doe - Backend Engineer
+Email: john.doe@email.com | Phone: (555) 123-4567 | GitHub: github.com/johndoe | LinkedIn: linkedin.com/in/johndoe
+
+SUMMARY
+Backend engineer with 6 years of experience building REST API services in Python, Django and FastAPI.
+
+EXPERIENCE
+- Developed data pipelines with Apache Kafka, Apache Airflow and Spark on AWS
+- Managed Kubernetes clusters with Helm, Terraform and Ansible
+- Built React and TypeScript dashboards backed by PostgreSQL and Redis
+- Led a team of 4 engineers and implemented CI on Jenkins
+
+EDUCATION
+Bachelor's Degree in Computer Science
+
+SKILLS
+Python, Java, JavaScript, SQL, Linux, Git, Docker, GraphQL, RabbitMQ, Celery
+"""
+
+
+# Function to render plain text into a PDF, one page per chunk of lines
+def make_resume_pdf(text: str = SAMPLE_RESUME_TEXT, pages: int = 1) -> bytes:
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(50, 50, 550, 800), text, fontsize=10)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+FILLER_SENTENCES = [
+    "Worked closely with product and design to ship features every sprint.",
+    "Improved response times by 35% through profiling and caching.",
+    "Mentored 3 junior engineers and ran weekly code reviews.",
+    "Wrote technical documentation and onboarding guides for new hires.",
+    "Collaborated with stakeholders to define requirements and milestones.",
+    "Reduced infrastructure cost by 20% by right-sizing services.",
+]
+
+SECTION_HEADERS = ["SUMMARY", "EXPERIENCE", "PROJECTS", "EDUCATION", "CERTIFICATIONS", "SKILLS"]
+
+
+# Function to generate one synthetic resume: skill_density is the share of lines that mention skills
+def generate_resume_text(rng, skills: list, lines: int = 40, skill_density: float = 0.3) -> str:
+    out = [
+        f"Candidate {rng.randint(1000, 9999)} - Software Engineer",
+        f"Email: candidate{rng.randint(1, 10 ** 6)}@email.com | Phone: (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+    ]
+    per_section = max(1, lines // len(SECTION_HEADERS))
+    for i in range(lines):
+        if i % per_section == 0 and i // per_section < len(SECTION_HEADERS):
+            out += ["", SECTION_HEADERS[i // per_section]]
+        if rng.random() < skill_density:
+            used = ", ".join(rng.sample(skills, rng.randint(1, 4)))
+            out.append(f"- Developed and maintained services with {used} for {rng.randint(2, 9)} years")
+        else:
+            out.append(f"- {rng.choice(FILLER_SENTENCES)}")
+    return "\n".join(out) + "\n"
+
+
+# Function to generate one synthetic job description asking for skill_count skills
+def generate_job_description(rng, skills: list, skill_count: int = 8) -> str:
+    wanted = rng.sample(skills, min(skill_count, len(skills)))
+    return (
+        f"We are hiring an engineer (req {rng.randint(1, 10 ** 9)}) with experience in {', '.join(wanted[:-1])} and {wanted[-1]}. "
+        "Knowledge of API design, cloud deployments and SQL databases is expected, "
+        "along with proficiency in testing and an understanding of CI/CD."
+    )
+
+
+# Sentences real postings wrap around the requirements (company pitch, benefits, legal text)
+POSTING_BOILERPLATE = [
+    "Founded in 2009, we are a fast-growing company on a mission to make work better for everyone.",
+    "Our team is distributed across four continents and we value kindness, curiosity and ownership.",
+    "We offer competitive salary, equity, generous parental leave and a yearly learning budget.",
+    "Enjoy flexible working hours, a home office stipend and two company offsites per year.",
+    "We are an equal opportunity employer and value diversity at our company.",
+    "We do not discriminate on the basis of race, religion, color, national origin, gender, sexual orientation, age, marital status, veteran status, or disability status.",
+    "If you need an accommodation during the interview process, please let your recruiter know.",
+    "Please apply even if you do not meet every single requirement listed above.",
+]
+
+
+# Function to generate a job posting as pasted from a job board: indented lines around the requirements
+def generate_job_posting(rng, skills: list, skill_count: int = 8, boilerplate: int = 6) -> str:
+    intro = rng.sample(POSTING_BOILERPLATE[:4], 2)
+    outro = rng.sample(POSTING_BOILERPLATE, boilerplate)
+    lines = intro + [generate_job_description(rng, skills, skill_count)] + outro
+    return "\n".join("        " + line for line in lines) + "\n"
+
+
+# Function to build a corpus of resume PDFs of varying size and skill density, each with its own JD
+def generate_corpus(count: int, seed: int = 0, max_pages: int = 4, skill_densities=(0.1, 0.3, 0.6)) -> list:
+    """
+    Every sample gets a unique job description so per-JD caches do not hide the
+    extraction cost. Returns dicts with pdf bytes, page count, density and JD.
+    """
+    import random
+    from core import get_skill_taxonomy
+
+    rng = random.Random(seed)
+    skills = get_skill_taxonomy().ids()
+    corpus = []
+    for _ in range(count):
+        pages = rng.randint(1, max_pages)
+        density = rng.choice(skill_densities)
+        doc = fitz.open()
+        for _ in range(pages):
+            text = generate_resume_text(rng, skills, lines=40, skill_density=density)
+            doc.new_page().insert_textbox(fitz.Rect(50, 50, 550, 800), text, fontsize=9)
+        corpus.append({
+            "pdf": doc.tobytes(),
+            "pages": pages,
+            "skill_density": density,
+            "job_description": generate_job_description(rng, skills, rng.randint(4, 12)),
+        })
+        doc.close()
+    return corpus
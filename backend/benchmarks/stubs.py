@@ -0,0 +1,48 @@
+"""
+Offline stand-ins used by the benchmarks so they never call Gemini.
+"""
+import time
+
+
+class StubResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+STUB_RECOMMENDATIONS = (
+    "1. Add a personal project using Kubernetes and publish it on GitHub\n"
+    "2. Complete the AWS Cloud Practitioner certification on Coursera\n"
+    "3. Emphasize your Docker experience in your resume and quantify the impact\n"
+)
+
+
+class StubLLMModel:
+    """Mimics genai.GenerativeModel.generate_content with a fixed delay and canned text."""
+
+    def __init__(self, delay_s: float = 0.0, chunk_chars: int = 40):
+        self.delay_s = delay_s
+        self.chunk_chars = chunk_chars
+        self.calls = 0
+
+    def generate_content(self, prompt, stream: bool = False, **kwargs):
+        self.calls += 1
+        if stream:
+            return self._stream()
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        return StubResponse(STUB_RECOMMENDATIONS)
+
+    # Like Gemini's stream=True: the delay is spread over chunks that split lines mid-way
+    def _stream(self):
+        chunks = [STUB_RECOMMENDATIONS[i:i + self.chunk_chars] for i in range(0, len(STUB_RECOMMENDATIONS), self.chunk_chars)]
+        for chunk in chunks:
+            if self.delay_s:
+                time.sleep(self.delay_s / len(chunks))
+            yield StubResponse(chunk)
+
+
+def install_stub_llm(delay_s: float = 0.0) -> StubLLMModel:
+    import core
+    stub = StubLLMModel(delay_s)
+    core.get_llm_model = lambda: stub
+    return stub
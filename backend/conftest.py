@@ -0,0 +1,67 @@
+"""
+Shared fixtures: analysis stages run in this process, the LLM cache starts empty,
+Gemini is replaced by a stub, and requests go straight to the ASGI app.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from cache import LRUCache, TieredCache
+import core
+import executors
+import main
+from benchmarks.stubs import StubLLMModel
+
+
+@pytest.fixture(autouse=True)
+def empty_parse_cache():
+    # Tests upload the same bytes with different parse_resume stand-ins
+    core.PARSE_CACHE.clear()
+    yield
+    core.PARSE_CACHE.clear()
+
+
+@pytest.fixture
+def in_process(monkeypatch):
+    # CPU stages run on the I/O pool; the pools are rebuilt around the test
+    monkeypatch.setattr(executors, "CPU_WORKERS", 0)
+    executors.shutdown_pools()
+    yield
+    executors.shutdown_pools()
+
+
+@pytest.fixture
+def fresh_llm_cache(monkeypatch):
+    # Entries from other tests must not answer for the LLM
+    cache = TieredCache(LRUCache())
+    monkeypatch.setattr(core, "llm_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def llm_model(monkeypatch):
+    # Function to install a stand-in Gemini model (a StubLLMModel by default) and return it
+    def install(model=None):
+        model = model or StubLLMModel()
+        monkeypatch.setattr(core, "get_llm_model", lambda: model)
+        return model
+    return install
+
+
+@pytest.fixture
+def app_client(in_process, fresh_llm_cache):
+    # Function to open a client on the app, for tests that run their own event loop
+    transport = httpx.ASGITransport(app=main.app)
+    return lambda: httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.fixture
+def api(app_client):
+    # Function to send one request to the app from synchronous test code
+    def send(method: str, path: str, **kwargs) -> httpx.Response:
+        async def scenario():
+            async with app_client() as client:
+                return await client.request(method, path, **kwargs)
+        return asyncio.run(scenario())
+    return send
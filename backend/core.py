@@ -1,8 +1,10 @@
-import spacy
-import os, tempfile
+import io
+import os
+import hashlib
+import json
 from dotenv import load_dotenv 
-import google.generativeai as genai
 import re
+import time
 import fitz
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import ParagraphStyle
@@ -13,16 +15,28 @@ from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import Paragraph
 from reportlab.graphics.shapes import Drawing, Rect, String
 from datetime import datetime
+from skill_taxonomy import SkillTaxonomy
+from semantic_match import SkillVectors, spacy_word_vectors, semantic_matches
+from cache import LRUCache, SQLiteCache, TieredCache
+from nlp_pipeline import load_nlp, parse_entities, annotate_pos
+from lazy_resource import LazyResource
+from role_index import RoleIndex
+from role_store import RoleStore
+from pdf_extract import extract_pages_parallel
+import executors
+import ats_engine
+from metrics import LLM_CALLS, LLM_TOKENS, LLM_SECONDS
 
 load_dotenv()
 
 BASE_FONT_PATH = os.path.join(os.getcwd(), 'assets', 'fonts')
 
 # Register essential fonts
-pdfmetrics.registerFont(TTFont('Roboto-Regular', os.path.join(BASE_FONT_PATH, 'Roboto-Regular.ttf')))
-pdfmetrics.registerFont(TTFont('Roboto-Bold', os.path.join(BASE_FONT_PATH, 'Roboto-Bold.ttf')))
-pdfmetrics.registerFont(TTFont('Roboto-Italic', os.path.join(BASE_FONT_PATH, 'Roboto-Italic.ttf')))
-pdfmetrics.registerFont(TTFont('Roboto-BoldItalic', os.path.join(BASE_FONT_PATH, 'Roboto-BoldItalic.ttf')))
+def _register_fonts() -> list:
+    names = ['Roboto-Regular', 'Roboto-Bold', 'Roboto-Italic', 'Roboto-BoldItalic']
+    for name in names:
+        pdfmetrics.registerFont(TTFont(name, os.path.join(BASE_FONT_PATH, f'{name}.ttf')))
+    return names
 
 PDF_THEME = {
     "font_name": "Roboto",
@@ -44,15 +58,85 @@ CATEGORY_RULES = {
     "Skill": ["highlight", "resume", "experience", "skills"],
 }
 
-# Loading NLP English Model
-nlp = spacy.load("en_core_web_md")
+# Loading NLP English Model (NLP_TIER: "rule", "sm" or "md"; parser and lemmatizer are never loaded)
+NLP_TIER = os.getenv("NLP_TIER", "md")
 
 # Loading Gemini LLM
-gemini_api_key = os.getenv("GEMINI_API_KEY")
-if not gemini_api_key:
-    raise ValueError("GEMINI_API_KEY environment variable not set")
-genai.configure(api_key=gemini_api_key)
-model = genai.GenerativeModel("gemini-2.5-flash")
+def _load_llm_model():
+    gemini_api_key = os.getenv("GEMINI_API_KEY")
+    if not gemini_api_key:
+        raise ValueError("GEMINI_API_KEY environment variable not set")
+    import google.generativeai as genai
+    genai.configure(api_key=gemini_api_key)
+    return genai.GenerativeModel("gemini-2.5-flash")
+
+# Heavy resources are created on first use (or by warm_up) so importing core stays cheap
+# One skill taxonomy for resumes and job descriptions (a .jsonl file is compiled on load, a .marisa file is memory-mapped)
+SKILL_TAXONOMY_PATH = os.getenv("SKILL_TAXONOMY_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'skills.jsonl'))
+
+# SKILL_MATCH_MODE "semantic" also pairs missing job skills with resume skills whose word vectors
+# (from the NLP_TIER model, "md" ships them) have a cosine similarity of at least SEMANTIC_MATCH_THRESHOLD
+SKILL_MATCH_MODE = os.getenv("SKILL_MATCH_MODE", "exact")
+SEMANTIC_MATCH_THRESHOLD = float(os.getenv("SEMANTIC_MATCH_THRESHOLD", 0.7))
+
+# Function to embed every taxonomy skill once, by display name
+def _load_skill_vectors() -> SkillVectors:
+    taxonomy = get_skill_taxonomy()
+    lookup, dim = spacy_word_vectors(get_nlp())
+    return SkillVectors(lookup, dim, {skill_id: taxonomy.name(skill_id) for skill_id in taxonomy.ids()})
+
+RESOURCES = {
+    "nlp": LazyResource("nlp", lambda: load_nlp(NLP_TIER)),
+    "skills": LazyResource("skills", lambda: SkillTaxonomy.load(SKILL_TAXONOMY_PATH)),
+    "skill_vectors": LazyResource("skill_vectors", _load_skill_vectors),
+    "fonts": LazyResource("fonts", _register_fonts),
+    "llm": LazyResource("llm", _load_llm_model),
+    "roles": LazyResource("roles", lambda: _load_role_store()),
+}
+
+def get_nlp():
+    return RESOURCES["nlp"].get()
+
+def get_skill_taxonomy() -> SkillTaxonomy:
+    return RESOURCES["skills"].get()
+
+def get_skill_vectors() -> SkillVectors:
+    return RESOURCES["skill_vectors"].get()
+
+def get_llm_model():
+    return RESOURCES["llm"].get()
+
+def get_role_store() -> RoleStore:
+    return RESOURCES["roles"].get()
+
+def ensure_fonts():
+    return RESOURCES["fonts"].get()
+
+# Function to load resources ahead of the first request; failures are reported, not raised
+def warm_up(names=None) -> dict:
+    for name in names or RESOURCES:
+        try:
+            RESOURCES[name].get()
+        except Exception:
+            pass
+    return resource_status()
+
+def resource_status() -> dict:
+    return {name: resource.status() for name, resource in RESOURCES.items()}
+
+# LLM recommendation cache (memory LRU, plus a SQLite file when LLM_CACHE_PATH is set)
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", 24 * 60 * 60))
+llm_cache = TieredCache(
+    LRUCache(max_entries=int(os.getenv("LLM_CACHE_SIZE", 1024)), ttl_seconds=LLM_CACHE_TTL_SECONDS),
+    SQLiteCache(os.getenv("LLM_CACHE_PATH"), ttl_seconds=LLM_CACHE_TTL_SECONDS) if os.getenv("LLM_CACHE_PATH") else None,
+)
+
+# Gemini call limits: the request waits at most LLM_BUDGET_SECONDS before falling back to
+# template recommendations; the call itself may run on (warming the cache) up to LLM_TIMEOUT_SECONDS
+LLM_BUDGET_SECONDS = float(os.getenv("LLM_BUDGET_SECONDS", 8))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", 30))
+LLM_RETRIES = int(os.getenv("LLM_RETRIES", 1))
+LLM_RETRY_BACKOFF_SECONDS = 0.5
 
 # Temp DB
 job_descriptions_db = {
@@ -70,109 +154,222 @@ job_descriptions_db = {
     """,
 }
 
-TECH_SKILLS = {
-    "python", "django", "flask", "fastapi", "numpy", "pandas", "scipy",
-    "matplotlib", "seaborn", "plotly", "tensorflow", "pytorch", "scikit-learn",
-    "docker", "kubernetes", "aws", "azure", "gcp", "postgresql", "mysql",
-    "mongodb", "sql", "linux", "git", "github", "gitlab", "javascript",
-    "typescript", "react", "vue", "angular", "nodejs", "express", "java",
-    "spring", "c++", "c#", "php", "ruby", "rails", "swift", "objective-c",
-    "go", "rust", "graphql", "rest api", "soap", "redis", "elasticsearch",
-    "apache kafka", "rabbitmq", "celery", "jenkins", "circleci", "travisci",
-    "terraform", "ansible", "helm", "prometheus", "grafana", "hadoop", "spark",
-    "apache airflow", "bigquery", "cloud functions", "lambda", "docker-compose"
-}
+# Indexed role store; point ROLE_STORE_PATH at a file built with `python role_store.py roles.jsonl roles.sqlite3`
+ROLE_STORE_PATH = os.getenv("ROLE_STORE_PATH")
+
+# Function to list the built-in roles for seeding a store; their skills come from precompute_role_skills
+def builtin_roles() -> list:
+    return [{"name": name, "description": text} for name, text in job_descriptions_db.items()]
+
+# Function to open the role store: a built file read-only (seeded when it was built), or memory seeded with the built-ins
+def _load_role_store() -> RoleStore:
+    if ROLE_STORE_PATH:
+        if not os.path.exists(ROLE_STORE_PATH):
+            raise FileNotFoundError(f"{ROLE_STORE_PATH} not found; build it with `python role_store.py roles.jsonl {ROLE_STORE_PATH}`")
+        return RoleStore(ROLE_STORE_PATH, read_only=True)
+    store = RoleStore()
+    store.add_roles(builtin_roles())
+    return store
+
+
+# Function to get a stored role by name, tolerating case, punctuation and small typos
+def get_role(job_role: str) -> dict:
+    """
+    Returns {"name", "description", "skills", "keywords"} or None; skills/keywords are None unless precomputed.
+    Names match ignoring case and punctuation only: a near miss is not another role (see suggest_roles).
+    """
+    return get_role_store().get(job_role)
+
+# Function to suggest stored role names close to one that does not exist
+def suggest_roles(job_role: str, limit: int = 5) -> list:
+    return [role["name"] for role in get_role_store().search(job_role, limit)]
 
 # Function to get the Job Description from DB
 def get_description_from_db(job_role: str) -> str:
-    return job_descriptions_db.get(job_role, "No description available for this role.")
+    role = get_role(job_role)
+    return role["description"] if role else "No description available for this role."
+
+# Upload limits (checked while streaming, before any PDF work happens)
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", 10 * 1024 * 1024))
+MAX_PDF_PAGES = int(os.getenv("MAX_PDF_PAGES", 50))
+PDF_EXTRACTION_BUDGET_S = float(os.getenv("PDF_EXTRACTION_BUDGET_S", 10))
+# Documents with at least this many pages are split across the page pool. benchmarks/bench_pdf_pages.py
+# puts the crossover at 10-14 pages with 4 idle page workers (8-9 with 2); 16 leaves a margin for busy cores
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", 16))
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+class ResumeParseError(ValueError):
+    """The upload could not be turned into resume text."""
+
+class ResumeTooLargeError(ResumeParseError):
+    """The upload exceeds the byte, page or extraction time limits."""
+
+class UnknownRoleError(LookupError):
+    """No stored role has the requested name; suggestions lists the closest ones."""
+
+    def __init__(self, job_role: str, suggestions: list):
+        super().__init__(f"Unknown job role '{job_role}'. Pick a known role or send a job_description.")
+        self.suggestions = suggestions
+
+# Function to read a binary stream in chunks, rejecting it as soon as it passes the byte cap
+def read_upload_stream(stream, max_bytes: int = None) -> bytes:
+    max_bytes = MAX_UPLOAD_BYTES if max_bytes is None else max_bytes
+    chunks = []
+    total = 0
+    while True:
+        chunk = stream.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_bytes:
+            raise ResumeTooLargeError(f"Resume exceeds the {max_bytes // 1024} KB upload limit.")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+# Function to extract the text of a PDF within the page cap and time budget
+def _extract_pdf_text(doc, raw_bytes: bytes, max_pages: int, budget_s: float) -> str:
+    if doc.page_count > max_pages:
+        raise ResumeTooLargeError(f"Resume has {doc.page_count} pages, the limit is {max_pages}.")
+    if executors.PAGE_WORKERS > 1 and doc.page_count >= PDF_PARALLEL_MIN_PAGES:
+        try:
+            pages = extract_pages_parallel(raw_bytes, doc.page_count, executors.get_page_pool(),
+                                           executors.PAGE_WORKERS, budget_s)
+        except TimeoutError:
+            raise ResumeTooLargeError(f"Resume text extraction took longer than {budget_s:g} seconds.")
+        return "".join(page + "\n" for page in pages)
+
+    deadline = time.monotonic() + budget_s
+    pages = []
+    for page in doc:
+        pages.append(page.get_text("text"))
+        pages.append("\n")
+        if time.monotonic() > deadline:
+            raise ResumeTooLargeError(f"Resume text extraction took longer than {budget_s:g} seconds.")
+    return "".join(pages)
+
+# Function to accept plain-text uploads, but never decode arbitrary binary as text
+def _decode_plain_text(raw_bytes: bytes) -> str:
+    if raw_bytes.startswith(b"%PDF") or b"\x00" in raw_bytes[:4096]:
+        raise ResumeParseError("Resume could not be read as a PDF.")
+    try:
+        return raw_bytes.decode("utf-8")
+    except UnicodeDecodeError:
+        raise ResumeParseError("Resume is neither a readable PDF nor UTF-8 text.")
 
 # Function to parse resume
 def parse_resume(file) -> dict:
     """
-    Accepts an UploadFile-like object (has .file) or a simple file path (for local tests).
-    Returns {"text": full_text, "skills": [...]} with skills lowercased from TECH_SKILLS.
+    Accepts an UploadFile-like object (has .file), raw bytes or a file path (for local tests).
+    Returns {"text": full_text, "skills": [...]} with the canonical ids of the skills found.
+    Raises ResumeTooLargeError / ResumeParseError for uploads over the limits or unreadable ones.
     """
     # read bytes (supports FastAPI UploadFile or a path string)
-    raw_bytes = None
     if hasattr(file, "file"):
         # Uploaded file from FastAPI
-        raw_bytes = file.file.read()
+        raw_bytes = read_upload_stream(file.file)
     elif isinstance(file, (bytes, bytearray)):
-        raw_bytes = file
+        if len(file) > MAX_UPLOAD_BYTES:
+            raise ResumeTooLargeError(f"Resume exceeds the {MAX_UPLOAD_BYTES // 1024} KB upload limit.")
+        raw_bytes = bytes(file)
     else:
         # assume file is a path
         with open(file, "rb") as fh:
-            raw_bytes = fh.read()
+            raw_bytes = read_upload_stream(fh)
 
-    text = ""
     try:
-        with fitz.open(stream=raw_bytes, filetype="pdf") as doc:
-            for page in doc:
-                text += page.get_text("text") + "\n"
+        doc = fitz.open(stream=raw_bytes, filetype="pdf")
     except Exception:
-        # fallback: try decode bytes
-        try:
-            text = raw_bytes.decode(errors="ignore")
-        except Exception:
-            text = ""
+        # fallback: plain-text resumes
+        text = _decode_plain_text(raw_bytes)
+    else:
+        with doc:
+            text = _extract_pdf_text(doc, raw_bytes, MAX_PDF_PAGES, PDF_EXTRACTION_BUDGET_S)
 
     # normalize whitespace
     text_norm = re.sub(r"\s+", " ", text)
 
-    found = set()
-    for skill in TECH_SKILLS:
-        # word boundary match, case-insensitive
-        if re.search(r"\b" + re.escape(skill) + r"\b", text_norm, flags=re.IGNORECASE):
-            found.add(skill)  # store lowercase canonical
+    # word boundary match, case-insensitive, aliases resolved to canonical ids
+    found = get_skill_taxonomy().find(text_norm)
 
     return {
         "text": text,
         "skills": sorted(list(found))
     }
 
+# Parsed resumes by SHA-256 of the upload bytes, so re-uploading the same file for another role
+# skips PDF extraction and skill matching; bounded by entries, approximate bytes and age
+PARSE_CACHE_MAX_BYTES = int(os.getenv("PARSE_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+PARSE_CACHE_TTL_SECONDS = float(os.getenv("PARSE_CACHE_TTL_SECONDS", 60 * 60))
+
+def _parsed_resume_size(resume_data: dict) -> int:
+    return len(resume_data["text"]) + sum(len(skill) for skill in resume_data["skills"])
+
+PARSE_CACHE = LRUCache(max_entries=int(os.getenv("PARSE_CACHE_SIZE", 4096)), ttl_seconds=PARSE_CACHE_TTL_SECONDS,
+                       max_bytes=PARSE_CACHE_MAX_BYTES, sizeof=_parsed_resume_size)
+
+COMMON_STOPWORDS = {"software", "developer", "experience", "databases", "pipelines", "knowledge", "service", "engineer"}
+
+# Skills of the built-in roles keyed by description hash (filled by precompute_role_skills, never evicted)
+ROLE_SKILLS = {}
+
+# Memo for free-text job descriptions, keyed by content hash
+JD_SKILLS_CACHE = LRUCache(max_entries=int(os.getenv("JD_SKILLS_CACHE_SIZE", 2048)))
+
+# Function to hash a text for content-addressed caches
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
 # Function to apply NLP on Job Description 
-def extract_job_skills(job_description: str) -> list:
-    doc = nlp(job_description)
-    skills = set()
-    COMMON_STOPWORDS = {"software", "developer", "experience", "databases", "pipelines", "knowledge", "service", "engineer"}
-    TECH_SKILLS_DICT = {
-    "python", "django", "flask", "fastapi", "numpy", "pandas", "scipy",
-    "matplotlib", "seaborn", "tensorflow", "keras", "pytorch",
-    "jenkins", "docker", "kubernetes", "ansible", "terraform",
-    "aws", "azure", "google cloud", "gcp", "oracle cloud",
-    "postgresql", "mysql", "mongodb", "sqlite", "redis",
-    "graphql", "rest api", "soap api",
-    "git", "github", "gitlab", "bitbucket",
-    "celery", "rabbitmq",
-    "elasticsearch", "logstash", "kibana",
-    "apache", "nginx",
-    "linux", "ubuntu", "centos",
-    "microservices", "ci/cd", "tdd", "bdd",
-    "oauth", "jwt", "ssl",
-    "object-oriented programming", "oop",
-    "multithreading", "asyncio",
-    "react", "angular", "vue.js",
-    "typescript", "javascript", "java", "c++", "c#", "php", "ruby", "go"
-        }
-
-    for token in doc:
-        token_lower = token.text.lower()
-        if token_lower in TECH_SKILLS_DICT:
-            skills.add(token.text)
-
-    for ent in doc.ents:
-        if ent.label_ in ["ORG", "PRODUCT", "WORK_OF_ART", "TECHNOLOGY"]:  
-            skills.add(ent.text)
-
-    # Fallback: Extract all proper nouns (PROPN) and nouns (NOUN)
+def _extract_job_skills_uncached(job_description: str) -> list:
+    nlp = get_nlp()
+    docs = parse_entities(nlp, job_description)
+    taxonomy = get_skill_taxonomy()
+    # Taxonomy skills under their display names, aliases included ("k8s" -> "Kubernetes");
+    # forms that are also plain words only count as their skill's spelling ("Go", not "go")
+    skills = {taxonomy.name(skill_id) for skill_id in taxonomy.find(job_description, job=True)}
+
+    for doc in docs:
+        for ent in doc.ents:
+            if ent.label_ in ["ORG", "PRODUCT", "WORK_OF_ART", "TECHNOLOGY"]:  
+                skill_id = taxonomy.canonical(ent.text)
+                if not skill_id:
+                    skills.add(ent.text)
+                elif taxonomy.allows(ent.text):
+                    skills.add(taxonomy.name(skill_id))
+
+    # Fallback: Extract all proper nouns (PROPN) and nouns (NOUN), tagging only now that it is needed
     if not skills:
-        skills = [token.text for token in doc if token.pos_ in ("PROPN", "NOUN")]
-        skills.update(skills)
+        for doc in annotate_pos(nlp, docs):
+            skills.update(token.text for token in doc if token.pos_ in ("PROPN", "NOUN"))
 
     skills = [skill for skill in skills if skill.lower() not in COMMON_STOPWORDS]
     return list(set(skills))
 
+# Function to get the skills of a Job Description (dict lookup for known roles, memoized otherwise)
+def extract_job_skills(job_description: str) -> list:
+    key = _text_digest(job_description)
+    skills = ROLE_SKILLS.get(key)
+    if skills is None:
+        skills = JD_SKILLS_CACHE.get(key)
+    if skills is None:
+        skills = _extract_job_skills_uncached(job_description)
+        JD_SKILLS_CACHE.set(key, skills)
+    return list(skills)
+
+# Function to precompute the skills of every built-in role (called once per worker at startup)
+def precompute_role_skills() -> dict:
+    role_skills = {}
+    for job_role, job_description in job_descriptions_db.items():
+        key = _text_digest(job_description)
+        if key not in ROLE_SKILLS:
+            ROLE_SKILLS[key] = _extract_job_skills_uncached(job_description)
+        role_skills[job_role] = list(ROLE_SKILLS[key])
+    return role_skills
+
+# Function to build the all-roles ranking index from {role: required skills}
+def build_role_index(role_skills: dict) -> RoleIndex:
+    return RoleIndex(role_skills, normalize=skill_key, display=skill_name)
+
 # Function to calculate time saved estimate
 def calculate_estimated_time_saved(match_info: dict) -> int:
     estimated_time_per_skill_min = 5  
@@ -185,82 +382,48 @@ def _normalize_skill(s: str) -> str:
     s = re.sub(r"[^\w+#.+-]", "", s)
     return s
 
+# Function to get the comparison key of a skill: its canonical taxonomy id, or the normalized text for unknown skills
+def skill_key(s: str) -> str:
+    return get_skill_taxonomy().canonical(s) or _normalize_skill(s)
+
+# Function to get the display name of a skill: the taxonomy name ("k8s" -> "Kubernetes"), or the text for unknown skills
+def skill_name(s: str) -> str:
+    taxonomy = get_skill_taxonomy()
+    skill_id = taxonomy.canonical(s)
+    return taxonomy.name(skill_id) if skill_id else s
+
+
+# Function to extract the ATS keywords of a job description (reusable across many resumes)
+def extract_ats_keywords(job_description: str) -> list:
+    return ats_engine.extract_ats_keywords(job_description)
 
 # Function to calculate ATS compatibility score (independent of skill matching)
-def calculate_ats_score(resume_data: dict, job_description: str) -> dict:
+def calculate_ats_score(resume_data: dict, job_description: str, job_keywords: list = None) -> dict:
     """
     Calculate ATS compatibility score based on resume structure and formatting:
     - Resume structure and section completeness
     - ATS-friendly formatting
     - Keyword density from job description
     - Contact information completeness
-    - File format and readability
+    The rule tables and weights live in ats_engine.
     """
     resume_text = resume_data.get("text", "").lower()
-    job_description_lower = job_description.lower()
-    
-    # 1. Resume Structure Score (35% weight)
-    structure_score = 0
-    essential_sections = ["experience", "education", "skills", "summary", "objective", "contact", "phone", "email"]
-    for section in essential_sections:
-        if section in resume_text:
-            structure_score += 12.5  # 100/8 sections = 12.5 each
-    
-    # 2. ATS-Friendly Formatting Score (25% weight)
-    formatting_score = 0
-    
-    # Check for ATS-friendly elements
-    if "•" in resume_text or "-" in resume_text:  # Bullet points
-        formatting_score += 20
-    if any(word in resume_text for word in ["years", "experience", "worked"]):  # Action words
-        formatting_score += 20
-    if any(word in resume_text for word in ["bachelor", "master", "degree", "certification"]):  # Education keywords
-        formatting_score += 20
-    if any(word in resume_text for word in ["developed", "managed", "led", "created", "implemented"]):  # Action verbs
-        formatting_score += 20
-    if any(char.isdigit() for char in resume_text):  # Quantified achievements
-        formatting_score += 20
-    
-    # 3. Job Description Keyword Density (25% weight)
-    # Extract keywords from job description
-    job_keywords = []
-    important_words = ["experience", "skills", "knowledge", "proficiency", "expertise", "familiarity", "understanding"]
-    for word in important_words:
-        if word in job_description_lower:
-            job_keywords.append(word)
-    
-    # Add technical terms from job description
-    tech_terms = ["python", "javascript", "react", "angular", "vue", "node", "sql", "database", "api", "cloud", "aws", "azure", "docker", "kubernetes"]
-    for term in tech_terms:
-        if term in job_description_lower:
-            job_keywords.append(term)
-    
-    keyword_matches = sum(1 for keyword in job_keywords if keyword in resume_text)
-    keyword_density_score = min(100, (keyword_matches / len(job_keywords)) * 100) if job_keywords else 50
-    
-    # 4. Contact Information Completeness (15% weight)
-    contact_score = 0
-    contact_elements = ["email", "phone", "linkedin", "github", "portfolio", "website"]
-    for element in contact_elements:
-        if element in resume_text:
-            contact_score += 16.67  # 100/6 elements = 16.67 each
-    
-    # Calculate weighted ATS score
-    ats_score = (
-        structure_score * 0.35 +
-        formatting_score * 0.25 +
-        keyword_density_score * 0.25 +
-        contact_score * 0.15
-    )
-    
+
+    # Extract keywords from job description (callers scoring many resumes pass them in)
+    if job_keywords is None:
+        job_keywords = extract_ats_keywords(job_description)
+
+    scores = ats_engine.score_ats(resume_text, job_keywords)
+    ats_score = scores["overall"]
+
     return {
         "overall_ats_score": round(ats_score, 1),
-        "structure_score": round(structure_score, 1),
-        "formatting_score": round(formatting_score, 1),
-        "keyword_density_score": round(keyword_density_score, 1),
-        "contact_score": round(contact_score, 1),
+        "structure_score": round(scores["structure"], 1),
+        "formatting_score": round(scores["formatting"], 1),
+        "keyword_density_score": round(scores["keyword_density"], 1),
+        "contact_score": round(scores["contact"], 1),
         "ats_grade": get_ats_grade(ats_score),
-        "ats_recommendations": generate_ats_recommendations(ats_score, structure_score, formatting_score, keyword_density_score, contact_score)
+        "ats_recommendations": generate_ats_recommendations(ats_score, scores["structure"], scores["formatting"], scores["keyword_density"], scores["contact"])
     }
 
 def get_ats_grade(score: float) -> str:
@@ -318,12 +481,20 @@ def generate_ats_recommendations(overall_score: float, structure_score: float, f
     return recommendations
 
 # Function to analyze skill match
-def analyze_skill_match(resume_data: dict, job_skills: list) -> dict:
+def analyze_skill_match(resume_data: dict, job_skills: list, semantic: bool = None) -> dict:
+    """
+    Skills match when they resolve to the same skill_key. In semantic mode (SKILL_MATCH_MODE
+    by default) a missing job skill also matches the most similar leftover resume skill at
+    or above SEMANTIC_MATCH_THRESHOLD; those pairs are listed in "semantic_matches".
+    Matched and missing skills are both listed by skill_name.
+    """
     resume_skills = resume_data.get("skills") or []
     job_skills = job_skills or []
+    if semantic is None:
+        semantic = SKILL_MATCH_MODE == "semantic"
 
-    resume_map = { _normalize_skill(s): s for s in resume_skills }
-    job_map = { _normalize_skill(s): s for s in job_skills }
+    resume_map = { skill_key(s): s for s in resume_skills }
+    job_map = { skill_key(s): s for s in job_skills }
 
     matched_norm = set(resume_map.keys()) & set(job_map.keys())
     matched = [resume_map[n] for n in matched_norm]
@@ -331,46 +502,236 @@ def analyze_skill_match(resume_data: dict, job_skills: list) -> dict:
     missing_norm = set(job_map.keys()) - matched_norm
     missing = [job_map[n] for n in missing_norm]
 
+    similar = []
+    if semantic and missing_norm:
+        unmatched = {n: resume_map[n] for n in resume_map if n not in matched_norm}
+        similar = semantic_matches(get_skill_vectors(), {n: job_map[n] for n in missing_norm}, unmatched,
+                                   SEMANTIC_MATCH_THRESHOLD)
+        covered = {match["job_skill"] for match in similar}
+        missing = [skill for skill in missing if skill not in covered]
+        matched += list(dict.fromkeys(match["resume_skill"] for match in similar))
+
     match_percentage = 0.0
     if len(job_map) > 0:
-        match_percentage = round(len(matched) / len(job_map) * 100, 2)
+        match_percentage = round((len(matched_norm) + len(similar)) / len(job_map) * 100, 2)
 
-    return {
-        "matched_skills": matched,
-        "missing_skills": missing,
+    result = {
+        "matched_skills": [skill_name(s) for s in matched],
+        "missing_skills": [skill_name(s) for s in missing],
         "match_percentage": match_percentage
     }
+    if semantic:
+        result["semantic_matches"] = similar
+    return result
+
+# Function to build the cache key for LLM recommendations
+def _recommendation_cache_key(resume_data: dict, job_description: str, match_info: dict) -> str:
+    """
+    Hash of everything the prompt depends on, normalized so that whitespace,
+    casing and skill ordering differences map to the same key.
+    """
+    def canonical_skills(skills):
+        return sorted({skill_key(s) for s in skills or []})
+
+    payload = {
+        "job_description": " ".join(job_description.split()).lower(),
+        "resume_skills": canonical_skills(resume_data.get("skills")),
+        "matched_skills": canonical_skills(match_info.get("matched_skills")),
+        "missing_skills": canonical_skills(match_info.get("missing_skills")),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+# Static part of the recommendation prompt, kept as a constant prefix
+RECOMMENDATION_INSTRUCTIONS = (
+    "Generate three practical and market-relevant recommendations to improve the user’s resume and skillset. "
+    "Focus on bridging missing skills with real-world actions that can be completed within one to three months. "
+    "Each recommendation should be personalized, realistic, and actionable, including projects, certifications, "
+    "or ways to highlight experience. Format the recommendations clearly, with each on a separate line, avoiding "
+    "symbols, extra spaces, or numbering. Use natural, human-friendly language that feels tailored to the individual.\n"
+    "Example style of output:\n"
+    "1. Add a personal project using [technology] and publish it on GitHub\n"
+    "2. Complete the [course or certification name] from platforms like Coursera, Udemy, or LinkedIn Learning\n"
+    "3. Emphasize [specific experience or skill] in your resume and quantify the impact wherever possible\n"
+)
+
+# Prompt budget: characters of job description and resume skills beyond the matched/missing ones
+PROMPT_JD_MAX_CHARS = int(os.getenv("PROMPT_JD_MAX_CHARS", 600))
+PROMPT_MAX_OTHER_SKILLS = int(os.getenv("PROMPT_MAX_OTHER_SKILLS", 20))
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+")
+
+# Function to drop skills that resolve to the same skill_key, keeping the first spelling
+def dedupe_skills(skills) -> list:
+    seen = set()
+    unique = []
+    for skill in skills or []:
+        key = skill_key(skill)
+        if key not in seen:
+            seen.add(key)
+            unique.append(skill)
+    return unique
+
+# Function to shrink a job description to the sentences a recommendation depends on
+def compact_job_description(job_description: str, skills=(), max_chars: int = None) -> str:
+    """
+    Whitespace is collapsed, then the first sentence (usually the role) is kept along with
+    every sentence that names one of skills or another taxonomy skill, or states a
+    requirement (ats_engine.JD_IMPORTANT_WORDS). Repeated sentences are dropped and the
+    result is cut at a sentence boundary once it reaches max_chars.
+    """
+    max_chars = PROMPT_JD_MAX_CHARS if max_chars is None else max_chars
+    sentences = [sentence for sentence in _SENTENCE_END.split(" ".join(job_description.split())) if sentence]
+    taxonomy = get_skill_taxonomy()
+    wanted = {skill.lower() for skill in skills}
+
+    kept, seen = [], set()
+    for position, sentence in enumerate(sentences):
+        lower = sentence.lower()
+        relevant = (
+            position == 0
+            or taxonomy.find(sentence, job=True)
+            or any(skill in lower for skill in wanted)
+            or any(word in lower for word in ats_engine.JD_IMPORTANT_WORDS)
+        )
+        if relevant and lower not in seen:
+            seen.add(lower)
+            kept.append(sentence)
+
+    compacted = ""
+    for sentence in kept:
+        candidate = f"{compacted} {sentence}" if compacted else sentence
+        if len(candidate) > max_chars:
+            return compacted or sentence[:max_chars].rstrip() + "..."
+        compacted = candidate
+    return compacted
+
+# Function to estimate a token count when the API reports none (about four characters per token)
+def estimate_tokens(text: str) -> int:
+    return max(1, round(len(text) / 4)) if text else 0
+
+# Function to record the token counts and latency of a successful Gemini call
+def _record_llm_usage(prompt: str, text: str, usage, seconds: float, mode: str):
+    """usage is the response's usage_metadata; missing counts are estimated from the texts."""
+    input_tokens = getattr(usage, "prompt_token_count", None) or estimate_tokens(prompt)
+    output_tokens = getattr(usage, "candidates_token_count", None) or estimate_tokens(text)
+    LLM_TOKENS.observe(input_tokens, direction="input")
+    LLM_TOKENS.observe(output_tokens, direction="output")
+    LLM_SECONDS.observe(seconds, mode=mode)
+
+# Function to build the Gemini prompt for recommendations
+def _recommendation_prompt(resume_data: dict, job_description: str, match_info: dict) -> str:
+    """
+    RECOMMENDATION_INSTRUCTIONS first, byte for byte the same on every call so it is a
+    reusable prefix, then the compacted job description and deduplicated skill lists.
+    """
+    matched = dedupe_skills(match_info['matched_skills'])
+    missing = dedupe_skills(match_info['missing_skills'])
+    listed = {skill_key(skill) for skill in matched + missing}
+    other = [skill for skill in dedupe_skills(resume_data['skills']) if skill_key(skill) not in listed][:PROMPT_MAX_OTHER_SKILLS]
+    return (
+        f"{RECOMMENDATION_INSTRUCTIONS}\n"
+        f"Role: {compact_job_description(job_description, missing + matched)}\n"
+        f"Matched skills: {', '.join(matched) or 'none'}\n"
+        f"Missing skills: {', '.join(missing) or 'none'}\n"
+        f"Other resume skills: {', '.join(other) or 'none'}\n"
+    )
+
+# Function to call Gemini with the timeout and retry policy, returning the response
+def _call_llm(prompt: str, **kwargs):
+    for attempt in range(LLM_RETRIES + 1):
+        try:
+            response = get_llm_model().generate_content(prompt, request_options={"timeout": LLM_TIMEOUT_SECONDS}, **kwargs)
+            LLM_CALLS.inc(outcome="ok")
+            return response
+        except Exception:
+            LLM_CALLS.inc(outcome="error")
+            if attempt == LLM_RETRIES:
+                raise
+            time.sleep(LLM_RETRY_BACKOFF_SECONDS * 2 ** attempt)
 
 # Function to get personalised recommendations from LLM
 def generate_llm_recommendations(resume_data: dict, job_description: str, match_info: dict) -> str:
-    prompt = f"""
-    The user wants to apply for the following role:
-    {job_description}
-    
-    Current resume skills:
-    {', '.join(resume_data['skills'])}
-    
-    Matched skills:
-    {', '.join(match_info['matched_skills'])}
-    
-    Missing skills:
-    {', '.join(match_info['missing_skills'])}
-    
-    Generate three practical and market-relevant recommendations to improve the user’s resume and skillset. Focus on bridging missing skills with real-world actions that can be completed within one to three months. Each recommendation should be personalized, realistic, and actionable, including projects, certifications, or ways to highlight experience. Format the recommendations clearly, with each on a separate line, avoiding symbols, extra spaces, or numbering. Use natural, human-friendly language that feels tailored to the individual.
+    cache_key = _recommendation_cache_key(resume_data, job_description, match_info)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    prompt = _recommendation_prompt(resume_data, job_description, match_info)
+    started = time.perf_counter()
+    response = _call_llm(prompt)
+    _record_llm_usage(prompt, response.text, getattr(response, "usage_metadata", None), time.perf_counter() - started, "blocking")
+    llm_cache.set(cache_key, response.text)
+    return response.text
 
-    Example style of output:
-    1. Add a personal project using [technology] and publish it on GitHub
-    2. Complete the [course or certification name] from platforms like Coursera, Udemy, or LinkedIn Learning
-    3. Emphasize [specific experience or skill] in your resume and quantify the impact wherever possible
+# Function to stream recommendation text from Gemini chunk by chunk (cached text comes as one chunk)
+def stream_llm_recommendations(resume_data: dict, job_description: str, match_info: dict):
     """
-    response = model.generate_content(prompt)
-    return response.text
+    Generator of text chunks. The full answer is cached once the stream is exhausted,
+    so a stream that is abandoned halfway never leaves a truncated cache entry.
+    """
+    cache_key = _recommendation_cache_key(resume_data, job_description, match_info)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    prompt = _recommendation_prompt(resume_data, job_description, match_info)
+    started = time.perf_counter()
+    response = _call_llm(prompt, stream=True)
+    parts = []
+    usage = None
+    for chunk in response:
+        # Gemini reports the usage on the last chunk
+        usage = getattr(chunk, "usage_metadata", None) or usage
+        text = chunk.text
+        if text:
+            parts.append(text)
+            yield text
+    full_text = "".join(parts)
+    _record_llm_usage(prompt, full_text, usage, time.perf_counter() - started, "stream")
+    llm_cache.set(cache_key, full_text)
+
+# Recommendation templates used when the LLM is slow or failing, one per CATEGORY_RULES
+# category; each contains one of that category's terms so the PDF report files it the same way
+FALLBACK_TEMPLATES = {
+    "Certification": "Complete an online course or certification in {skill} from platforms like Coursera, Udemy, or LinkedIn Learning",
+    "Project": "Add a personal project using {skill} and publish it on GitHub",
+    "Skill": "Highlight your experience with {skill} in your resume and quantify the impact wherever possible",
+}
+
+# Function to build recommendations locally from the skill gap, formatted like the LLM output
+def template_recommendations(match_info: dict) -> str:
+    missing = sorted(match_info.get("missing_skills") or [], key=str.lower)
+    matched = sorted(match_info.get("matched_skills") or [], key=str.lower)
+    lines = []
+    if missing:
+        lines.append(FALLBACK_TEMPLATES["Project"].format(skill=missing[0]))
+        lines.append(FALLBACK_TEMPLATES["Certification"].format(skill=missing[1] if len(missing) > 1 else missing[0]))
+    else:
+        lines.append(FALLBACK_TEMPLATES["Project"].format(skill=", ".join(matched[:2]) or "the role's core tools"))
+    lines.append(FALLBACK_TEMPLATES["Skill"].format(skill=", ".join(matched[:3]) or "the technologies you know best"))
+    return "\n".join(f"{i}. {line}" for i, line in enumerate(lines, start=1))
+
+# Function to strip bullets, markdown and numbering from one recommendation line
+def clean_recommendation_line(line: str) -> str:
+    line = re.sub(r'^[\*\-\`\s]*', '', line).strip()
+    return re.sub(r'^\d+\.\s*', '', line)
+
+# Function to turn streamed text chunks into cleaned recommendation lines as soon as each line is complete
+def iter_recommendation_lines(chunks):
+    pending = ""
+    for chunk in chunks:
+        pending += chunk.replace('\r\n', '\n').replace('\r', '\n')
+        *complete, pending = pending.split('\n')
+        for line in complete:
+            if line.strip():
+                yield clean_recommendation_line(line)
+    if pending.strip():
+        yield clean_recommendation_line(pending)
 
 # Function to format LLM output for UI/PDF
-def format_for_ui_and_pdf(match_info: dict, recommendations: str, ats_data: dict = None) -> dict:
-    clean_text = recommendations.replace('\r\n', '\n').replace('\r', '\n').strip()
-    lines = [re.sub(r'^[\*\-\`\s]*', '', line).strip() for line in clean_text.split('\n') if line.strip()]
-    cleaned_lines = [re.sub(r'^\d+\.\s*', '', line) for line in lines]
+def format_for_ui_and_pdf(match_info: dict, recommendations: str, ats_data: dict = None, recommendations_source: str = None) -> dict:
+    cleaned_lines = list(iter_recommendation_lines([recommendations]))
 
     result = {
         "match_percentage": match_info["match_percentage"],
@@ -380,28 +741,23 @@ def format_for_ui_and_pdf(match_info: dict, recommendations: str, ats_data: dict
         "estimated_time_saved_minutes": calculate_estimated_time_saved(match_info)
     }
     
+    # Missing job skills covered by a similar resume skill, with their similarity (semantic mode only)
+    if "semantic_matches" in match_info:
+        result["semantic_matches"] = match_info["semantic_matches"]
+
+    # "llm" or "fallback" (template recommendations, see template_recommendations)
+    if recommendations_source:
+        result["recommendations_source"] = recommendations_source
+
     # Add ATS score data if available
     if ats_data:
         result["ats_score"] = ats_data
     
     return result
 
-# Function to export PDF
-def export_to_pdf(formatted_data: dict) -> str:
-    pdf_fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
-    os.close(pdf_fd)
-
-    doc = SimpleDocTemplate(
-        pdf_path,
-        pagesize=A4,
-        leftMargin=40,
-        rightMargin=40,
-        topMargin=40,
-        bottomMargin=40
-    )
-
-    # Define styles
-    title_style = ParagraphStyle(
+# Report styles, built once and shared by every export
+PDF_STYLES = {
+    "title": ParagraphStyle(
         "TitleStyle",
         fontName="Roboto-Bold",
         fontSize=PDF_THEME['font_size_title'],
@@ -409,9 +765,8 @@ def export_to_pdf(formatted_data: dict) -> str:
         alignment=1,
         spaceAfter=15,
         leading=PDF_THEME['line_spacing']
-    )
-
-    header_style = ParagraphStyle(
+    ),
+    "header": ParagraphStyle(
         "HeaderStyle",
         fontName="Roboto-Bold",
         fontSize=PDF_THEME['font_size_header'],
@@ -419,48 +774,93 @@ def export_to_pdf(formatted_data: dict) -> str:
         spaceBefore=12,
         spaceAfter=10,
         leading=16
-    )
-
-    normal_style = ParagraphStyle(
+    ),
+    "normal": ParagraphStyle(
         "NormalStyle",
         fontName="Roboto-Regular",
         fontSize=PDF_THEME['font_size_normal'],
         leading=PDF_THEME['line_spacing'],
         textColor=PDF_THEME['neutral_color']
-    )
-
-    footer_style = ParagraphStyle(
+    ),
+    "footer": ParagraphStyle(
         "FooterStyle",
         fontName="Roboto-Italic",
         fontSize=9,
         textColor=colors.HexColor("#5f6368"),
         alignment=1,
         spaceBefore=20
-    )
+    ),
+    "subtitle": ParagraphStyle(
+        "SubtitleStyle",
+        fontName="Roboto-Italic",
+        fontSize=9,
+        textColor=colors.HexColor("#5f6368"),
+        spaceAfter=10
+    ),
+    "important": ParagraphStyle(
+        "ImportantStyle",
+        fontName="Roboto-Bold",
+        fontSize=12,
+        leading=14,
+        textColor=PDF_THEME['primary_color'],
+        spaceBefore=10,
+        spaceAfter=15
+    ),
+}
 
-    subtitle_style = ParagraphStyle(
-    "SubtitleStyle",
-    fontName="Roboto-Italic",
-    fontSize=9,
-    textColor=colors.HexColor("#5f6368"),
-    spaceAfter=10
-    )
+SKILLS_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (0, 0), PDF_THEME['background_matched']),
+    ("BACKGROUND", (0, 1), (0, 1), PDF_THEME['background_missing']),
+    ("TEXTCOLOR", (0, 0), (-1, -1), PDF_THEME['neutral_color']),
+    ("FONTNAME", (0, 0), (-1, -1), "Roboto-Regular"),
+    ("FONTSIZE", (0, 0), (-1, -1), PDF_THEME['font_size_normal']),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("BOX", (0, 0), (-1, -1), 1, PDF_THEME['neutral_color']),
+    ("INNERGRID", (0, 0), (-1, -1), 0.5, PDF_THEME['neutral_color']),
+    ("LEFTPADDING", (0, 0), (-1, -1), 15),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 15),
+    ("TOPPADDING", (0, 0), (-1, -1), 12),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+    ("FONTNAME", (0, 0), (0, -1), "Roboto-Bold"),
+])
+
+# Rendered reports keyed by report_digest, bounded by total bytes
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+pdf_report_cache = LRUCache(max_entries=100_000, max_bytes=PDF_CACHE_MAX_BYTES)
+
+# Function to hash the content of a report (the generation time is not part of it)
+def report_digest(formatted_data: dict) -> str:
+    canonical = json.dumps(formatted_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+# Function to export PDF (rendered in memory, returns the PDF bytes)
+def export_to_pdf(formatted_data: dict, generated_at: datetime = None) -> bytes:
+    ensure_fonts()
+    generated_at = generated_at or datetime.now()
+    buffer = io.BytesIO()
 
-    important_style = ParagraphStyle(
-    "ImportantStyle",
-    fontName="Roboto-Bold",
-    fontSize=12,
-    leading=14,
-    textColor=PDF_THEME['primary_color'],
-    spaceBefore=10,
-    spaceAfter=15
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        leftMargin=40,
+        rightMargin=40,
+        topMargin=40,
+        bottomMargin=40
     )
 
+    # Shared styles (flowables keep per-build layout state, so those are still created per report)
+    title_style = PDF_STYLES["title"]
+    header_style = PDF_STYLES["header"]
+    normal_style = PDF_STYLES["normal"]
+    footer_style = PDF_STYLES["footer"]
+    subtitle_style = PDF_STYLES["subtitle"]
+
     elements = []
 
     # Cover Title
     elements.append(Paragraph("Resume Optimization Report", title_style))
-    elements.append(Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %I:%M %p')}", subtitle_style))
+    elements.append(Paragraph(f"Generated on: {generated_at.strftime('%Y-%m-%d %I:%M %p')}", subtitle_style))
     elements.append(Spacer(1, 10))
 
     # Executive Summary
@@ -519,22 +919,7 @@ def export_to_pdf(formatted_data: dict) -> str:
     ]
 
     table = Table(table_data, colWidths=[180, 350])
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (0, 0), PDF_THEME['background_matched']),
-        ("BACKGROUND", (0, 1), (0, 1), PDF_THEME['background_missing']),
-        ("TEXTCOLOR", (0, 0), (-1, -1), PDF_THEME['neutral_color']),
-        ("FONTNAME", (0, 0), (-1, -1), "Roboto-Regular"),
-        ("FONTSIZE", (0, 0), (-1, -1), PDF_THEME['font_size_normal']),
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-        ("BOX", (0, 0), (-1, -1), 1, PDF_THEME['neutral_color']),
-        ("INNERGRID", (0, 0), (-1, -1), 0.5, PDF_THEME['neutral_color']),
-        ("LEFTPADDING", (0, 0), (-1, -1), 15),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 15),
-        ("TOPPADDING", (0, 0), (-1, -1), 12),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
-        ("FONTNAME", (0, 0), (0, -1), "Roboto-Bold"),
-    ]))
+    table.setStyle(SKILLS_TABLE_STYLE)
     elements.append(table)
     elements.append(Spacer(1, 20))
 
@@ -627,11 +1012,11 @@ def export_to_pdf(formatted_data: dict) -> str:
     # Footer
     footer = Paragraph(
         "Generated by <b>OptiResume AI</b> • Empowering Smarter Career Growth • " + 
-        datetime.now().strftime('%Y-%m-%d'),
+        generated_at.strftime('%Y-%m-%d'),
         footer_style
     )
     elements.append(footer)
 
     doc.build(elements)
 
-    return pdf_path
+    return buffer.getvalue()
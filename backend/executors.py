@@ -0,0 +1,151 @@
+import os
+import asyncio
+import threading
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Pool sizes (0 CPU workers runs the CPU stages on the I/O threads instead, handy for local dev)
+CPU_WORKERS = int(os.getenv("ANALYSIS_CPU_WORKERS", os.cpu_count() or 1))
+IO_WORKERS = int(os.getenv("ANALYSIS_IO_WORKERS", 8))
+# Page-level PDF extraction for large documents (0 or 1 keeps extraction single-threaded).
+# The total for the process that parses: CPU workers split it between them (see page_workers_per_cpu_worker)
+PAGE_WORKERS = int(os.getenv("PDF_PAGE_WORKERS", min(4, os.cpu_count() or 1)))
+
+_cpu_pool = None
+_io_pool = None
+_page_pool = None
+_pool_lock = threading.Lock()
+cpu_pool_warm = False
+
+
+# Function to get each CPU worker's share of the page workers
+def page_workers_per_cpu_worker() -> int:
+    """
+    CPU workers already keep the cores busy under load, so page pools only get the
+    PAGE_WORKERS processes between them: with as many CPU workers as page workers,
+    each worker extracts its PDFs single-threaded.
+    """
+    return PAGE_WORKERS // CPU_WORKERS if CPU_WORKERS > 0 else PAGE_WORKERS
+
+
+# Runs once in every CPU worker so the spaCy model and skill taxonomy are loaded per process, not per request
+def _init_cpu_worker(page_workers: int):
+    global PAGE_WORKERS
+    PAGE_WORKERS = page_workers
+    # The worker's page pool has to be shut down when the worker exits; see _shutdown_page_pool
+    multiprocessing.util.Finalize(None, _shutdown_page_pool, exitpriority=100)
+    import core
+    core.warm_up(["nlp", "skills"] + (["skill_vectors"] if core.SKILL_MATCH_MODE == "semantic" else []))
+    core.precompute_role_skills()
+
+
+def _cpu_worker_status() -> dict:
+    import core
+    return core.resource_status()
+
+
+def get_io_pool() -> ThreadPoolExecutor:
+    global _io_pool
+    with _pool_lock:
+        if _io_pool is None:
+            _io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="analysis-io")
+        return _io_pool
+
+
+# Spawned, like the page pool: the server already has threads running when the pool is created
+def get_cpu_pool():
+    global _cpu_pool
+    if CPU_WORKERS <= 0:
+        return get_io_pool()
+    with _pool_lock:
+        if _cpu_pool is None:
+            _cpu_pool = ProcessPoolExecutor(max_workers=CPU_WORKERS, initializer=_init_cpu_worker,
+                                            initargs=(page_workers_per_cpu_worker(),),
+                                            mp_context=multiprocessing.get_context("spawn"))
+        return _cpu_pool
+
+
+# Function to drop a CPU pool whose worker died (segfault, OOM kill), so the next call builds a new one
+def _discard_cpu_pool(pool):
+    global _cpu_pool
+    with _pool_lock:
+        if _cpu_pool is pool:
+            _cpu_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Pool used by parse_resume to split large PDFs by page range. It lives in whichever process
+# parses (a CPU worker, usually); spawned so it never forks a process that has threads running.
+def get_page_pool() -> ProcessPoolExecutor:
+    global _page_pool
+    with _pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(max_workers=PAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _page_pool
+
+
+# Function to stop the page workers of a CPU worker that is exiting
+def _shutdown_page_pool():
+    """
+    Runs as a multiprocessing exit finalizer, since atexit only runs after multiprocessing
+    has joined the worker's child processes, which idle page workers never finish. The
+    priority puts it ahead of the finalizers that close the pool's queues, and wait=True
+    lets the pool deliver its stop sentinels before they are closed.
+    """
+    global _page_pool
+    with _pool_lock:
+        pool, _page_pool = _page_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# Function to start every CPU worker ahead of the first request (blocks until they are initialized)
+def warm_cpu_pool():
+    global cpu_pool_warm
+    if CPU_WORKERS > 0:
+        pool = get_cpu_pool()
+        futures = [pool.submit(_cpu_worker_status) for _ in range(CPU_WORKERS)]
+        for future in futures:
+            future.result()
+    cpu_pool_warm = True
+
+
+# Function to run a CPU-bound stage (PDF parsing, spaCy, scoring) without blocking the event loop
+async def run_cpu(func, *args):
+    """
+    A dead worker breaks the whole process pool; the pool is then replaced and the
+    call retried once on the new one. A second crash (e.g. a PDF that crashes MuPDF
+    every time) is raised, and the pool is replaced again for the next request.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = get_cpu_pool()
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            _discard_cpu_pool(pool)
+            if attempt:
+                raise
+
+
+# Function to run a blocking I/O call (e.g. the Gemini request) on the bounded thread pool
+async def run_io(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_pool(), func, *args)
+
+
+def shutdown_pools():
+    global _cpu_pool, _io_pool, _page_pool, cpu_pool_warm
+    with _pool_lock:
+        cpu_pool_warm = False
+        if _page_pool is not None:
+            _page_pool.shutdown(wait=False, cancel_futures=True)
+            _page_pool = None
+        if _cpu_pool is not None:
+            _cpu_pool.shutdown(wait=False, cancel_futures=True)
+            _cpu_pool = None
+        if _io_pool is not None:
+            _io_pool.shutdown(wait=False, cancel_futures=True)
+            _io_pool = None
@@ -0,0 +1,42 @@
+import threading
+import time
+
+
+class LazyResource:
+    """
+    Heavy resource (model, client, font registration) created on first use.
+    Loading is thread-safe and happens at most once; a failed load is remembered
+    for /ready and retried on the next call.
+    """
+
+    def __init__(self, name: str, loader):
+        self.name = name
+        self._loader = loader
+        self._value = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.load_seconds = None
+        self.error = None
+
+    def get(self):
+        if self._loaded:
+            return self._value
+        with self._lock:
+            if not self._loaded:
+                start = time.perf_counter()
+                try:
+                    self._value = self._loader()
+                except Exception as exc:
+                    self.error = str(exc)
+                    raise
+                self.load_seconds = round(time.perf_counter() - start, 3)
+                self.error = None
+                self._loaded = True
+        return self._value
+
+    @property
+    def is_ready(self) -> bool:
+        return self._loaded
+
+    def status(self) -> dict:
+        return {"ready": self._loaded, "load_seconds": self.load_seconds, "error": self.error}
@@ -1,12 +1,198 @@
 import uvicorn
 import os
-from fastapi import FastAPI, UploadFile, Form
-from core import parse_resume, extract_job_skills, analyze_skill_match, generate_llm_recommendations, format_for_ui_and_pdf, export_to_pdf, get_description_from_db, calculate_ats_score
-from fastapi.responses import FileResponse
+import hashlib
+import asyncio
+import json
+from typing import List
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, UploadFile, Form, Request
+from core import parse_resume, extract_job_skills, analyze_skill_match, generate_llm_recommendations, format_for_ui_and_pdf, export_to_pdf, report_digest, pdf_report_cache, get_role, suggest_roles, calculate_ats_score, extract_ats_keywords, ResumeParseError, ResumeTooLargeError, UnknownRoleError, MAX_UPLOAD_BYTES, UPLOAD_CHUNK_BYTES, precompute_role_skills, build_role_index, warm_up, resource_status, llm_cache, JD_SKILLS_CACHE, template_recommendations, stream_llm_recommendations, iter_recommendation_lines, PARSE_CACHE
+from fastapi.responses import JSONResponse, Response, StreamingResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
+import executors
+from executors import run_cpu, run_io, shutdown_pools, get_io_pool
+import core
+from role_index import RoleIndex
+from result_store import ResultStore
+from metrics import REGISTRY, CONTENT_TYPE, HTTP_REQUESTS, HTTP_ERRORS, StageTimer
+from pipeline import Stage, run_stages
+from single_flight import SingleFlight
 
-app = FastAPI()
-temp_storage = {}
+WARM_UP_ON_STARTUP = os.getenv("WARM_UP_ON_STARTUP", "1") == "1"
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", 500))
+RESULT_STORE_MAX_BYTES = int(os.getenv("RESULT_STORE_MAX_BYTES", 32 * 1024 * 1024))
+RESULT_TTL_SECONDS = float(os.getenv("RESULT_TTL_SECONDS", 60 * 60))
+RESULT_STORE_PATH = os.getenv("RESULT_STORE_PATH")
+
+# Resources this process needs itself (NLP lives in the CPU workers unless they are disabled)
+def _required_resources() -> list:
+    required = ["llm", "fonts", "skills", "roles"]
+    if executors.CPU_WORKERS <= 0:
+        required.append("nlp")
+        if core.SKILL_MATCH_MODE == "semantic":
+            required.append("skill_vectors")
+    return required
+
+def _warm_up():
+    warm_up(_required_resources())
+    # Process workers precompute role skills in their initializer; in-process mode does it here
+    if executors.CPU_WORKERS <= 0:
+        precompute_role_skills()
+    executors.warm_cpu_pool()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so /health answers immediately; /ready flips once done
+    if WARM_UP_ON_STARTUP:
+        asyncio.get_running_loop().run_in_executor(get_io_pool(), _warm_up)
+    yield
+    shutdown_pools()
+
+app = FastAPI(lifespan=lifespan)
+# Results for /export-pdf; set RESULT_STORE_PATH to share them between workers on a host
+result_store = ResultStore(RESULT_STORE_MAX_BYTES, RESULT_TTL_SECONDS, RESULT_STORE_PATH)
+role_index = None
+role_index_generation = None
+
+@app.exception_handler(ResumeParseError)
+async def resume_parse_error_handler(request, exc: ResumeParseError):
+    status_code = 413 if isinstance(exc, ResumeTooLargeError) else 422
+    return JSONResponse(status_code=status_code, content={"error": str(exc)})
+
+@app.exception_handler(UnknownRoleError)
+async def unknown_role_handler(request, exc: UnknownRoleError):
+    return JSONResponse(status_code=400, content={"error": str(exc), "suggestions": exc.suggestions})
+
+# Function to read an upload in chunks, rejecting it early when it is over the byte cap
+async def read_upload(file: UploadFile) -> tuple:
+    """Returns (raw_bytes, sha256 hex digest); the digest is computed chunk by chunk while reading."""
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise ResumeTooLargeError(f"Resume exceeds the {MAX_UPLOAD_BYTES // 1024} KB upload limit.")
+    chunks = []
+    total = 0
+    digest = hashlib.sha256()
+    while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+        total += len(chunk)
+        if total > MAX_UPLOAD_BYTES:
+            raise ResumeTooLargeError(f"Resume exceeds the {MAX_UPLOAD_BYTES // 1024} KB upload limit.")
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+# Function to parse an upload from read_upload, reusing the result for bytes seen before
+async def parse_upload(upload: tuple) -> dict:
+    raw_bytes, digest = upload
+    resume_data = PARSE_CACHE.get(digest)
+    if resume_data is None:
+        resume_data = await run_cpu(parse_resume, raw_bytes)
+        PARSE_CACHE.set(digest, resume_data)
+    # Copy so a request can never change the cached entry
+    return {"text": resume_data["text"], "skills": list(resume_data["skills"])}
+
+# LLM calls that outlived their request's budget; kept referenced until they finish
+_late_llm_calls = set()
+
+def _discard_late_call(future):
+    _late_llm_calls.discard(future)
+    if not future.cancelled():
+        future.exception()  # already counted in llm_calls_total; retrieved so it is not logged as lost
+
+# In-flight LLM calls by prompt cache key, shared by identical concurrent requests
+_llm_flights = SingleFlight()
+
+REGISTRY.callback("llm_singleflight_total", "LLM recommendation requests that started a call or joined one in flight.",
+                  "counter", ("result",),
+                  lambda: {("started",): _llm_flights.started, ("coalesced",): _llm_flights.coalesced})
+
+# Function to get recommendations within the LLM latency budget, falling back to templates
+async def get_recommendations(resume_data: dict, job_description: str, match_info: dict) -> tuple:
+    """
+    Returns (text, source) with source "llm" or "fallback". A call that misses the
+    budget is not abandoned: it keeps running in the I/O pool and its answer lands
+    in the LLM cache for the next identical request. Identical requests that arrive
+    while a call is in flight wait on that call instead of starting their own.
+    """
+    key = core._recommendation_cache_key(resume_data, job_description, match_info)
+    call = _llm_flights.future(key, lambda: run_io(generate_llm_recommendations, resume_data, job_description, match_info))
+    try:
+        return await asyncio.wait_for(asyncio.shield(call), timeout=core.LLM_BUDGET_SECONDS), "llm"
+    except asyncio.TimeoutError:
+        _late_llm_calls.add(call)
+        call.add_done_callback(_discard_late_call)
+    except Exception:
+        pass
+    return template_recommendations(match_info), "fallback"
+
+# Cache counters are read from the caches themselves when /metrics is scraped
+def _cache_counters() -> dict:
+    caches = {
+        "llm": llm_cache.stats(),
+        "pdf_report": {"memory": pdf_report_cache.stats()},
+        "result": result_store.stats(),
+        # Only counts lookups made in this process (not in the CPU workers)
+        "jd_skills": {"memory": JD_SKILLS_CACHE.stats()},
+        "parse": {"memory": PARSE_CACHE.stats()},
+    }
+    counters = {}
+    for cache, tiers in caches.items():
+        for tier, stats in tiers.items():
+            counters[(cache, tier, "hit")] = stats["hits"]
+            counters[(cache, tier, "miss")] = stats["misses"]
+    return counters
+
+REGISTRY.callback("cache_requests_total", "Cache lookups by cache, tier and result.", "counter",
+                  ("cache", "tier", "result"), _cache_counters)
+
+def _cache_hit_ratios() -> dict:
+    counters = _cache_counters()
+    ratios = {}
+    for cache, tier, result in counters:
+        if result == "hit":
+            lookups = counters[(cache, tier, "hit")] + counters[(cache, tier, "miss")]
+            ratios[(cache, tier)] = counters[(cache, tier, "hit")] / lookups if lookups else 0.0
+    return ratios
+
+REGISTRY.callback("cache_hit_ratio", "Hits / lookups since start, by cache and tier.", "gauge",
+                  ("cache", "tier"), _cache_hit_ratios)
+
+# Function to get the route template of a request, so metric labels stay bounded
+def _route_path(scope) -> str:
+    route = scope.get("route")
+    return route.path if route else "unmatched"
+
+class RequestCounter:
+    """
+    Counts requests by route, method and status. Plain ASGI, so response bodies
+    (NDJSON streams included) pass straight through without being buffered.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = None
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        # The router sets scope["route"], so the path is only known after the call
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            HTTP_ERRORS.inc(path=_route_path(scope), method=scope["method"])
+            raise
+        path = _route_path(scope)
+        HTTP_REQUESTS.inc(path=path, method=scope["method"], status=status)
+        if status is None or status >= 500:
+            HTTP_ERRORS.inc(path=path, method=scope["method"])
+
+app.add_middleware(RequestCounter)
 
 app.add_middleware(
     CORSMiddleware,
@@ -31,45 +217,324 @@ async def root():
 async def health_check():
     return {"status": "healthy", "message": "API is running"}
 
+@app.get("/metrics")
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+@app.get("/ready")
+async def readiness_check():
+    resources = resource_status()
+    ready = all(resources[name]["ready"] for name in _required_resources()) and executors.cpu_pool_warm
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "warming_up",
+            "resources": resources,
+            "cpu_pool_warm": executors.cpu_pool_warm,
+        },
+    )
+
 @app.options("/analyze-resume")
 async def analyze_resume_options():
     return {"message": "OK"}
 
+# Function to resolve the job description of a request, with the precomputed skills and keywords of a stored role
+def resolve_job(job_role: str, job_description: str = None) -> tuple:
+    """
+    Returns (job_description, skills, keywords); skills and keywords are None when they must be derived.
+    Raises UnknownRoleError (400, with suggestions) for a role name that is not stored.
+    """
+    if job_description:
+        return job_description, None, None
+    role = get_role(job_role)
+    if role is None:
+        raise UnknownRoleError(job_role, suggest_roles(job_role))
+    return role["description"], role["skills"], role["keywords"]
+
+# Function to match resume skills against job skills; semantic matching needs the word vectors,
+# which are loaded with the NLP model in the CPU workers, so it runs there
+async def match_skills(resume_data: dict, job_skills: list) -> dict:
+    if core.SKILL_MATCH_MODE == "semantic":
+        return await run_cpu(analyze_skill_match, resume_data, job_skills)
+    return analyze_skill_match(resume_data, job_skills)
+
+# Function to build the analysis stages shared by /analyze-resume and its streaming variant
+def _analysis_stages(file: UploadFile, job_description: str, job_skills: list = None, job_keywords: list = None) -> list:
+    """
+    read_upload -> parse_resume --+--> skill_match
+    extract_job_skills -----------+
+    parse_resume -----------------> ats_score
+    JD skill extraction runs alongside the upload and parse, and ATS scoring alongside
+    everything after the parse. A failed ATS score drops that section instead of the request.
+    Skills and keywords precomputed in the role store are used as they are.
+    """
+    return [
+        Stage("read_upload", lambda: read_upload(file)),
+        Stage("parse_resume", parse_upload, deps=["read_upload"]),
+        Stage("extract_job_skills", lambda: list(job_skills) if job_skills is not None else run_cpu(extract_job_skills, job_description)),
+        Stage("skill_match", match_skills, deps=["parse_resume", "extract_job_skills"]),
+        Stage("ats_score", lambda resume_data: run_cpu(calculate_ats_score, resume_data, job_description, job_keywords),
+              deps=["parse_resume"], fallback=lambda exc: None),
+    ]
+
 @app.post("/analyze-resume")
-async def analyze_resume(file: UploadFile, job_role: str = Form(...), job_description: str = Form(None)):
-    resume_data = parse_resume(file)
-    if not job_description:
-        job_description = get_description_from_db(job_role)
-    required_skills = extract_job_skills(job_description)
-    match_info = analyze_skill_match(resume_data, required_skills)
-    
-    # Calculate ATS score (independent of skill matching)
-    ats_data = calculate_ats_score(resume_data, job_description)
-    
-    recommendations = generate_llm_recommendations(resume_data, job_description, match_info)
-    formatted = format_for_ui_and_pdf(match_info, recommendations, ats_data)
-    
-    temp_storage["last_result"] = formatted 
+async def analyze_resume(response: Response, file: UploadFile, job_role: str = Form(...), job_description: str = Form(None)):
+    # Blocking stages run on the executors so the event loop keeps serving other requests,
+    # and independent stages run at the same time (the Gemini call overlaps ATS scoring)
+    job_description, job_skills, job_keywords = resolve_job(job_role, job_description)
+
+    def recommend(resume_data, match_info):
+        return get_recommendations(resume_data, job_description, match_info)
 
+    def format_result(match_info, recommendations, ats_data):
+        text, source = recommendations
+        return format_for_ui_and_pdf(match_info, text, ats_data, source)
+
+    timer = StageTimer("analyze_resume")
+    results = await run_stages(_analysis_stages(file, job_description, job_skills, job_keywords) + [
+        Stage("llm_recommendations", recommend, deps=["parse_resume", "skill_match"]),
+        Stage("format", format_result, deps=["skill_match", "llm_recommendations", "ats_score"]),
+        Stage("store_result", lambda formatted: run_io(result_store.save, formatted), deps=["format"]),
+    ], timer)
+
+    response.headers["Server-Timing"] = timer.server_timing()
     return {
-        "result": formatted
+        "result": results["format"],
+        "result_id": results["store_result"]
     }
 
+@app.options("/analyze-resume/stream")
+async def analyze_resume_stream_options():
+    return {"message": "OK"}
+
+_STREAM_END = object()
+
+# Function to pull the next item of a blocking iterator (e.g. a Gemini stream) on the I/O pool
+async def _next_in_io(iterator):
+    return await run_io(next, iterator, _STREAM_END)
+
+# Function to finish a stream that missed the budget; exhausting it caches the full answer
+async def _drain_late_stream(iterator, pending):
+    item = await pending
+    while item is not _STREAM_END:
+        item = await _next_in_io(iterator)
+
+@app.post("/analyze-resume/stream")
+async def analyze_resume_stream(file: UploadFile, job_role: str = Form(...), job_description: str = Form(None)):
+    """
+    Streaming variant of /analyze-resume. Streams NDJSON: an "analysis" line with the
+    skill match and ATS score as soon as they are computed, a "recommendation" line per
+    cleaned line as Gemini generates it, then a "done" line with the full result and its
+    result_id. If Gemini has not finished within the LLM budget, template recommendations
+    are sent after the lines it produced so far.
+    """
+    job_description, job_skills, job_keywords = resolve_job(job_role, job_description)
+    timer = StageTimer("analyze_resume_stream")
+    results = await run_stages(_analysis_stages(file, job_description, job_skills, job_keywords), timer)
+    resume_data, match_info, ats_data = results["parse_resume"], results["skill_match"], results["ats_score"]
+
+    async def stream():
+        formatted = format_for_ui_and_pdf(match_info, "", ats_data)
+        yield json.dumps({"type": "analysis", "result": formatted}) + "\n"
+
+        # Lines are cleaned in the I/O thread as chunks arrive, one complete line at a time
+        lines_iter = iter_recommendation_lines(stream_llm_recommendations(resume_data, job_description, match_info))
+        lines, source, timed_out = [], "llm", False
+        # The budget covers the whole stream, not just the first line
+        deadline = asyncio.get_running_loop().time() + core.LLM_BUDGET_SECONDS
+        with timer.stage("llm_recommendations"):
+            pending = asyncio.ensure_future(_next_in_io(lines_iter))
+            try:
+                while True:
+                    remaining = max(deadline - asyncio.get_running_loop().time(), 0)
+                    line = await asyncio.wait_for(asyncio.shield(pending), timeout=remaining)
+                    if line is _STREAM_END:
+                        break
+                    lines.append(line)
+                    yield json.dumps({"type": "recommendation", "index": len(lines) - 1, "text": line}) + "\n"
+                    pending = asyncio.ensure_future(_next_in_io(lines_iter))
+            except asyncio.TimeoutError:
+                timed_out = True
+                late = asyncio.ensure_future(_drain_late_stream(lines_iter, pending))
+                _late_llm_calls.add(late)
+                late.add_done_callback(_discard_late_call)
+            except Exception:
+                pass  # a stream that fails midway keeps the lines already sent
+
+            # Template lines follow whatever Gemini sent before the budget ran out
+            if timed_out or not lines:
+                source = "fallback"
+                for line in iter_recommendation_lines([template_recommendations(match_info)]):
+                    lines.append(line)
+                    yield json.dumps({"type": "recommendation", "index": len(lines) - 1, "text": line}) + "\n"
+
+        formatted = format_for_ui_and_pdf(match_info, "", ats_data, source)
+        formatted["recommendations"] = lines
+        result_id = await run_io(result_store.save, formatted)
+        yield json.dumps({"type": "done", "result": formatted, "result_id": result_id}) + "\n"
+
+    # Only the stages before the first byte fit in the header
+    return StreamingResponse(stream(), media_type="application/x-ndjson",
+                             headers={"Server-Timing": timer.server_timing()})
+
+@app.options("/analyze-resumes")
+async def analyze_resumes_options():
+    return {"message": "OK"}
+
+# Function to analyze one resume of a batch against job data computed once for the whole batch
+async def _analyze_batch_item(index: int, filename: str, upload, job_description: str,
+                              required_skills: list, job_keywords: list, include_recommendations: bool) -> dict:
+    try:
+        if isinstance(upload, Exception):
+            raise upload
+        resume_data = await parse_upload(upload)
+        match_info = await match_skills(resume_data, required_skills)
+        ats_scoring = run_cpu(calculate_ats_score, resume_data, job_description, job_keywords)
+        recommendations, source = "", None
+        if include_recommendations:
+            # ATS scoring overlaps the Gemini call
+            ats_data, (recommendations, source) = await asyncio.gather(
+                ats_scoring, get_recommendations(resume_data, job_description, match_info))
+        else:
+            ats_data = await ats_scoring
+        formatted = format_for_ui_and_pdf(match_info, recommendations, ats_data, source)
+        result_id = await run_io(result_store.save, formatted)
+        return {"type": "result", "index": index, "filename": filename, "result_id": result_id, "result": formatted}
+    except Exception as exc:
+        return {"type": "error", "index": index, "filename": filename, "error": str(exc)}
+
+def _rank_key(item: dict):
+    result = item["result"]
+    return (result["match_percentage"], result["ats_score"]["overall_ats_score"])
+
+@app.post("/analyze-resumes")
+async def analyze_resumes(files: List[UploadFile], job_role: str = Form(...), job_description: str = Form(None),
+                          include_recommendations: bool = Form(False)):
+    """
+    Screens many resumes against one role. Streams NDJSON: one line per resume as soon as it
+    is scored, then a final "ranking" line ordered by match percentage and ATS score.
+    """
+    if len(files) > BATCH_MAX_FILES:
+        return JSONResponse(status_code=400, content={"error": f"At most {BATCH_MAX_FILES} resumes per batch."})
+
+    # Read uploads now, the request body is gone once the streaming response starts
+    uploads = []
+    for upload in files:
+        try:
+            uploads.append((upload.filename, await read_upload(upload)))
+        except ResumeTooLargeError as exc:
+            uploads.append((upload.filename, exc))
+    job_description, required_skills, job_keywords = resolve_job(job_role, job_description)
+    if required_skills is None:
+        required_skills = await run_cpu(extract_job_skills, job_description)
+    if job_keywords is None:
+        job_keywords = extract_ats_keywords(job_description)
+
+    async def stream():
+        tasks = [
+            asyncio.create_task(_analyze_batch_item(index, filename, upload, job_description,
+                                                    required_skills, job_keywords, include_recommendations))
+            for index, (filename, upload) in enumerate(uploads)
+        ]
+        finished = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                finished.append(item)
+                yield json.dumps(item) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        ranked = sorted((item for item in finished if item["type"] == "result"), key=_rank_key, reverse=True)
+        ranking = [
+            {
+                "rank": rank,
+                "index": item["index"],
+                "filename": item["filename"],
+                "match_percentage": item["result"]["match_percentage"],
+                "overall_ats_score": item["result"]["ats_score"]["overall_ats_score"],
+            }
+            for rank, item in enumerate(ranked, start=1)
+        ]
+        yield json.dumps({"type": "ranking", "job_role": job_role, "required_skills": required_skills, "ranking": ranking}) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+# Function to get the role ranking index (stored role skills plus the built-ins from the CPU workers)
+async def get_role_index() -> RoleIndex:
+    """Rebuilt when the role store's generation changes, i.e. after roles are added here or by another process."""
+    global role_index, role_index_generation
+    store = await run_io(core.get_role_store)
+    generation = await run_io(store.generation)
+    if role_index is None or generation != role_index_generation:
+        role_skills = await run_io(store.role_skills)
+        role_skills.update(await run_cpu(precompute_role_skills))
+        role_index = build_role_index(role_skills)
+        role_index_generation = generation
+    return role_index
+
+@app.options("/rank-roles")
+async def rank_roles_options():
+    return {"message": "OK"}
+
+@app.post("/rank-roles")
+async def rank_roles(file: UploadFile, top_k: int = Form(None)):
+    """Scores the resume against every stored role; roles added to the store are ranked from the next request on."""
+    if top_k is not None and top_k < 1:
+        return JSONResponse(status_code=400, content={"error": "top_k must be at least 1."})
+    resume_data = await parse_upload(await read_upload(file))
+    index = await get_role_index()
+    return {
+        "resume_skills": resume_data["skills"],
+        "roles": index.rank(resume_data["skills"], top_k=top_k),
+    }
+
+@app.get("/roles")
+async def search_roles(q: str = "", limit: int = 10):
+    """Role name suggestions for a partial or misspelled query: prefix matches first, then fuzzy ones."""
+    store = await run_io(core.get_role_store)
+    return {"roles": await run_io(store.search, q, max(1, min(limit, 50)))}
+
 @app.options("/export-pdf")
 async def export_pdf_options():
     return {"message": "OK"}
 
+# Function to check an If-None-Match header against an ETag
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
 @app.get("/export-pdf")
-async def export_pdf():
-    formatted_data = temp_storage.get("last_result")
+async def export_pdf(request: Request, result_id: str = None):
+    timer = StageTimer("export_pdf")
+    with timer.stage("load_result"):
+        formatted_data = await run_io(result_store.load, result_id) if result_id else None
     if not formatted_data:
-        return {"error": "No analysis result available to export."}
+        return JSONResponse(status_code=404, content={"error": "No analysis result available to export."})
+
+    # Reports are content-addressed: same result, same ETag, same bytes
+    digest = report_digest(formatted_data)
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={**headers, "Server-Timing": timer.server_timing()})
 
-    pdf_path = export_to_pdf(formatted_data)
-    return FileResponse(
-        path=pdf_path,
-        filename="ResumeReport(OptiResume).pdf",
-        media_type="application/pdf"
+    pdf_bytes = pdf_report_cache.get(digest)
+    if pdf_bytes is None:
+        with timer.stage("render_pdf"):
+            pdf_bytes = await run_cpu(export_to_pdf, formatted_data)
+        pdf_report_cache.set(digest, pdf_bytes)
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={
+            **headers,
+            "Content-Disposition": 'attachment; filename="ResumeReport(OptiResume).pdf"',
+            "Server-Timing": timer.server_timing(),
+        },
     )
 
 if __name__ == "__main__":
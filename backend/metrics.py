@@ -0,0 +1,173 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# Seconds; covers cache hits (sub-ms) up to slow Gemini round trips
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Tokens per LLM call, prompt or answer
+TOKEN_BUCKETS = (32, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+
+def _format_labels(labelnames, values, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with optional labels, e.g. requests.inc(path="/health", status=200)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(str(labels[name]) for name in self.labelnames), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name + _format_labels(self.labelnames, key), value
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus layout (_bucket, _sum, _count)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # label values -> [per-bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, **labels) -> int:
+        series = self._series.get(tuple(str(labels[name]) for name in self.labelnames))
+        return sum(series[:-1]) if series else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield self.name + "_bucket" + _format_labels(self.labelnames, key, f'le="{le}"'), cumulative
+            yield self.name + "_sum" + _format_labels(self.labelnames, key), series[-1]
+            yield self.name + "_count" + _format_labels(self.labelnames, key), cumulative
+
+
+class CallbackMetric:
+    """Values read at scrape time from fn() -> {label values tuple: value}, e.g. cache counters."""
+
+    def __init__(self, name: str, help_text: str, kind: str, labelnames, fn):
+        self.name = name
+        self.help = help_text
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.fn = fn
+
+    def samples(self):
+        for key, value in sorted(self.fn().items()):
+            yield self.name + _format_labels(self.labelnames, key), value
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames=()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def callback(self, name: str, help_text: str, kind: str, labelnames, fn) -> CallbackMetric:
+        return self._register(CallbackMetric(name, help_text, kind, labelnames, fn))
+
+    # Function to render every metric in the Prometheus text exposition format
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(f"{sample} {_format_value(value)}" for sample, value in metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+HTTP_REQUESTS = REGISTRY.counter("http_requests_total", "HTTP requests by route, method and status code.", ("path", "method", "status"))
+HTTP_ERRORS = REGISTRY.counter("http_request_errors_total", "Requests that ended in a 5xx or an unhandled exception.", ("path", "method"))
+STAGE_SECONDS = REGISTRY.histogram("analysis_stage_duration_seconds", "Time spent in each stage of a request.", ("endpoint", "stage"))
+LLM_CALLS = REGISTRY.counter("llm_calls_total", "Gemini calls made for recommendations (cache hits excluded).", ("outcome",))
+LLM_TOKENS = REGISTRY.histogram("llm_tokens", "Tokens per successful Gemini call, as reported by the API or estimated.", ("direction",), buckets=TOKEN_BUCKETS)
+LLM_SECONDS = REGISTRY.histogram("llm_call_duration_seconds", "Successful Gemini calls, retries and streaming the whole answer included.", ("mode",))
+
+
+class StageTimer:
+    """
+    Times the stages of one request. Every stage is recorded in the shared
+    STAGE_SECONDS histogram and kept for the response's Server-Timing header.
+    """
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stages.append((name, elapsed))
+            STAGE_SECONDS.observe(elapsed, endpoint=self.endpoint, stage=name)
+
+    def server_timing(self) -> str:
+        return ", ".join(f"{name};dur={elapsed * 1000:.1f}" for name, elapsed in self.stages)
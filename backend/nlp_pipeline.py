@@ -0,0 +1,70 @@
+import re
+
+# Extraction tiers: "rule" is tokenizer + dictionary only, "sm"/"md" add the trained NER/tagger
+NLP_TIERS = {
+    "rule": None,
+    "sm": "en_core_web_sm",
+    "md": "en_core_web_md",
+}
+
+# Components extract_job_skills never reads (dependency parse, lemmas, sentence splitting)
+UNUSED_COMPONENTS = ["parser", "lemmatizer", "senter"]
+
+# Components only needed for the PROPN/NOUN fallback, run on demand
+POS_COMPONENTS = ["tok2vec", "tagger", "morphologizer", "attribute_ruler"]
+
+CHUNK_MAX_CHARS = 2000
+
+
+# Function to load the spaCy pipeline for a tier with only the components we use
+def load_nlp(tier: str = "md"):
+    if tier not in NLP_TIERS:
+        raise ValueError(f"Unknown NLP tier '{tier}', expected one of {sorted(NLP_TIERS)}")
+    import spacy  # imported here so that importing this module stays cheap
+    model_name = NLP_TIERS[tier]
+    if model_name is None:
+        return spacy.blank("en")
+    return spacy.load(model_name, exclude=UNUSED_COMPONENTS)
+
+
+# Function to split long text on paragraph / sentence boundaries so entities are not cut in half
+def iter_chunks(text: str, max_chars: int = CHUNK_MAX_CHARS):
+    if len(text) <= max_chars:
+        yield text
+        return
+    chunk = ""
+    for piece in re.split(r"(?<=[.!?\n])\s+", text):
+        if chunk and len(chunk) + len(piece) + 1 > max_chars:
+            yield chunk
+            chunk = ""
+        chunk = f"{chunk} {piece}" if chunk else piece
+    if chunk:
+        yield chunk
+
+
+def _deferred_components(nlp) -> list:
+    deferred = [name for name in POS_COMPONENTS if name in nlp.pipe_names]
+    # Keep the shared tok2vec in the first pass if the NER listens to it
+    if "tok2vec" in deferred and "ner" in nlp.pipe_names:
+        if "ner" in getattr(nlp.get_pipe("tok2vec"), "listening_components", []):
+            deferred.remove("tok2vec")
+    return deferred
+
+
+# Function to run the entity pass over a (possibly long) text in nlp.pipe batches
+def parse_entities(nlp, text: str, batch_size: int = 8) -> list:
+    deferred = _deferred_components(nlp)
+    with nlp.select_pipes(disable=deferred):
+        return list(nlp.pipe(iter_chunks(text), batch_size=batch_size))
+
+
+# Function to add POS tags to docs from parse_entities, only when the fallback needs them
+def annotate_pos(nlp, docs: list) -> list:
+    deferred = _deferred_components(nlp)
+    annotated = []
+    for doc in docs:
+        for name, component in nlp.pipeline:
+            if name in deferred:
+                doc = component(doc)
+        annotated.append(doc)
+    return annotated
@@ -0,0 +1,57 @@
+import os
+import time
+import tempfile
+
+import fitz
+
+# tmpfs when available, so the shared copy of the PDF never touches the disk
+SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+# Runs in a page worker: opens the shared file (MuPDF only reads the objects it needs) and extracts a page range
+def _extract_page_range(path: str, start: int, stop: int, deadline: float) -> list:
+    texts = []
+    with fitz.open(path) as doc:
+        for number in range(start, stop):
+            texts.append(doc[number].get_text("text"))
+            if time.time() > deadline:
+                raise TimeoutError("page extraction budget exceeded")
+    return texts
+
+
+# Function to split page_count pages into at most `parts` contiguous ranges
+def page_ranges(page_count: int, parts: int) -> list:
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+# Function to extract every page of a PDF across a process pool, returning page texts in order
+def extract_pages_parallel(raw_bytes: bytes, page_count: int, pool, parts: int, budget_s: float) -> list:
+    """
+    The PDF is written once to a temp file (tmpfs when available) that every worker
+    opens by path, instead of pickling the document bytes to each of them.
+    Raises TimeoutError when the whole extraction passes budget_s.
+    """
+    deadline = time.time() + budget_s
+    fd, path = tempfile.mkstemp(suffix=".pdf", dir=SHARED_DIR)
+    futures = []
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(raw_bytes)
+        futures = [pool.submit(_extract_page_range, path, start, stop, deadline)
+                   for start, stop in page_ranges(page_count, parts)]
+        pages = []
+        for future in futures:
+            pages.extend(future.result(timeout=max(0.0, deadline - time.time())))
+        return pages
+    finally:
+        for future in futures:
+            future.cancel()
+        os.unlink(path)
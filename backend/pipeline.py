@@ -0,0 +1,69 @@
+import asyncio
+import inspect
+
+from metrics import REGISTRY, StageTimer
+
+STAGE_ERRORS = REGISTRY.counter("analysis_stage_errors_total", "Stages that failed and were replaced by their fallback.", ("endpoint", "stage"))
+
+
+class Stage:
+    """
+    One node of a request pipeline. func receives the results of deps, in order, and
+    may be sync or async. With a fallback, a failure is contained: fallback(exc) becomes
+    the stage result and dependents carry on; without one, the whole run fails.
+    """
+
+    def __init__(self, name: str, func, deps=(), fallback=None):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.fallback = fallback
+
+
+# Function to run stages as a dependency graph: every stage starts as soon as its deps are done
+async def run_stages(stages: list, timer: StageTimer) -> dict:
+    """
+    Independent stages overlap, so the wall time is the critical path rather than the
+    sum of all stages. Each stage is timed on timer from the moment its deps are ready.
+    Stages must be listed after their deps. Returns {stage name: result}; the first
+    stage error without a fallback cancels what is still running and is re-raised.
+    """
+    tasks = {}
+
+    async def run(stage: Stage):
+        args = [await tasks[dep] for dep in stage.deps]
+        with timer.stage(stage.name):
+            try:
+                result = stage.func(*args)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except Exception as exc:
+                if stage.fallback is None:
+                    raise
+                STAGE_ERRORS.inc(endpoint=timer.endpoint, stage=stage.name)
+                return stage.fallback(exc)
+
+    seen = set()
+    for stage in stages:
+        unknown = [dep for dep in stage.deps if dep not in seen]
+        if unknown:
+            raise ValueError(f"Stage '{stage.name}' depends on {unknown}, which must be listed before it")
+        seen.add(stage.name)
+    for stage in stages:
+        tasks[stage.name] = asyncio.ensure_future(run(stage))
+
+    try:
+        _, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+    except asyncio.CancelledError:
+        for task in tasks.values():
+            task.cancel()
+        raise
+    for task in pending:
+        task.cancel()
+    # Collect every outcome so no task exception goes unretrieved, then report the first failure
+    outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException) and not isinstance(outcome, asyncio.CancelledError):
+            raise outcome
+    return dict(zip(tasks, outcomes))
@@ -0,0 +1,43 @@
+import json
+import secrets
+import zlib
+
+from cache import LRUCache, SQLiteCache, TieredCache
+
+
+def _identity(value):
+    return value
+
+
+class ResultStore:
+    """
+    Analysis results addressed by an unguessable ID, kept as zlib-compressed JSON.
+    The memory tier is bounded by bytes and TTL; with a path, a SQLite file shared by
+    every worker on the host lets /export-pdf land on any worker.
+    """
+
+    PURGE_EVERY = 256  # saves between sweeps of expired rows on disk
+
+    def __init__(self, max_bytes: int, ttl_seconds: float, path: str = None):
+        memory = LRUCache(max_entries=1_000_000, ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+        disk = SQLiteCache(path, ttl_seconds=ttl_seconds, dumps=_identity, loads=_identity) if path else None
+        self._cache = TieredCache(memory, disk)
+        self._saves = 0
+
+    def save(self, result: dict) -> str:
+        result_id = secrets.token_urlsafe(16)
+        blob = zlib.compress(json.dumps(result, separators=(",", ":")).encode("utf-8"))
+        self._cache.set(result_id, blob)
+        self._saves += 1
+        if self._cache.disk is not None and self._saves % self.PURGE_EVERY == 0:
+            self._cache.disk.purge_expired()
+        return result_id
+
+    def load(self, result_id: str):
+        blob = self._cache.get(result_id)
+        if blob is None:
+            return None
+        return json.loads(zlib.decompress(blob))
+
+    def stats(self) -> dict:
+        return self._cache.stats()
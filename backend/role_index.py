@@ -0,0 +1,68 @@
+import numpy as np
+
+
+class RoleIndex:
+    """
+    Required skills of every role stored as a sparse (role, skill id) incidence list over
+    one shared skill vocabulary. Scoring a resume against all roles is a single
+    np.bincount over that list instead of one analyze_skill_match call per role.
+    """
+
+    def __init__(self, role_skills: dict, normalize=str.lower, display=str):
+        self.normalize = normalize
+        self.display = display
+        self.roles = list(role_skills)
+        self.role_skills = []  # per role: {normalized: display name}
+        self.vocab = {}
+
+        skill_ids, owners = [], []
+        for role_id, skills in enumerate(role_skills.values()):
+            normalized = {normalize(s): display(s) for s in skills or []}
+            self.role_skills.append(normalized)
+            for norm in normalized:
+                skill_ids.append(self.vocab.setdefault(norm, len(self.vocab)))
+                owners.append(role_id)
+
+        self.skill_ids = np.asarray(skill_ids, dtype=np.int32)
+        self.owners = np.asarray(owners, dtype=np.int32)
+        self.required_counts = np.bincount(self.owners, minlength=len(self.roles))
+        # 100 / required count, 0 for roles without skills, so a score is one multiply
+        self.percent_per_skill = np.zeros(len(self.roles), dtype=np.float64)
+        np.divide(100.0, self.required_counts, out=self.percent_per_skill, where=self.required_counts > 0)
+
+    def __len__(self):
+        return len(self.roles)
+
+    def match_percentages(self, resume_skills) -> np.ndarray:
+        has_skill = np.zeros(len(self.vocab), dtype=bool)
+        for skill in resume_skills or []:
+            skill_id = self.vocab.get(self.normalize(skill))
+            if skill_id is not None:
+                has_skill[skill_id] = True
+
+        # Only the (role, skill) pairs the resume covers are counted
+        matched = np.bincount(self.owners[has_skill[self.skill_ids]], minlength=len(self.roles))
+        return np.round(matched * self.percent_per_skill, 2)
+
+    def rank(self, resume_skills, top_k: int = None) -> list:
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        percentages = self.match_percentages(resume_skills)
+        if top_k is not None and top_k < len(self.roles):
+            top = np.argpartition(-percentages, top_k - 1)[:top_k]
+            order = top[np.argsort(-percentages[top], kind="stable")]
+        else:
+            order = np.argsort(-percentages, kind="stable")
+
+        # Skill details only for the roles actually returned
+        resume_map = {self.normalize(s): self.display(s) for s in resume_skills or []}
+        ranked = []
+        for role_id in order.tolist():
+            required = self.role_skills[role_id]
+            ranked.append({
+                "job_role": self.roles[role_id],
+                "match_percentage": float(percentages[role_id]),
+                "matched_skills": [resume_map[norm] for norm in required if norm in resume_map],
+                "missing_skills": [name for norm, name in required.items() if norm not in resume_map],
+            })
+        return ranked
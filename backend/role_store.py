@@ -0,0 +1,269 @@
+import difflib
+import json
+import re
+import sqlite3
+import sys
+import threading
+from collections import Counter
+
+# Fuzzy suggestions below this similarity (difflib ratio of the normalized names) are not returned
+SUGGEST_MIN_SCORE = 0.5
+# Candidates sharing the most searched trigrams with the query, re-scored with difflib
+FUZZY_CANDIDATES = 50
+# Only the rarest trigrams of a query are searched; common ones ("eng", "er ") match most roles.
+# Rare trigrams are added until they cover FUZZY_MAX_POSTINGS rows, keeping at least FUZZY_MIN_TRIGRAMS
+FUZZY_MIN_TRIGRAMS = 4
+FUZZY_MAX_POSTINGS = 2000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS roles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL,
+    skills TEXT,
+    keywords TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS roles_fts USING fts5(
+    name_key, content='roles', content_rowid='id', tokenize='trigram'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS roles_vocab USING fts5vocab(roles_fts, row);
+CREATE TRIGGER IF NOT EXISTS roles_ai AFTER INSERT ON roles BEGIN
+    INSERT INTO roles_fts(rowid, name_key) VALUES (new.id, new.name_key);
+END;
+CREATE TRIGGER IF NOT EXISTS roles_ad AFTER DELETE ON roles BEGIN
+    INSERT INTO roles_fts(roles_fts, rowid, name_key) VALUES ('delete', old.id, old.name_key);
+END;
+CREATE TRIGGER IF NOT EXISTS roles_au AFTER UPDATE OF name_key ON roles BEGIN
+    INSERT INTO roles_fts(roles_fts, rowid, name_key) VALUES ('delete', old.id, old.name_key);
+    INSERT INTO roles_fts(rowid, name_key) VALUES (new.id, new.name_key);
+END;
+"""
+
+
+# Function to normalize a role name for lookups ("  senior Software-Developer" -> "senior software developer")
+def normalize_role(name: str) -> str:
+    return " ".join(re.sub(r"[^\w+#]+", " ", name.lower()).split())
+
+
+# Function to quote a trigram as an FTS5 phrase
+def _fts_phrase(trigram: str) -> str:
+    return '"' + trigram.replace('"', '""') + '"'
+
+
+class RoleStore:
+    """
+    Job descriptions in a SQLite file, with each role's precomputed skills and ATS
+    keywords stored next to its text. Role names are looked up exactly through a unique
+    normalized key, by prefix through the same index, and fuzzily through an FTS5
+    trigram index: the query's rarest trigrams select candidates by overlap, which are
+    then re-ranked with difflib.
+
+    read_only=True opens an existing file without writing to it (no pragmas, no schema),
+    so a store built ahead of time can be served from a read-only mount.
+    """
+
+    def __init__(self, path: str = ":memory:", read_only: bool = False):
+        self.path = path
+        self._lock = threading.Lock()
+        if read_only:
+            self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=5, check_same_thread=False,
+                                         isolation_level=None)
+        else:
+            self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        # Writes through this store; data_version counts commits from other connections
+        self._writes = 0
+        # Trigram document frequencies, loaded on the first fuzzy query after a write
+        self._trigram_counts = None
+        self._trigram_generation = None
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM roles").fetchone()[0]
+
+    def _generation(self) -> tuple:
+        return self._writes, self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    # Function to get a value that changes whenever roles are written, here or by another process
+    def generation(self) -> tuple:
+        with self._lock:
+            return self._generation()
+
+    # Function to insert or replace roles given as {"name", "description", "skills", "keywords"} dicts
+    def add_roles(self, roles, replace: bool = True) -> int:
+        """With replace=False, roles whose name is already stored are left untouched."""
+        rows = [
+            (
+                role["name"],
+                normalize_role(role["name"]),
+                role["description"],
+                json.dumps(role["skills"]) if role.get("skills") is not None else None,
+                json.dumps(role["keywords"]) if role.get("keywords") is not None else None,
+            )
+            for role in roles
+        ]
+        conflict = ("DO UPDATE SET name = excluded.name, description = excluded.description, "
+                    "skills = excluded.skills, keywords = excluded.keywords") if replace else "DO NOTHING"
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO roles (name, name_key, description, skills, keywords) VALUES (?, ?, ?, ?, ?) "
+                    f"ON CONFLICT(name_key) {conflict}",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._writes += 1
+        return len(rows)
+
+    # Function to bulk import roles from a JSONL file, one {"name", "description", ...} object per line
+    def import_jsonl(self, path: str, derive_skills=None, derive_keywords=None, batch_size: int = 1000) -> int:
+        """
+        "role" is accepted in place of "name". Lines without "skills" or "keywords" get
+        them from derive_skills(description) / derive_keywords(description) when given,
+        so the derivation happens once here instead of on every request.
+        """
+        imported = 0
+        batch = []
+        with open(path, encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                    role = {"name": item.get("name") or item["role"], "description": item["description"]}
+                except (ValueError, KeyError) as exc:
+                    raise ValueError(f"{path}:{line_number}: expected a JSON object with a name and a description") from exc
+                role["skills"] = item.get("skills")
+                if role["skills"] is None and derive_skills is not None:
+                    role["skills"] = derive_skills(role["description"])
+                role["keywords"] = item.get("keywords")
+                if role["keywords"] is None and derive_keywords is not None:
+                    role["keywords"] = derive_keywords(role["description"])
+                batch.append(role)
+                if len(batch) >= batch_size:
+                    imported += self.add_roles(batch)
+                    batch = []
+        if batch:
+            imported += self.add_roles(batch)
+        return imported
+
+    def _role(self, row) -> dict:
+        name, description, skills, keywords = row
+        return {
+            "name": name,
+            "description": description,
+            "skills": json.loads(skills) if skills is not None else None,
+            "keywords": json.loads(keywords) if keywords is not None else None,
+        }
+
+    # Function to get a role by its name, ignoring case, spacing and punctuation
+    def get(self, name: str) -> dict:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, description, skills, keywords FROM roles WHERE name_key = ?", (normalize_role(name),)
+            ).fetchone()
+        return self._role(row) if row else None
+
+    # Function to pick the query trigrams to search: the rarest ones, within the postings budget
+    def _rare_trigrams(self, key: str) -> list:
+        generation = self._generation()
+        if self._trigram_generation != generation:
+            self._trigram_counts = dict(self._conn.execute("SELECT term, doc FROM roles_vocab").fetchall())
+            self._trigram_generation = generation
+        counts = self._trigram_counts
+        trigrams = {key[i:i + 3] for i in range(len(key) - 2)}
+        selected, postings = [], 0
+        for trigram in sorted((t for t in trigrams if t in counts), key=lambda t: (counts[t], t)):
+            if len(selected) >= FUZZY_MIN_TRIGRAMS and postings + counts[trigram] > FUZZY_MAX_POSTINGS:
+                break
+            selected.append(trigram)
+            postings += counts[trigram]
+        return selected
+
+    # Function to find the stored names closest to a (possibly misspelled) name, best first
+    def _fuzzy(self, key: str, limit: int, min_score: float) -> list:
+        if len(key) < 3:
+            return []
+        with self._lock:
+            overlap = Counter()
+            for trigram in self._rare_trigrams(key):
+                overlap.update(rowid for (rowid,) in self._conn.execute(
+                    "SELECT rowid FROM roles_fts WHERE roles_fts MATCH ?", (_fts_phrase(trigram),)
+                ))
+            candidates = [rowid for rowid, _ in overlap.most_common(FUZZY_CANDIDATES)]
+            placeholders = ", ".join("?" * len(candidates))
+            rows = self._conn.execute(
+                f"SELECT name, name_key FROM roles WHERE id IN ({placeholders})", candidates
+            ).fetchall() if candidates else []
+        # SequenceMatcher caches its analysis of seq2, and quick_ratio bounds ratio from above
+        matcher = difflib.SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(key)
+        scored = []
+        for name, name_key in rows:
+            matcher.set_seq1(name_key)
+            if matcher.quick_ratio() >= min_score:
+                score = matcher.ratio()
+                if score >= min_score:
+                    scored.append((score, name))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored[:limit]
+
+    # Function to suggest role names for a partial or misspelled query (prefix matches first)
+    def search(self, query: str, limit: int = 10) -> list:
+        """Returns [{"name", "score"}]; prefix matches score 1.0, fuzzy ones their similarity."""
+        key = normalize_role(query)
+        if not key:
+            return []
+        with self._lock:
+            prefixed = self._conn.execute(
+                "SELECT name FROM roles WHERE name_key >= ? AND name_key < ? ORDER BY name_key LIMIT ?",
+                (key, key + "\U0010ffff", limit),
+            ).fetchall()
+        results = [{"name": name, "score": 1.0} for (name,) in prefixed]
+        if len(results) < limit:
+            seen = {result["name"] for result in results}
+            results.extend(
+                {"name": name, "score": round(score, 3)}
+                for score, name in self._fuzzy(key, limit, SUGGEST_MIN_SCORE)
+                if name not in seen
+            )
+        return results[:limit]
+
+    # Function to get {role: skills} for every role whose skills are stored
+    def role_skills(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT name, skills FROM roles WHERE skills IS NOT NULL").fetchall()
+        return {name: json.loads(skills) for name, skills in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Function to build a role store file from JSONL, deriving skills and keywords with the request-path code
+def main(argv: list) -> int:
+    """The built-in roles are seeded too, and the file is left in rollback-journal mode so it opens read-only."""
+    if len(argv) != 2:
+        print("usage: python role_store.py ROLES.jsonl ROLES.sqlite3")
+        return 2
+    import core
+
+    store = RoleStore(argv[1])
+    count = store.import_jsonl(argv[0], core.extract_job_skills, core.extract_ats_keywords)
+    store.add_roles(core.builtin_roles(), replace=False)
+    store._conn.execute("PRAGMA journal_mode=DELETE")
+    print(f"Imported {count} roles into {argv[1]} ({len(store)} stored)")
+    store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,100 @@
+import re
+
+import numpy as np
+
+from cache import LRUCache
+
+_WORDS = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_NO_VECTOR = object()
+
+
+# Function to adapt a spaCy model's vector table into a word -> vector lookup (None when the word has no vector)
+def spacy_word_vectors(nlp) -> tuple:
+    """Returns (lookup, dim); dim is 0 for models without vectors, such as blank or "sm" pipelines."""
+    vocab = nlp.vocab
+    dim = vocab.vectors.shape[1] if vocab.vectors.shape[0] else 0
+
+    def lookup(word: str):
+        return vocab.get_vector(word) if vocab.has_vector(word) else None
+
+    return lookup, dim
+
+
+class SkillVectors:
+    """
+    Unit-length skill vectors (the mean of the word vectors of a skill's name) for
+    cosine similarity by matrix product. Vocabulary skills are embedded once into one
+    matrix; other skill texts, e.g. NER entities from job descriptions, are embedded
+    on first use and cached.
+    """
+
+    def __init__(self, word_vector, dim: int, vocabulary: dict = None, cache_size: int = 4096):
+        self.word_vector = word_vector
+        self.dim = dim
+        self.index = {}
+        rows = []
+        # vocabulary: {key: text to embed}, e.g. canonical id -> display name
+        for key, text in (vocabulary or {}).items():
+            vector = self.embed(text)
+            if vector is not None:
+                self.index[key] = len(rows)
+                rows.append(vector)
+        self.matrix = np.vstack(rows) if rows else np.zeros((0, dim), dtype=np.float32)
+        self.cache = LRUCache(max_entries=cache_size)
+
+    # Function to embed a skill text as the normalized mean of its word vectors (None without any known word)
+    def embed(self, text: str):
+        if not self.dim:
+            return None
+        vectors = [vector for vector in map(self.word_vector, _WORDS.findall(text.lower())) if vector is not None]
+        if not vectors:
+            return None
+        mean = np.mean(vectors, axis=0, dtype=np.float32)
+        norm = np.linalg.norm(mean)
+        return mean / norm if norm else None
+
+    def vector(self, key: str, text: str):
+        row = self.index.get(key)
+        if row is not None:
+            return self.matrix[row]
+        vector = self.cache.get(key, _NO_VECTOR)
+        if vector is _NO_VECTOR:
+            vector = self.embed(text)
+            self.cache.set(key, vector)
+        return vector
+
+    # Function to get the cosine similarity of every left skill with every right skill, as {key: text} maps
+    def similarity(self, left: dict, right: dict) -> np.ndarray:
+        """Skills without a vector get a similarity of 0 with everything."""
+        def stack(skills: dict) -> np.ndarray:
+            matrix = np.zeros((len(skills), self.dim), dtype=np.float32)
+            for row, (key, text) in enumerate(skills.items()):
+                vector = self.vector(key, text)
+                if vector is not None:
+                    matrix[row] = vector
+            return matrix
+
+        if not left or not right or not self.dim:
+            return np.zeros((len(left), len(right)), dtype=np.float32)
+        return stack(left) @ stack(right).T
+
+
+# Function to pair each unmatched job skill with its most similar resume skill above the threshold
+def semantic_matches(vectors: SkillVectors, job_skills: dict, resume_skills: dict, threshold: float) -> list:
+    """
+    job_skills and resume_skills map skill keys to display text. Returns
+    [{"job_skill", "resume_skill", "similarity"}], most similar first.
+    """
+    similarity = vectors.similarity(job_skills, resume_skills)
+    if not similarity.size:
+        return []
+    best = similarity.argmax(axis=1)
+    scores = similarity[np.arange(len(best)), best]
+    job_texts, resume_texts = list(job_skills.values()), list(resume_skills.values())
+    matches = [
+        {"job_skill": job_texts[row], "resume_skill": resume_texts[column], "similarity": round(float(score), 3)}
+        for row, (column, score) in enumerate(zip(best.tolist(), scores.tolist()))
+        if score >= threshold
+    ]
+    matches.sort(key=lambda match: -match["similarity"])
+    return matches
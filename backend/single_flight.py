@@ -0,0 +1,40 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls by key: the first caller starts the work as a task and
+    later callers with the same key share that task until it finishes, so N identical
+    requests make one backend call. Callers wait through asyncio.shield, so one caller
+    giving up (timeout, client gone) never cancels the work for the others, and an
+    error reaches every caller. Finished keys are forgotten; caching results is left
+    to the caller.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._inflight)
+
+    # Function to get the shared future for key, starting start() if nothing is in flight
+    def future(self, key, start) -> asyncio.Future:
+        future = self._inflight.get(key)
+        # A task left over from another (closed) event loop cannot be awaited here
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            future = asyncio.ensure_future(start())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        return future
+
+    def _forget(self, key, done):
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
+
+    async def do(self, key, start):
+        return await asyncio.shield(self.future(key, start))
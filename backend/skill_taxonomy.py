@@ -0,0 +1,160 @@
+import functools
+import json
+import re
+import sys
+
+import marisa_trie
+
+# Key prefixes inside the trie: plain surface forms are matched in text; the
+# prefixed entries are only looked up directly and never start a word
+_NAME_PREFIX = "\x01"
+_COMPACT_PREFIX = "\x02"
+# Forms that are also ordinary English words ("go", "spring") map to the one spelling
+# that counts in a job description ("Go"), or to nothing when the bare form never does
+_WORD_PREFIX = "\x03"
+# Positions in a text where a skill may start (not glued to a preceding word character)
+_WORD_START = re.compile(r"(?<!\w)[\w.#+]")
+
+
+# Function to get the path of the forms trie saved next to a compiled taxonomy
+def _forms_path(path: str) -> str:
+    return path[:-len(".marisa")] + ".forms.marisa"
+
+
+# Function to normalize a skill surface form ("  Node.JS " -> "node.js")
+def normalize_form(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+# Function to drop separators from a form, so "Node JS", "node-js" and "nodejs" meet
+def compact_form(text: str) -> str:
+    return re.sub(r"[^\w+#]", "", text.lower())
+
+
+class SkillTaxonomy:
+    """
+    Canonical skills with their aliases and abbreviations ("k8s" -> "kubernetes"),
+    compiled into marisa-tries: a key-only trie of surface forms, scanned over texts,
+    and a BytesTrie mapping each form to its canonical id and each id to its display
+    name. Both can be saved once and memory-mapped by every worker, so a 50k-skill
+    taxonomy costs a few MB of pages shared across the host.
+
+    Entries may list "cased_forms" (["Go"]: in a job description the form only counts
+    with this exact spelling) and "resume_forms" (["lambda"]: the form only counts on a
+    resume), so words like "go to market" or "in spring" are not read as skills.
+    """
+
+    def __init__(self, trie: marisa_trie.BytesTrie, forms: marisa_trie.Trie):
+        self.trie = trie
+        self.forms = forms
+        self.max_form_length = max((len(form) for form in forms.iterkeys()), default=0)
+        self.word_forms = {key[len(_WORD_PREFIX):]: value.decode("utf-8") for key, value in trie.items(_WORD_PREFIX)}
+        self.canonical = functools.lru_cache(maxsize=65536)(self._canonical)
+
+    # Function to compile taxonomy entries [{"id", "name", "aliases"}] into a trie
+    @classmethod
+    def from_entries(cls, entries) -> "SkillTaxonomy":
+        """The first entry to claim a form keeps it; ids are normalized like any other form."""
+        records = {}
+        compact = {}
+        for entry in entries:
+            skill_id = normalize_form(entry["id"])
+            records.setdefault(_NAME_PREFIX + skill_id, entry.get("name") or entry["id"])
+            for spelling in entry.get("cased_forms") or []:
+                records.setdefault(_WORD_PREFIX + normalize_form(spelling), spelling.strip())
+            for form in entry.get("resume_forms") or []:
+                records.setdefault(_WORD_PREFIX + normalize_form(form), "")
+            for form in [entry["id"], entry.get("name") or ""] + list(entry.get("aliases") or []):
+                form = normalize_form(form)
+                if form:
+                    records.setdefault(form, skill_id)
+                    compact.setdefault(_COMPACT_PREFIX + compact_form(form), skill_id)
+        forms = marisa_trie.Trie(key for key in records if key[0] not in (_NAME_PREFIX, _WORD_PREFIX))
+        records.update((key, skill_id) for key, skill_id in compact.items() if key not in records)
+        return cls(marisa_trie.BytesTrie((key, value.encode("utf-8")) for key, value in records.items()), forms)
+
+    # Function to load a taxonomy: a compiled .marisa file (and its .forms sibling) is memory-mapped, a JSONL file is compiled
+    @classmethod
+    def load(cls, path: str) -> "SkillTaxonomy":
+        if path.endswith(".marisa"):
+            trie, forms = marisa_trie.BytesTrie(), marisa_trie.Trie()
+            trie.mmap(path)
+            forms.mmap(_forms_path(path))
+            return cls(trie, forms)
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_entries(json.loads(line) for line in handle if line.strip())
+
+    def save(self, path: str):
+        self.trie.save(path)
+        self.forms.save(_forms_path(path))
+
+    def __len__(self):
+        return len(self.trie.keys(_NAME_PREFIX))
+
+    def _value(self, key: str) -> str:
+        values = self.trie.get(key)
+        return values[0].decode("utf-8") if values else None
+
+    def _canonical(self, skill: str) -> str:
+        form = normalize_form(skill)
+        return self._value(form) or self._value(_COMPACT_PREFIX + compact_form(form))
+
+    # Function to get the display name of a canonical id ("nodejs" -> "Node.js")
+    def name(self, skill_id: str) -> str:
+        return self._value(_NAME_PREFIX + skill_id) or skill_id
+
+    # Function to list every canonical id
+    def ids(self) -> list:
+        return sorted(key[len(_NAME_PREFIX):] for key in self.trie.iterkeys(_NAME_PREFIX))
+
+    # Function to check that a spelling of a form may stand for a skill in a job description
+    def allows(self, spelling: str) -> bool:
+        allowed = self.word_forms.get(normalize_form(spelling))
+        return allowed is None or allowed == spelling.strip()
+
+    # Function to find the canonical ids of every skill mentioned in a text
+    def find(self, text: str, job: bool = False) -> set:
+        """
+        A form counts when it is not glued to word characters on either side, and the
+        longest form at a position wins: "docker-compose" and "apache kafka" do not
+        also report "docker" and "apache". With job=True (job descriptions) the
+        cased_forms and resume_forms rules apply.
+        """
+        lower = text.lower()
+        # Spellings are checked on the original text, which lower() rarely resizes
+        original = text if len(text) == len(lower) else lower
+        found = set()
+        prefixes = self.forms.prefixes
+        max_length = self.max_form_length
+        word_forms = self.word_forms if job else {}
+        covered = 0
+        for start in _WORD_START.finditer(lower):
+            position = start.start()
+            if position < covered:
+                continue
+            longest = None
+            for form in prefixes(lower[position:position + max_length + 1]):
+                end = position + len(form)
+                if end == len(lower) or not (lower[end].isalnum() or lower[end] == "_"):
+                    if form in word_forms and original[position:end] != word_forms[form]:
+                        continue
+                    longest = form
+            if longest is not None:
+                found.add(self._value(longest))
+                covered = position + len(longest)
+        return found
+
+
+# Function to compile a JSONL taxonomy into a .marisa file that workers memory-map
+def main(argv: list) -> int:
+    if len(argv) != 2 or not argv[1].endswith(".marisa"):
+        print("usage: python skill_taxonomy.py SKILLS.jsonl SKILLS.marisa")
+        return 2
+    taxonomy = SkillTaxonomy.load(argv[0])
+    taxonomy.save(argv[1])
+    print(f"Compiled {len(taxonomy)} skills ({len(taxonomy.forms)} forms) into {argv[1]} and {_forms_path(argv[1])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,159 +1,122 @@
 #!/usr/bin/env python3
 """
 Test script to demonstrate ATS score calculation logic
-This shows how the ATS compatibility score is calculated independently from skill matching
+This shows how the ATS compatibility score is calculated independently from skill matching.
+The demo walks the rule tables one rule at a time; the tests check that its totals and
+grade agree with ats_engine.score_ats and core.get_ats_grade.
 """
 
-def calculate_ats_score_demo(resume_text, job_description):
+import ats_engine
+import core
+
+SAMPLE_RESUME = """
+John Doe
+Email: john.doe@email.com
+Phone: (555) 123-4567
+
+SUMMARY
+Experienced software developer with 5 years of experience in Python, JavaScript, and React.
+
+EXPERIENCE
+• Developed web applications using Python and Django
+• Managed a team of 3 developers
+• Led implementation of new features
+• Created REST APIs for mobile applications
+
+EDUCATION
+Bachelor's Degree in Computer Science
+Master's Degree in Software Engineering
+
+SKILLS
+Python, JavaScript, React, Node.js, SQL, AWS, Docker
+"""
+
+SAMPLE_JOB = """
+We are looking for a Senior Software Developer with experience in Python, JavaScript, and React.
+The ideal candidate should have knowledge of cloud technologies like AWS and Docker.
+Proficiency in database management and API development is required.
+"""
+
+
+def calculate_ats_score_demo(resume_text, job_description, verbose=True):
     """
-    Demo version of ATS score calculation (without external dependencies)
+    Demo version of ATS score calculation (without external dependencies).
+    Walks the same rule tables the backend scores with and explains every rule.
     """
+    say = print if verbose else (lambda *args: None)
     resume_text = resume_text.lower()
     job_description_lower = job_description.lower()
     
-    print("=== ATS SCORE CALCULATION DEMO ===")
-    print(f"Resume text: {resume_text[:100]}...")
-    print(f"Job description: {job_description_lower[:100]}...")
-    print()
+    say("=== ATS SCORE CALCULATION DEMO ===")
+    say(f"Resume text: {resume_text[:100]}...")
+    say(f"Job description: {job_description_lower[:100]}...")
+    say()
     
-    # 1. Resume Structure Score (35% weight)
-    print("1. RESUME STRUCTURE SCORE (35% weight):")
+    # 1. Resume Structure Score
+    say(f"1. RESUME STRUCTURE SCORE ({ats_engine.ATS_WEIGHTS['structure']:.0%} weight):")
     structure_score = 0
-    essential_sections = ["experience", "education", "skills", "summary", "objective", "contact", "phone", "email"]
-    
-    for section in essential_sections:
+    for section in ats_engine.SECTION_TERMS:
         if section in resume_text:
-            structure_score += 12.5
-            print(f"   ✓ Found '{section}' section (+12.5 points)")
+            structure_score += ats_engine.SECTION_POINTS
+            say(f"   ✓ Found '{section}' section (+{ats_engine.SECTION_POINTS} points)")
         else:
-            print(f"   ✗ Missing '{section}' section")
-    
-    print(f"   Structure Score: {structure_score}/100")
-    print()
+            say(f"   ✗ Missing '{section}' section")
+    say(f"   Structure Score: {structure_score}/100")
+    say()
     
-    # 2. ATS-Friendly Formatting Score (25% weight)
-    print("2. ATS-FRIENDLY FORMATTING SCORE (25% weight):")
+    # 2. ATS-Friendly Formatting Score
+    say(f"2. ATS-FRIENDLY FORMATTING SCORE ({ats_engine.ATS_WEIGHTS['formatting']:.0%} weight):")
     formatting_score = 0
-    
-    # Check for bullet points
-    if "•" in resume_text or "-" in resume_text:
-        formatting_score += 20
-        print("   ✓ Found bullet points (+20 points)")
-    else:
-        print("   ✗ No bullet points found")
-    
-    # Check for action words
-    action_words = ["years", "experience", "worked"]
-    if any(word in resume_text for word in action_words):
-        formatting_score += 20
-        print("   ✓ Found action words (+20 points)")
-    else:
-        print("   ✗ No action words found")
-    
-    # Check for education keywords
-    education_keywords = ["bachelor", "master", "degree", "certification"]
-    if any(word in resume_text for word in education_keywords):
-        formatting_score += 20
-        print("   ✓ Found education keywords (+20 points)")
-    else:
-        print("   ✗ No education keywords found")
-    
-    # Check for action verbs
-    action_verbs = ["developed", "managed", "led", "created", "implemented"]
-    if any(word in resume_text for word in action_verbs):
-        formatting_score += 20
-        print("   ✓ Found action verbs (+20 points)")
-    else:
-        print("   ✗ No action verbs found")
-    
-    # Check for quantified achievements
-    if any(char.isdigit() for char in resume_text):
-        formatting_score += 20
-        print("   ✓ Found quantified achievements (+20 points)")
+    for name, terms, points in ats_engine.FORMATTING_RULES:
+        if any(term in resume_text for term in terms):
+            formatting_score += points
+            say(f"   ✓ Found {name} (+{points} points)")
+        else:
+            say(f"   ✗ No {name} found")
+    if ats_engine.has_digit(resume_text):
+        formatting_score += ats_engine.QUANTIFIED_POINTS
+        say(f"   ✓ Found quantified achievements (+{ats_engine.QUANTIFIED_POINTS} points)")
     else:
-        print("   ✗ No quantified achievements found")
-    
-    print(f"   Formatting Score: {formatting_score}/100")
-    print()
-    
-    # 3. Job Description Keyword Density (25% weight)
-    print("3. KEYWORD DENSITY SCORE (25% weight):")
-    job_keywords = []
-    
-    # Extract important words from job description
-    important_words = ["experience", "skills", "knowledge", "proficiency", "expertise", "familiarity", "understanding"]
-    for word in important_words:
-        if word in job_description_lower:
-            job_keywords.append(word)
-    
-    # Add technical terms
-    tech_terms = ["python", "javascript", "react", "angular", "vue", "node", "sql", "database", "api", "cloud", "aws", "azure", "docker", "kubernetes"]
-    for term in tech_terms:
-        if term in job_description_lower:
-            job_keywords.append(term)
-    
-    print(f"   Keywords to match: {job_keywords}")
-    
+        say("   ✗ No quantified achievements found")
+    say(f"   Formatting Score: {formatting_score}/100")
+    say()
+    
+    # 3. Job Description Keyword Density
+    say(f"3. KEYWORD DENSITY SCORE ({ats_engine.ATS_WEIGHTS['keyword_density']:.0%} weight):")
+    job_keywords = ats_engine.extract_ats_keywords(job_description)
+    say(f"   Keywords to match: {job_keywords}")
     keyword_matches = sum(1 for keyword in job_keywords if keyword in resume_text)
-    keyword_density_score = min(100, (keyword_matches / len(job_keywords)) * 100) if job_keywords else 50
-    
-    print(f"   Matched keywords: {keyword_matches}/{len(job_keywords)}")
-    print(f"   Keyword Density Score: {keyword_density_score}/100")
-    print()
+    if job_keywords:
+        keyword_density_score = min(100, (keyword_matches / len(job_keywords)) * 100)
+    else:
+        keyword_density_score = ats_engine.NO_KEYWORDS_SCORE
+    say(f"   Matched keywords: {keyword_matches}/{len(job_keywords)}")
+    say(f"   Keyword Density Score: {keyword_density_score}/100")
+    say()
     
-    # 4. Contact Information Completeness (15% weight)
-    print("4. CONTACT INFORMATION SCORE (15% weight):")
+    # 4. Contact Information Completeness
+    say(f"4. CONTACT INFORMATION SCORE ({ats_engine.ATS_WEIGHTS['contact']:.0%} weight):")
     contact_score = 0
-    contact_elements = ["email", "phone", "linkedin", "github", "portfolio", "website"]
-    
-    for element in contact_elements:
+    for element in ats_engine.CONTACT_TERMS:
         if element in resume_text:
-            contact_score += 16.67
-            print(f"   ✓ Found '{element}' (+16.67 points)")
+            contact_score += ats_engine.CONTACT_POINTS
+            say(f"   ✓ Found '{element}' (+{ats_engine.CONTACT_POINTS} points)")
         else:
-            print(f"   ✗ Missing '{element}'")
-    
-    print(f"   Contact Score: {contact_score}/100")
-    print()
-    
-    # Calculate weighted ATS score
-    ats_score = (
-        structure_score * 0.35 +
-        formatting_score * 0.25 +
-        keyword_density_score * 0.25 +
-        contact_score * 0.15
-    )
-    
-    print("=== FINAL ATS SCORE CALCULATION ===")
-    print(f"Structure Score: {structure_score} × 0.35 = {structure_score * 0.35:.1f}")
-    print(f"Formatting Score: {formatting_score} × 0.25 = {formatting_score * 0.25:.1f}")
-    print(f"Keyword Density: {keyword_density_score} × 0.25 = {keyword_density_score * 0.25:.1f}")
-    print(f"Contact Score: {contact_score} × 0.15 = {contact_score * 0.15:.1f}")
-    print(f"TOTAL ATS SCORE: {ats_score:.1f}%")
-    
-    # Grade calculation
-    if ats_score >= 90:
-        grade = "A+"
-    elif ats_score >= 85:
-        grade = "A"
-    elif ats_score >= 80:
-        grade = "A-"
-    elif ats_score >= 75:
-        grade = "B+"
-    elif ats_score >= 70:
-        grade = "B"
-    elif ats_score >= 65:
-        grade = "B-"
-    elif ats_score >= 60:
-        grade = "C+"
-    elif ats_score >= 55:
-        grade = "C"
-    elif ats_score >= 50:
-        grade = "C-"
-    else:
-        grade = "D"
-    
-    print(f"ATS GRADE: {grade}")
+            say(f"   ✗ Missing '{element}'")
+    say(f"   Contact Score: {contact_score}/100")
+    say()
+    
+    scores = {"structure": structure_score, "formatting": formatting_score,
+              "keyword_density": keyword_density_score, "contact": contact_score}
+    ats_score = sum(scores[key] * weight for key, weight in ats_engine.ATS_WEIGHTS.items())
+    say("=== FINAL ATS SCORE CALCULATION ===")
+    for key, label in [("structure", "Structure Score"), ("formatting", "Formatting Score"), ("keyword_density", "Keyword Density"), ("contact", "Contact Score")]:
+        weight = ats_engine.ATS_WEIGHTS[key]
+        say(f"{label}: {scores[key]} × {weight} = {scores[key] * weight:.1f}")
+    say(f"TOTAL ATS SCORE: {ats_score:.1f}%")
+    
+    grade = core.get_ats_grade(ats_score)
+    say(f"ATS GRADE: {grade}")
     
     return {
         "overall_ats_score": round(ats_score, 1),
@@ -164,42 +127,37 @@ def calculate_ats_score_demo(resume_text, job_description):
         "ats_grade": grade
     }
 
+
+def test_demo_walk_agrees_with_the_engine():
+    resumes = [SAMPLE_RESUME, SAMPLE_RESUME.replace("5 years", "five years").replace("3 developers", "three"),
+               "Objective: contact me on linkedin or github.", ""]
+    for resume in resumes:
+        for job in (SAMPLE_JOB, ""):
+            demo = calculate_ats_score_demo(resume, job, verbose=False)
+            scores = ats_engine.score_ats(resume.lower(), ats_engine.extract_ats_keywords(job))
+            assert demo["structure_score"] == round(scores["structure"], 1)
+            assert demo["formatting_score"] == round(scores["formatting"], 1)
+            assert demo["keyword_density_score"] == round(scores["keyword_density"], 1)
+            assert demo["contact_score"] == round(scores["contact"], 1)
+            assert demo["overall_ats_score"] == round(scores["overall"], 1)
+            assert demo["ats_grade"] == core.get_ats_grade(scores["overall"])
+
+
+def test_sample_resume_scores():
+    result = calculate_ats_score_demo(SAMPLE_RESUME, SAMPLE_JOB, verbose=False)
+    assert result == {key: value for key, value in core.calculate_ats_score({"text": SAMPLE_RESUME}, SAMPLE_JOB).items()
+                      if key in result}
+    assert result["structure_score"] == 75.0 and result["formatting_score"] == 100 and result["contact_score"] == 33.3
+    assert result["overall_ats_score"] == 72.2
+    assert result["ats_grade"] == "B"
+
+
 # Test with sample data
 if __name__ == "__main__":
     print("Testing ATS Score Calculation Logic")
     print("=" * 50)
     
-    # Sample resume text
-    sample_resume = """
-    John Doe
-    Email: john.doe@email.com
-    Phone: (555) 123-4567
-    
-    SUMMARY
-    Experienced software developer with 5 years of experience in Python, JavaScript, and React.
-    
-    EXPERIENCE
-    • Developed web applications using Python and Django
-    • Managed a team of 3 developers
-    • Led implementation of new features
-    • Created REST APIs for mobile applications
-    
-    EDUCATION
-    Bachelor's Degree in Computer Science
-    Master's Degree in Software Engineering
-    
-    SKILLS
-    Python, JavaScript, React, Node.js, SQL, AWS, Docker
-    """
-    
-    # Sample job description
-    sample_job = """
-    We are looking for a Senior Software Developer with experience in Python, JavaScript, and React.
-    The ideal candidate should have knowledge of cloud technologies like AWS and Docker.
-    Proficiency in database management and API development is required.
-    """
-    
-    result = calculate_ats_score_demo(sample_resume, sample_job)
+    result = calculate_ats_score_demo(SAMPLE_RESUME, SAMPLE_JOB)
     
     print("\n" + "=" * 50)
     print("SUMMARY:")
@@ -0,0 +1,92 @@
+"""
+/analyze-resumes screens a batch against one role as NDJSON: one line per resume
+(a result, or an error line for a file that cannot be analyzed) and a final ranking
+line over the results.
+"""
+import asyncio
+import json
+
+import pytest
+
+import core
+import main
+from benchmarks.stubs import StubLLMModel
+
+RESUMES = {
+    b"%PDF-1.4 strong": {"text": "Python, Docker and AWS engineer", "skills": ["python", "docker", "aws"]},
+    b"%PDF-1.4 weak": {"text": "Python developer", "skills": ["python"]},
+}
+JOB_SKILLS = ["Python", "Docker", "AWS"]
+
+
+def _parse_resume(raw_bytes: bytes) -> dict:
+    if raw_bytes not in RESUMES:
+        raise core.ResumeParseError("Could not read the PDF.")
+    return RESUMES[raw_bytes]
+
+
+@pytest.fixture(autouse=True)
+def known_resumes(monkeypatch):
+    monkeypatch.setattr(main, "parse_resume", _parse_resume)
+    monkeypatch.setattr(main, "extract_job_skills", lambda jd: JOB_SKILLS)
+
+
+def _screen(app_client, files: list, **data) -> list:
+    async def scenario():
+        async with app_client() as client:
+            response = await client.post(
+                "/analyze-resumes",
+                files=[("files", (name, content, "application/pdf")) for name, content in files],
+                data={"job_role": "Platform Engineer", "job_description": "Python, Docker and AWS.", **data},
+            )
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            return [json.loads(line) for line in response.text.splitlines()]
+
+    return asyncio.run(scenario())
+
+
+def test_each_resume_gets_a_line_and_bad_files_an_error_line(app_client, monkeypatch):
+    monkeypatch.setattr(main, "MAX_UPLOAD_BYTES", 1024)
+    lines = _screen(app_client, [
+        ("weak.pdf", b"%PDF-1.4 weak"),
+        ("broken.pdf", b"not a pdf"),
+        ("huge.pdf", b"%PDF-1.4 " + b"x" * 4096),
+        ("strong.pdf", b"%PDF-1.4 strong"),
+    ])
+
+    items = {line["filename"]: line for line in lines[:-1]}
+    assert len(items) == 4
+    assert items["broken.pdf"] == {"type": "error", "index": 1, "filename": "broken.pdf", "error": "Could not read the PDF."}
+    assert items["huge.pdf"]["type"] == "error" and "upload limit" in items["huge.pdf"]["error"]
+    assert items["strong.pdf"]["type"] == "result" and items["strong.pdf"]["result"]["match_percentage"] == 100.0
+    assert sorted(items["weak.pdf"]["result"]["missing_skills"]) == ["AWS", "Docker"]
+    assert main.result_store.load(items["weak.pdf"]["result_id"]) == items["weak.pdf"]["result"]
+    # Without include_recommendations the LLM is never asked
+    assert items["weak.pdf"]["result"]["recommendations"] == []
+
+
+def test_final_line_ranks_the_results(app_client):
+    lines = _screen(app_client, [("weak.pdf", b"%PDF-1.4 weak"), ("broken.pdf", b"junk"), ("strong.pdf", b"%PDF-1.4 strong")])
+
+    ranking = lines[-1]
+    assert ranking["type"] == "ranking"
+    assert ranking["job_role"] == "Platform Engineer" and ranking["required_skills"] == JOB_SKILLS
+    assert [(row["rank"], row["index"], row["filename"]) for row in ranking["ranking"]] == [
+        (1, 2, "strong.pdf"), (2, 0, "weak.pdf")]
+    assert ranking["ranking"][0]["match_percentage"] == 100.0
+    assert ranking["ranking"][1]["match_percentage"] == 33.33
+
+
+def test_recommendations_fall_back_when_the_llm_budget_runs_out(app_client, llm_model, monkeypatch):
+    llm_model(StubLLMModel(delay_s=0.5))
+    monkeypatch.setattr(core, "LLM_BUDGET_SECONDS", 0.05)
+
+    lines = _screen(app_client, [("weak.pdf", b"%PDF-1.4 weak")], include_recommendations="true")
+
+    result = lines[0]["result"]
+    assert result["recommendations_source"] == "fallback"
+    assert result["recommendations"] == list(core.iter_recommendation_lines(
+        [core.template_recommendations({"matched_skills": ["Python"], "missing_skills": ["Docker", "AWS"]})]))
+    assert result["recommendations"][0] == "Add a personal project using AWS and publish it on GitHub"
+    assert lines[-1]["ranking"][0]["filename"] == "weak.pdf"
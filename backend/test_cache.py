@@ -0,0 +1,88 @@
+import time
+
+from cache import LRUCache, SQLiteCache, TieredCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_ttl_expires_entries():
+    cache = LRUCache(max_entries=10, ttl_seconds=0.05)
+    cache.set("a", "1")
+    assert cache.get("a") == "1"
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_respects_byte_budget():
+    cache = LRUCache(max_entries=100, max_bytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.set("c", b"12345")
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 10
+
+
+def test_disk_tier_survives_new_memory_tier(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    TieredCache(LRUCache(), SQLiteCache(path)).set("key", "cached recommendations")
+
+    restarted = TieredCache(LRUCache(), SQLiteCache(path))
+    assert restarted.get("key") == "cached recommendations"
+    assert restarted.memory.get("key") == "cached recommendations"  # promoted to memory
+    assert restarted.stats()["disk"]["hits"] == 1
+
+
+def test_disk_tier_caps_entries(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    for i in range(4):
+        cache.set(f"k{i}", i)
+        time.sleep(0.001)
+    assert len(cache) == 2
+    assert cache.get("k0") is None
+    assert cache.get("k3") == 3
+    assert cache.evictions == 2
+
+
+def test_result_store_shares_results_between_workers(tmp_path):
+    from result_store import ResultStore
+
+    path = str(tmp_path / "results.sqlite3")
+    worker_a = ResultStore(max_bytes=1024 * 1024, ttl_seconds=60, path=path)
+    worker_b = ResultStore(max_bytes=1024 * 1024, ttl_seconds=60, path=path)
+    result = {"match_percentage": 50.0, "matched_skills": ["python"] * 200}
+
+    result_id = worker_a.save(result)
+    assert worker_b.load(result_id) == result
+    assert worker_a.stats()["memory"]["bytes"] < len(str(result))  # stored compressed
+    assert worker_b.load("unknown-id") is None
+
+
+def test_identical_llm_requests_call_the_model_once(monkeypatch):
+    import core
+    from benchmarks.stubs import STUB_RECOMMENDATIONS, StubLLMModel
+
+    monkeypatch.setattr(core, "llm_cache", TieredCache(LRUCache()))
+    stub = StubLLMModel()
+    monkeypatch.setattr(core, "get_llm_model", lambda: stub)
+    job_description = core.job_descriptions_db["Data Scientist"]
+
+    first = core.generate_llm_recommendations(
+        {"skills": ["python", "sql"]}, job_description, {"matched_skills": ["python"], "missing_skills": ["AWS", "Docker"]})
+    # Same inputs in another order and spelling hit the cache
+    second = core.generate_llm_recommendations(
+        {"skills": ["SQL", "Python"]}, job_description, {"matched_skills": ["Python"], "missing_skills": ["docker", "aws"]})
+    assert first == second == STUB_RECOMMENDATIONS
+    assert stub.calls == 1
+    assert core.llm_cache.stats()["memory"]["hits"] == 1
@@ -0,0 +1,75 @@
+"""
+CPU stages run in a spawned process pool, and a worker that dies (a MuPDF segfault,
+an OOM kill) does not leave the service failing every later request: the broken pool
+is replaced and the call retried once.
+"""
+import asyncio
+import os
+import signal
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import core
+import executors
+
+
+def _crash(*args):
+    os._exit(1)  # dies the way a segfaulting or OOM-killed worker does, without cleanup
+
+
+def _crash_once(marker: str):
+    # The first worker to run this dies; the retry on the new pool succeeds
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return os.getpid()
+
+
+@pytest.fixture
+def cpu_pool(monkeypatch):
+    monkeypatch.setattr(executors, "CPU_WORKERS", 1)
+    executors.shutdown_pools()
+    yield
+    executors.shutdown_pools()
+
+
+def test_stages_run_in_spawned_workers(cpu_pool):
+    pool = executors.get_cpu_pool()
+    assert pool._mp_context.get_start_method() == "spawn"
+
+    async def scenario():
+        pid = await executors.run_cpu(os.getpid)
+        match = await executors.run_cpu(core.analyze_skill_match, {"skills": ["python", "k8s"]}, ["Python", "Kubernetes", "AWS"])
+        return pid, match
+
+    pid, match = asyncio.run(scenario())
+    assert pid != os.getpid()
+    assert match["missing_skills"] == ["AWS"] and match["match_percentage"] == 66.67
+
+
+def test_killed_worker_is_replaced(cpu_pool):
+    async def scenario():
+        first = await executors.run_cpu(os.getpid)
+        os.kill(first, signal.SIGKILL)
+        second = await executors.run_cpu(os.getpid)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert second != first
+
+
+def test_crash_during_a_call_is_retried_on_a_new_pool(cpu_pool, tmp_path):
+    broken = executors.get_cpu_pool()
+    pid = asyncio.run(executors.run_cpu(_crash_once, str(tmp_path / "crashed")))
+    assert pid != os.getpid()
+    assert executors.get_cpu_pool() is not broken
+
+
+def test_input_that_always_crashes_fails_only_its_own_request(cpu_pool):
+    async def scenario():
+        with pytest.raises(BrokenProcessPool):
+            await executors.run_cpu(_crash)
+        return await executors.run_cpu(os.getpid)
+
+    assert asyncio.run(scenario()) != os.getpid()
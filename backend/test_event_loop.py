@@ -0,0 +1,91 @@
+"""
+Checks that /analyze-resume keeps its blocking stages off the event loop:
+/health latency must stay flat while several analyses are in flight, and the
+result store (SQLite when shared between workers) is only used from the I/O pool.
+"""
+import time
+import asyncio
+import threading
+
+import main
+import executors
+
+CONCURRENT_ANALYSES = 8
+STAGE_DELAY_S = 0.3
+
+
+def _slow(result):
+    def stage(*args):
+        time.sleep(STAGE_DELAY_S)  # stands in for a blocking PyMuPDF / spaCy / Gemini call
+        return result
+    return stage
+
+
+async def _health_latency(client) -> float:
+    start = time.perf_counter()
+    response = await client.get("/health")
+    assert response.status_code == 200
+    return time.perf_counter() - start
+
+
+async def _run_load_test(app_client):
+    async with app_client() as client:
+        idle = [await _health_latency(client) for _ in range(5)]
+
+        analyses = [
+            asyncio.create_task(client.post(
+                "/analyze-resume",
+                files={"file": ("resume.pdf", b"%PDF-1.4 fake", "application/pdf")},
+                data={"job_role": "Software Developer"},
+            ))
+            for _ in range(CONCURRENT_ANALYSES)
+        ]
+        await asyncio.sleep(0.05)  # let the analyses reach their first blocking stage
+
+        loaded = []
+        while not all(task.done() for task in analyses):
+            loaded.append(await _health_latency(client))
+            await asyncio.sleep(0.02)
+
+        responses = await asyncio.gather(*analyses)
+    return idle, loaded, responses
+
+
+def test_health_stays_fast_during_concurrent_analyses(app_client, monkeypatch):
+    monkeypatch.setattr(executors, "IO_WORKERS", CONCURRENT_ANALYSES * 2)
+
+    monkeypatch.setattr(main, "parse_resume", _slow({"text": "python developer", "skills": ["python"]}))
+    monkeypatch.setattr(main, "extract_job_skills", _slow(["Python", "Docker"]))
+    monkeypatch.setattr(main, "calculate_ats_score", _slow({"overall_ats_score": 50.0}))
+    monkeypatch.setattr(main, "generate_llm_recommendations", _slow("Build a Docker project"))
+
+    idle, loaded, responses = asyncio.run(_run_load_test(app_client))
+
+    assert all(r.status_code == 200 for r in responses)
+    # Each analysis takes ~4 stages * STAGE_DELAY_S; a blocked loop would hold /health that long
+    assert len(loaded) >= 5
+    assert max(loaded) < STAGE_DELAY_S / 2
+    assert max(loaded) < max(idle) + 0.1
+
+
+def test_result_store_is_used_off_the_event_loop(api, monkeypatch):
+    monkeypatch.setattr(main, "parse_resume", lambda raw: {"text": "python developer", "skills": ["python"]})
+    monkeypatch.setattr(main, "generate_llm_recommendations", lambda *args: "1. Learn Docker")
+    threads = []
+
+    def on_thread(func):
+        def call(*args):
+            threads.append((func.__name__, threading.current_thread()))
+            return func(*args)
+        return call
+
+    monkeypatch.setattr(main.result_store, "save", on_thread(main.result_store.save))
+    monkeypatch.setattr(main.result_store, "load", on_thread(main.result_store.load))
+
+    analyzed = api("POST", "/analyze-resume", files={"file": ("resume.pdf", b"%PDF-1.4 fake", "application/pdf")},
+                   data={"job_role": "Software Developer"})
+    exported = api("GET", "/export-pdf", params={"result_id": analyzed.json()["result_id"]})
+
+    assert analyzed.status_code == 200 and exported.status_code == 200
+    assert [name for name, _ in threads] == ["save", "load"]
+    assert all(thread is not threading.main_thread() for _, thread in threads)
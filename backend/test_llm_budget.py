@@ -0,0 +1,86 @@
+"""
+/analyze-resume answers within the LLM latency budget: a slow or failing Gemini call
+gives template recommendations (recommendations_source "fallback"), and a late answer
+still warms the cache for the next identical request.
+"""
+import asyncio
+import time
+
+import pytest
+
+import core
+import main
+from benchmarks.stubs import StubLLMModel
+
+RESUME = {"text": "Python developer", "skills": ["python"]}
+
+
+class FailingLLMModel:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        raise RuntimeError("503 model overloaded")
+
+
+async def _analyze(client):
+    started = time.perf_counter()
+    response = await client.post(
+        "/analyze-resume",
+        files={"file": ("resume.pdf", b"%PDF-1.4 fake", "application/pdf")},
+        data={"job_role": "Software Developer"},
+    )
+    assert response.status_code == 200
+    return response.json()["result"], time.perf_counter() - started
+
+
+@pytest.fixture(autouse=True)
+def python_resume(monkeypatch):
+    monkeypatch.setattr(core, "LLM_RETRY_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(main, "parse_resume", lambda raw: RESUME)
+    monkeypatch.setattr(main, "extract_job_skills", lambda jd: ["Python", "Docker", "AWS"])
+
+
+def test_slow_llm_falls_back_and_late_answer_warms_cache(app_client, llm_model, monkeypatch):
+    stub = llm_model(StubLLMModel(delay_s=0.5))
+    monkeypatch.setattr(core, "LLM_BUDGET_SECONDS", 0.05)
+
+    async def scenario():
+        async with app_client() as client:
+            first, elapsed = await _analyze(client)
+            while main._late_llm_calls:
+                await asyncio.sleep(0.05)
+            second, _ = await _analyze(client)
+        return first, elapsed, second
+
+    first, elapsed, second = asyncio.run(scenario())
+    assert elapsed < 0.4
+    assert first["recommendations_source"] == "fallback"
+    assert first["recommendations"][0] == "Add a personal project using AWS and publish it on GitHub"  # from missing_skills
+    assert second["recommendations_source"] == "llm"
+    assert second["recommendations"][0].startswith("Add a personal project using Kubernetes")
+    assert stub.calls == 1
+
+
+def test_failing_llm_is_retried_then_falls_back(app_client, llm_model):
+    failing = llm_model(FailingLLMModel())
+
+    async def scenario():
+        async with app_client() as client:
+            return await _analyze(client)
+
+    result, _ = asyncio.run(scenario())
+    assert result["recommendations_source"] == "fallback"
+    assert failing.calls == core.LLM_RETRIES + 1
+
+
+def test_template_recommendations_are_categorized_like_llm_output():
+    text = core.template_recommendations({"missing_skills": ["Kubernetes", "AWS"], "matched_skills": ["Python"]})
+    lines = core.format_for_ui_and_pdf({"match_percentage": 0, "matched_skills": [], "missing_skills": []}, text)["recommendations"]
+    categories = []
+    for line in lines:
+        lower = line.lower()
+        categories.append(next(name for name, terms in core.CATEGORY_RULES.items() if any(t in lower for t in terms)))
+    assert categories == ["Project", "Certification", "Skill"]
+    assert "AWS" in lines[0] and "Kubernetes" in lines[1] and "Python" in lines[2]
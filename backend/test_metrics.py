@@ -0,0 +1,104 @@
+"""
+Stage timings reach the Server-Timing header and the /metrics histograms; request,
+error, LLM call and cache counters are exposed in the Prometheus text format.
+"""
+import asyncio
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+
+import main
+from metrics import MetricsRegistry, StageTimer
+
+
+def _metric(text: str, sample: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(sample + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_analyze_and_export_report_stage_timings(api, llm_model, monkeypatch):
+    stub = llm_model()
+    monkeypatch.setattr(main, "parse_resume", lambda raw: {"text": f"python developer {time.time()}", "skills": ["python"]})
+
+    before = api("GET", "/metrics").text
+    analyzed = api(
+        "POST", "/analyze-resume",
+        files={"file": ("resume.pdf", b"%PDF-1.4 fake", "application/pdf")},
+        data={"job_role": "Software Developer"},
+    )
+    exported = api("GET", "/export-pdf", params={"result_id": analyzed.json()["result_id"]})
+    missing = api("GET", "/export-pdf", params={"result_id": "unknown"})
+
+    assert analyzed.status_code == 200 and exported.status_code == 200 and missing.status_code == 404
+    stages = [entry.split(";")[0] for entry in analyzed.headers["server-timing"].split(", ")]
+    # Stages run as a graph, so they are listed in completion order
+    assert sorted(stages) == sorted(["read_upload", "parse_resume", "extract_job_skills", "skill_match", "ats_score",
+                                     "llm_recommendations", "format", "store_result"])
+    assert stages[-1] == "store_result"
+    assert "render_pdf;dur=" in exported.headers["server-timing"]
+
+    after = api("GET", "/metrics")
+    assert after.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = after.text
+    count = 'analysis_stage_duration_seconds_count{endpoint="analyze_resume",stage="llm_recommendations"}'
+    assert _metric(text, count) == _metric(before, count) + 1
+    assert 'analysis_stage_duration_seconds_bucket{endpoint="export_pdf",stage="render_pdf",le="+Inf"}' in text
+    requests = 'http_requests_total{path="/export-pdf",method="GET",status="404"}'
+    assert _metric(text, requests) == _metric(before, requests) + 1
+    assert _metric(text, 'llm_calls_total{outcome="ok"}') == _metric(before, 'llm_calls_total{outcome="ok"}') + 1
+    assert stub.calls == 1
+    assert 'cache_requests_total{cache="llm",tier="memory",result="miss"}' in text
+
+
+def test_request_counter_passes_streams_through():
+    assert all(middleware.cls is not BaseHTTPMiddleware for middleware in main.app.user_middleware)
+    forwarded = []
+    release = asyncio.Event()
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b"first\n", "more_body": True})
+        await release.wait()
+        await send({"type": "http.response.body", "body": b"last\n"})
+
+    async def send(message):
+        forwarded.append(message)
+        if message.get("body") == b"first\n":
+            release.set()  # the first chunk reached the client before the app finished
+
+    async def receive():
+        return {"type": "http.request"}
+
+    scope = {"type": "http", "method": "GET", "path": "/demo-stream"}
+    requests = 'http_requests_total{path="unmatched",method="GET",status="201"}'
+    before = _metric(main.REGISTRY.render(), requests)
+    asyncio.run(asyncio.wait_for(main.RequestCounter(streaming_app)(scope, receive, send), timeout=1))
+
+    assert [message.get("body") for message in forwarded] == [None, b"first\n", b"last\n"]
+    assert _metric(main.REGISTRY.render(), requests) == before + 1
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo.", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, stage="parse")
+
+    text = registry.render()
+    assert 'demo_seconds_bucket{stage="parse",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{stage="parse",le="1.0"} 2' in text
+    assert 'demo_seconds_bucket{stage="parse",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{stage="parse"} 3' in text
+    assert 'demo_seconds_sum{stage="parse"} 5.55' in text
+
+
+def test_stage_timer_overhead_is_negligible():
+    timer = StageTimer("overhead")
+    start = time.perf_counter()
+    for _ in range(10_000):
+        with timer.stage("noop"):
+            pass
+    per_stage_us = (time.perf_counter() - start) / 10_000 * 1e6
+    assert per_stage_us < 50
@@ -0,0 +1,81 @@
+"""
+Re-uploading the same resume (e.g. for another job role) is served from the parse
+cache: the upload is hashed while it is read, and PDF extraction is skipped.
+"""
+import asyncio
+import hashlib
+import io
+import time
+
+from starlette.datastructures import UploadFile
+
+import core
+import main
+from benchmarks.corpus import make_resume_pdf
+
+
+def test_digest_is_computed_while_reading(monkeypatch):
+    monkeypatch.setattr(main, "UPLOAD_CHUNK_BYTES", 1000)
+    raw = make_resume_pdf(pages=3)
+    upload = UploadFile(io.BytesIO(raw), filename="resume.pdf")
+    assert asyncio.run(main.read_upload(upload)) == (raw, hashlib.sha256(raw).hexdigest())
+
+
+def _stage_ms(response, stage: str) -> float:
+    for entry in response.headers["server-timing"].split(", "):
+        name, duration = entry.split(";dur=")
+        if name == stage:
+            return float(duration)
+    raise AssertionError(f"no {stage} in Server-Timing")
+
+
+def test_repeat_upload_skips_extraction(app_client, llm_model, monkeypatch):
+    llm_model()
+    core.warm_up(["nlp"])
+    parses = []
+
+    def counting_parse(raw_bytes):
+        parses.append(len(raw_bytes))
+        return core.parse_resume(raw_bytes)
+
+    monkeypatch.setattr(main, "parse_resume", counting_parse)
+    raw = make_resume_pdf(pages=20)
+    hits_before = core.PARSE_CACHE.hits
+
+    async def analyze_for_roles(roles):
+        async with app_client() as client:
+            return [
+                await client.post("/analyze-resume", files={"file": ("resume.pdf", raw, "application/pdf")},
+                                  data={"job_role": role})
+                for role in roles
+            ]
+
+    first, repeat, third = asyncio.run(analyze_for_roles(["Software Developer", "Data Scientist", "DevOps Engineer"]))
+
+    assert first.status_code == repeat.status_code == third.status_code == 200
+    assert len(parses) == 1
+    assert core.PARSE_CACHE.hits - hits_before == 2
+    # The repeat's parse stage is a cache lookup; only hashing during the read remains
+    hash_ms = min(_time_ms(lambda: hashlib.sha256(raw).hexdigest()) for _ in range(5))
+    assert _stage_ms(repeat, "parse_resume") < _stage_ms(first, "parse_resume") / 5
+    assert hash_ms < _stage_ms(first, "parse_resume") / 5
+
+
+def _time_ms(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def test_cache_is_bounded_by_bytes(monkeypatch):
+    small = core.LRUCache(max_entries=100, max_bytes=1000, sizeof=core._parsed_resume_size)
+    for i in range(10):
+        small.set(f"digest-{i}", {"text": "x" * 300, "skills": ["python"]})
+    assert small.stats()["bytes"] <= 1000
+    assert small.get("digest-0") is None and small.get("digest-9") is not None
+
+
+def test_parse_cache_metrics_are_exposed(api):
+    text = api("GET", "/metrics").text
+    assert 'cache_requests_total{cache="parse",tier="memory",result="hit"}' in text
+    assert 'cache_hit_ratio{cache="parse",tier="memory"}' in text
@@ -0,0 +1,124 @@
+"""
+PDF reports are rendered in memory: export_to_pdf returns the bytes and never writes
+a file, temporary or otherwise. /export-pdf serves them with a content ETag, answers
+If-None-Match with 304 and keeps rendered reports in a bounded cache.
+"""
+import builtins
+import io
+import os
+import tempfile
+
+import pytest
+
+from cache import LRUCache
+import core
+import main
+
+REPORT = {
+    "match_percentage": 50.0,
+    "matched_skills": ["python", "docker"],
+    "missing_skills": ["Kubernetes", "AWS"],
+    "recommendations": ["Add a personal project using Kubernetes and publish it on GitHub"],
+    "estimated_time_saved_minutes": 10,
+}
+
+
+@pytest.fixture
+def no_file_writes(monkeypatch):
+    core.ensure_fonts()  # registers the fonts (read only) outside the check
+    writes = []
+
+    def refuse(name):
+        def create(*args, **kwargs):
+            writes.append((name, args))
+            raise AssertionError(f"{name} called while rendering the PDF")
+        return create
+
+    for name in ("mkstemp", "mkdtemp", "NamedTemporaryFile", "TemporaryFile", "SpooledTemporaryFile"):
+        monkeypatch.setattr(tempfile, name, refuse(f"tempfile.{name}"))
+
+    real_open, real_os_open = builtins.open, os.open
+
+    def checked_open(file, mode="r", *args, **kwargs):
+        if any(flag in mode for flag in "wax+"):
+            writes.append(("open", file))
+            raise AssertionError(f"{file} opened for writing while rendering the PDF")
+        return real_open(file, mode, *args, **kwargs)
+
+    def checked_os_open(path, flags, *args, **kwargs):
+        if flags & (os.O_WRONLY | os.O_RDWR | os.O_CREAT):
+            writes.append(("os.open", path))
+            raise AssertionError(f"{path} opened for writing while rendering the PDF")
+        return real_os_open(path, flags, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", checked_open)
+    monkeypatch.setattr(io, "open", checked_open)
+    monkeypatch.setattr(os, "open", checked_os_open)
+    return writes
+
+
+def test_export_renders_in_memory_without_files(no_file_writes):
+    temp_dir = tempfile.gettempdir()
+    before = set(os.listdir(temp_dir))
+
+    pdf_bytes = core.export_to_pdf(REPORT)
+
+    assert isinstance(pdf_bytes, bytes) and pdf_bytes.startswith(b"%PDF")
+    assert no_file_writes == []
+    assert set(os.listdir(temp_dir)) == before
+
+
+@pytest.fixture
+def export_client(api, monkeypatch):
+    renders = []
+    monkeypatch.setattr(main, "export_to_pdf", lambda data: renders.append(data) or core.export_to_pdf(data))
+    monkeypatch.setattr(main, "pdf_report_cache", LRUCache(max_entries=2))
+
+    def export(result_id: str, if_none_match: str = None):
+        headers = {"If-None-Match": if_none_match} if if_none_match else {}
+        return api("GET", "/export-pdf", params={"result_id": result_id}, headers=headers)
+
+    return export, renders
+
+
+def test_export_etag_and_conditional_requests(export_client):
+    export, renders = export_client
+    result_id = main.result_store.save(REPORT)
+
+    first = export(result_id)
+    assert first.status_code == 200 and first.content.startswith(b"%PDF")
+    etag = first.headers["etag"]
+    assert etag == f'"{core.report_digest(REPORT)}"'
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    # Strong, weak, listed among others, and "*" all revalidate without a body
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        cached = export(result_id, if_none_match)
+        assert cached.status_code == 304 and cached.content == b""
+        assert cached.headers["etag"] == etag
+    assert export(result_id, '"stale"').status_code == 200
+
+    # The same content saved under another id has the same ETag and bytes
+    again = export(main.result_store.save(dict(REPORT)))
+    assert again.headers["etag"] == etag and again.content == first.content
+    assert len(renders) == 1
+
+
+def test_report_cache_hits_and_eviction(export_client):
+    export, renders = export_client
+    reports = [dict(REPORT, match_percentage=float(percent)) for percent in (10, 20, 30)]
+    ids = [main.result_store.save(report) for report in reports]
+
+    export(ids[0])
+    export(ids[1])
+    export(ids[0])
+    assert len(renders) == 2
+    assert main.pdf_report_cache.stats()["hits"] == 1
+
+    # A third report evicts the least recently used one (the second)
+    export(ids[2])
+    assert main.pdf_report_cache.evictions == 1
+    export(ids[0])
+    assert len(renders) == 3
+    export(ids[1])
+    assert renders[-1] == reports[1] and len(renders) == 4
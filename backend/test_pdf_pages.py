@@ -0,0 +1,144 @@
+"""
+Page-parallel extraction of large PDFs: pages come back in document order, the time
+budget applies to the whole document, the shared temp copy is always removed, CPU
+workers share PDF_PAGE_WORKERS instead of each starting that many, and a CPU worker
+that owns a page pool still exits on shutdown.
+"""
+import asyncio
+import os
+
+import fitz
+import pytest
+
+import core
+import executors
+import pdf_extract
+from pdf_extract import extract_pages_parallel, page_ranges
+
+PAGES = 30
+
+
+def _make_pdf(pages: int = PAGES) -> bytes:
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {i} of the portfolio: Python, Docker and Kubernetes")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _serial(raw: bytes) -> list:
+    with fitz.open(stream=raw, filetype="pdf") as doc:
+        return [page.get_text("text") for page in doc]
+
+
+@pytest.fixture
+def page_pool(monkeypatch, tmp_path):
+    monkeypatch.setattr(executors, "PAGE_WORKERS", 3)
+    # Shared copies go to a directory the test can watch instead of /dev/shm
+    monkeypatch.setattr(pdf_extract, "SHARED_DIR", str(tmp_path))
+    executors.shutdown_pools()
+    yield executors.get_page_pool()
+    executors.shutdown_pools()
+
+
+def test_page_ranges_cover_every_page_once():
+    assert page_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert page_ranges(2, 4) == [(0, 1), (1, 2)]
+    for pages, parts in [(1, 1), (24, 4), (97, 8)]:
+        ranges = page_ranges(pages, parts)
+        assert [page for start, stop in ranges for page in range(start, stop)] == list(range(pages))
+
+
+def test_pages_come_back_in_document_order(page_pool, tmp_path):
+    raw = _make_pdf()
+    pages = extract_pages_parallel(raw, PAGES, page_pool, executors.PAGE_WORKERS, budget_s=30)
+    assert pages == _serial(raw)
+    assert [page.split()[1] for page in pages] == [str(i) for i in range(PAGES)]
+    assert os.listdir(tmp_path) == []
+
+
+def test_parse_resume_uses_the_parallel_path_for_long_pdfs(page_pool, monkeypatch):
+    monkeypatch.setattr(core, "PDF_PARALLEL_MIN_PAGES", 24)
+    calls = []
+    monkeypatch.setattr(core, "extract_pages_parallel", lambda *args: calls.append(args) or extract_pages_parallel(*args))
+
+    raw = _make_pdf()
+    result = core.parse_resume(raw)
+    assert len(calls) == 1
+    assert result["text"] == "".join(page + "\n" for page in _serial(raw))
+    assert result["skills"] == ["docker", "kubernetes", "python"]
+    # Short documents stay on the single-threaded path
+    core.parse_resume(_make_pdf(3))
+    assert len(calls) == 1
+
+
+def test_deadline_raises_and_removes_the_shared_copy(page_pool, tmp_path, monkeypatch):
+    raw = _make_pdf()
+    with pytest.raises(TimeoutError):
+        extract_pages_parallel(raw, PAGES, page_pool, executors.PAGE_WORKERS, budget_s=0)
+    assert os.listdir(tmp_path) == []
+
+    monkeypatch.setattr(core, "PDF_PARALLEL_MIN_PAGES", 24)
+    monkeypatch.setattr(core, "PDF_EXTRACTION_BUDGET_S", 0)
+    with pytest.raises(core.ResumeTooLargeError, match="longer than"):
+        core.parse_resume(raw)
+    assert os.listdir(tmp_path) == []
+
+
+def test_shared_copy_is_removed_when_a_worker_fails(page_pool, tmp_path):
+    # A page count past the end makes the last range fail inside its worker
+    with pytest.raises(IndexError):
+        extract_pages_parallel(_make_pdf(), PAGES + 5, page_pool, executors.PAGE_WORKERS, budget_s=30)
+    assert os.listdir(tmp_path) == []
+
+
+def test_shared_copy_defaults_to_tmpfs():
+    if os.path.isdir("/dev/shm"):
+        assert pdf_extract.SHARED_DIR == "/dev/shm"
+
+
+def _page_pool_size() -> tuple:
+    pool = executors._page_pool
+    return executors.PAGE_WORKERS, len(pool._processes) if pool is not None else 0
+
+
+def test_cpu_workers_split_the_page_workers(monkeypatch):
+    monkeypatch.setattr(executors, "PAGE_WORKERS", 4)
+    for cpu_workers, share in [(0, 4), (1, 4), (2, 2), (3, 1), (4, 1), (8, 0)]:
+        monkeypatch.setattr(executors, "CPU_WORKERS", cpu_workers)
+        assert executors.page_workers_per_cpu_worker() == share
+
+
+def test_cpu_workers_that_use_up_the_page_workers_extract_single_threaded(monkeypatch):
+    monkeypatch.setattr(executors, "CPU_WORKERS", 2)
+    monkeypatch.setattr(executors, "PAGE_WORKERS", 3)
+    monkeypatch.setenv("PDF_PARALLEL_MIN_PAGES", "24")
+    executors.shutdown_pools()
+    try:
+        async def scenario():
+            parsed = await asyncio.gather(*(executors.run_cpu(core.parse_resume, _make_pdf()) for _ in range(2)))
+            return parsed, await asyncio.gather(*(executors.run_cpu(_page_pool_size) for _ in range(4)))
+
+        parsed, sizes = asyncio.run(scenario())
+    finally:
+        executors.shutdown_pools()
+    assert all(result["skills"] == ["docker", "kubernetes", "python"] for result in parsed)
+    assert set(sizes) == {(1, 0)}
+
+
+def test_cpu_worker_with_a_page_pool_exits_on_shutdown(monkeypatch):
+    monkeypatch.setattr(executors, "CPU_WORKERS", 1)
+    monkeypatch.setattr(executors, "PAGE_WORKERS", 2)
+    # Read by the spawned CPU worker when it imports core
+    monkeypatch.setenv("PDF_PARALLEL_MIN_PAGES", "24")
+    executors.shutdown_pools()
+
+    result = asyncio.run(executors.run_cpu(core.parse_resume, _make_pdf()))
+    assert result["skills"] == ["docker", "kubernetes", "python"]
+    assert asyncio.run(executors.run_cpu(_page_pool_size)) == (2, 2)
+    workers = list(executors.get_cpu_pool()._processes.values())
+    executors.shutdown_pools()
+    for worker in workers:
+        worker.join(timeout=15)
+        assert not worker.is_alive()
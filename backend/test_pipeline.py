@@ -0,0 +1,105 @@
+"""
+run_stages executes the request pipeline as a dependency graph: independent stages
+overlap, failures with a fallback stay contained, other failures cancel the run.
+"""
+import asyncio
+import time
+
+import pytest
+
+import executors
+import main
+from metrics import StageTimer
+from pipeline import Stage, run_stages
+
+STAGE_DELAY_S = 0.2
+
+
+def _slow(result):
+    def stage(*args):
+        time.sleep(STAGE_DELAY_S)
+        return result
+    return stage
+
+
+async def _sleep_then(value, delay=STAGE_DELAY_S):
+    await asyncio.sleep(delay)
+    return value
+
+
+def test_independent_stages_overlap():
+    timer = StageTimer("test")
+    stages = [
+        Stage("a", lambda: _sleep_then(1)),
+        Stage("b", lambda: _sleep_then(2)),
+        Stage("c", lambda a, b: a + b, deps=["a", "b"]),
+    ]
+    started = time.perf_counter()
+    results = asyncio.run(run_stages(stages, timer))
+    elapsed = time.perf_counter() - started
+
+    assert results == {"a": 1, "b": 2, "c": 3}
+    assert elapsed < STAGE_DELAY_S * 1.5
+    assert [name for name, _ in timer.stages][-1] == "c"
+
+
+def test_failed_stage_with_fallback_is_isolated():
+    def broken():
+        raise RuntimeError("scoring failed")
+
+    stages = [
+        Stage("ats", broken, fallback=lambda exc: None),
+        Stage("report", lambda ats: {"ats": ats}, deps=["ats"]),
+    ]
+    assert asyncio.run(run_stages(stages, StageTimer("test")))["report"] == {"ats": None}
+
+
+def test_failed_stage_without_fallback_cancels_the_rest():
+    cancelled = []
+
+    async def long_running():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    def broken():
+        raise ValueError("unreadable resume")
+
+    stages = [
+        Stage("parse", broken),
+        Stage("jd", long_running),
+        Stage("match", lambda parsed: parsed, deps=["parse"]),
+    ]
+    started = time.perf_counter()
+    with pytest.raises(ValueError, match="unreadable resume"):
+        asyncio.run(run_stages(stages, StageTimer("test")))
+    assert time.perf_counter() - started < 1
+    assert cancelled == [True]
+
+
+def test_stages_must_follow_their_deps():
+    with pytest.raises(ValueError, match="must be listed before"):
+        asyncio.run(run_stages([Stage("b", lambda a: a, deps=["a"]), Stage("a", lambda: 1)], StageTimer("test")))
+
+
+def test_analyze_resume_latency_is_the_critical_path(api, monkeypatch):
+    monkeypatch.setattr(executors, "IO_WORKERS", 8)
+    monkeypatch.setattr(main, "parse_resume", _slow({"text": "python developer", "skills": ["python"]}))
+    monkeypatch.setattr(main, "extract_job_skills", _slow(["Python", "Docker"]))
+    monkeypatch.setattr(main, "calculate_ats_score", _slow({"overall_ats_score": 50.0}))
+    monkeypatch.setattr(main, "generate_llm_recommendations", _slow("Build a Docker project"))
+
+    started = time.perf_counter()
+    response = api(
+        "POST", "/analyze-resume",
+        files={"file": ("resume.pdf", b"%PDF-1.4 fake", "application/pdf")},
+        data={"job_role": "Software Developer"},
+    )
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    assert response.json()["result"]["ats_score"] == {"overall_ats_score": 50.0}
+    # parse || JD skills, then LLM || ATS: two stage delays instead of four
+    assert elapsed < STAGE_DELAY_S * 3
@@ -0,0 +1,120 @@
+"""
+The recommendation prompt carries only what the answer depends on: a constant
+instruction prefix, the relevant job description sentences and deduplicated skill
+lists. Gemini calls record their token counts and latency.
+"""
+import random
+
+import core
+from benchmarks.corpus import generate_job_posting
+from benchmarks.stubs import STUB_RECOMMENDATIONS, StubLLMModel, StubResponse
+from cache import LRUCache, TieredCache
+from metrics import LLM_SECONDS, LLM_TOKENS
+
+CORPUS_SIZE = 200
+
+
+# The prompt as it was built before compaction
+def _legacy_prompt(resume_data: dict, job_description: str, match_info: dict) -> str:
+    return f"""
+    The user wants to apply for the following role:
+    {job_description}
+
+    Current resume skills:
+    {', '.join(resume_data['skills'])}
+
+    Matched skills:
+    {', '.join(match_info['matched_skills'])}
+
+    Missing skills:
+    {', '.join(match_info['missing_skills'])}
+
+    Generate three practical and market-relevant recommendations to improve the user’s resume and skillset. Focus on bridging missing skills with real-world actions that can be completed within one to three months. Each recommendation should be personalized, realistic, and actionable, including projects, certifications, or ways to highlight experience. Format the recommendations clearly, with each on a separate line, avoiding symbols, extra spaces, or numbering. Use natural, human-friendly language that feels tailored to the individual.
+
+    Example style of output:
+    1. Add a personal project using [technology] and publish it on GitHub
+    2. Complete the [course or certification name] from platforms like Coursera, Udemy, or LinkedIn Learning
+    3. Emphasize [specific experience or skill] in your resume and quantify the impact wherever possible
+    """
+
+
+def _corpus():
+    rng = random.Random(24)
+    taxonomy = core.get_skill_taxonomy()
+    skills = [taxonomy.name(skill_id) for skill_id in taxonomy.ids()]
+    samples = [(jd, core.extract_job_skills(jd)) for jd in core.job_descriptions_db.values()]
+    for _ in range(CORPUS_SIZE):
+        samples.append((generate_job_posting(rng, skills, rng.randint(4, 10), rng.randint(2, 8)), None))
+    for job_description, job_skills in samples:
+        job_skills = job_skills or [taxonomy.name(skill_id) for skill_id in taxonomy.find(job_description)]
+        resume_skills = rng.sample(sorted(taxonomy.ids()), 12) + [skill.lower() for skill in job_skills[:2]]
+        match_info = core.analyze_skill_match({"skills": resume_skills}, job_skills, semantic=False)
+        # Skill lists as they arrive from mixed sources, with duplicates in other spellings
+        match_info["missing_skills"] += [skill.upper() for skill in match_info["missing_skills"][:2]]
+        yield {"skills": resume_skills + resume_skills[:3]}, job_description, match_info
+
+
+def test_prompt_size_reduction_on_jd_corpus():
+    legacy_chars = compact_chars = 0
+    for resume_data, job_description, match_info in _corpus():
+        prompt = core._recommendation_prompt(resume_data, job_description, match_info)
+        assert prompt.startswith(core.RECOMMENDATION_INSTRUCTIONS)
+        for skill in core.dedupe_skills(match_info["missing_skills"] + match_info["matched_skills"]):
+            assert skill in prompt
+        assert "equal opportunity" not in prompt and "  " not in prompt
+        legacy_chars += len(_legacy_prompt(resume_data, job_description, match_info))
+        compact_chars += len(prompt)
+
+    samples = CORPUS_SIZE + len(core.job_descriptions_db)
+    reduction = 1 - compact_chars / legacy_chars
+    print(f"\nprompt size over {samples} JDs: ~{core.estimate_tokens(' ' * legacy_chars) // samples} -> "
+          f"~{core.estimate_tokens(' ' * compact_chars) // samples} tokens per call ({reduction:.0%} smaller), "
+          f"of which {core.estimate_tokens(core.RECOMMENDATION_INSTRUCTIONS)} are the constant instruction prefix")
+    assert reduction > 0.3
+
+
+def test_compaction_keeps_relevant_sentences_in_order():
+    job_description = """
+        Acme builds logistics software.   We love dogs.
+        You will own our Go services on Kubernetes.
+        We love dogs.
+        Experience with event sourcing is a plus.
+    """
+    assert core.compact_job_description(job_description, ["Go"]) == (
+        "Acme builds logistics software. You will own our Go services on Kubernetes. "
+        "Experience with event sourcing is a plus."
+    )
+    assert core.compact_job_description(job_description, max_chars=60) == "Acme builds logistics software."
+    assert core.compact_job_description("x" * 50, max_chars=20) == "x" * 20 + "..."
+
+
+class _Usage:
+    prompt_token_count = 321
+    candidates_token_count = 54
+
+
+def test_calls_record_tokens_and_latency(monkeypatch):
+    monkeypatch.setattr(core, "llm_cache", TieredCache(LRUCache()))
+    stub = StubLLMModel()
+    monkeypatch.setattr(core, "get_llm_model", lambda: stub)
+    args = ({"skills": ["python"]}, core.job_descriptions_db["Data Scientist"],
+            {"matched_skills": ["python"], "missing_skills": ["AWS"]})
+
+    before = (LLM_TOKENS.count(direction="input"), LLM_SECONDS.count(mode="blocking"), LLM_SECONDS.count(mode="stream"))
+    core.generate_llm_recommendations(*args)
+
+    # Streaming: the usage reported on the last chunk is used instead of an estimate
+    def stream():
+        yield StubResponse(STUB_RECOMMENDATIONS)
+        last = StubResponse("")
+        last.usage_metadata = _Usage()
+        yield last
+    monkeypatch.setattr(stub, "_stream", stream)
+    monkeypatch.setattr(core, "llm_cache", TieredCache(LRUCache()))
+    input_sum = LLM_TOKENS._series[("input",)][-1]
+    assert "".join(core.stream_llm_recommendations(*args)) == STUB_RECOMMENDATIONS
+
+    assert LLM_TOKENS.count(direction="input") == before[0] + 2
+    assert LLM_SECONDS.count(mode="blocking") == before[1] + 1
+    assert LLM_SECONDS.count(mode="stream") == before[2] + 1
+    assert LLM_TOKENS._series[("input",)][-1] == input_sum + 321
@@ -0,0 +1,132 @@
+"""
+Bounded ingestion in parse_resume: byte cap while streaming, page cap before extraction,
+time budget during extraction, no decoding of arbitrary binary, and Python memory that
+follows the extracted text rather than the size of the document.
+"""
+import io
+import os
+import tracemalloc
+
+import fitz
+import pytest
+
+import core
+import executors
+from core import ResumeParseError, ResumeTooLargeError, parse_resume, read_upload_stream
+
+
+def _make_pdf(pages: int, text: str = "Python developer with Docker and Kubernetes experience", image_side: int = 0) -> bytes:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"{text} page {i}")
+        if image_side:
+            samples = os.urandom(image_side * image_side * 3)
+            page.insert_image(fitz.Rect(72, 100, 300, 300), pixmap=fitz.Pixmap(fitz.csRGB, image_side, image_side, samples, False))
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class CountingStream(io.RawIOBase):
+    """Endless byte stream that records how much was read from it."""
+
+    def __init__(self):
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        size = 64 * 1024 if size is None or size < 0 else size
+        self.bytes_read += size
+        return b"x" * size
+
+
+class FakeUpload:
+    def __init__(self, stream):
+        self.file = stream
+
+
+def test_text_and_skills_match_page_by_page_extraction():
+    raw = _make_pdf(3)
+    with fitz.open(stream=raw, filetype="pdf") as doc:
+        expected = "".join(page.get_text("text") + "\n" for page in doc)
+
+    result = parse_resume(raw)
+    assert result["text"] == expected
+    assert result["skills"] == ["docker", "kubernetes", "python"]
+
+
+def test_oversized_stream_is_rejected_without_reading_it_all(monkeypatch):
+    monkeypatch.setattr(core, "MAX_UPLOAD_BYTES", 1024 * 1024)
+    stream = CountingStream()
+    with pytest.raises(ResumeTooLargeError):
+        parse_resume(FakeUpload(stream))
+    assert stream.bytes_read <= core.MAX_UPLOAD_BYTES + core.UPLOAD_CHUNK_BYTES
+
+
+def test_read_upload_stream_accepts_data_under_the_cap():
+    assert read_upload_stream(io.BytesIO(b"abc" * 1000), max_bytes=3000) == b"abc" * 1000
+    with pytest.raises(ResumeTooLargeError):
+        read_upload_stream(io.BytesIO(b"abc" * 1000), max_bytes=2999)
+
+
+def test_page_cap_rejects_before_extraction(monkeypatch):
+    monkeypatch.setattr(core, "MAX_PDF_PAGES", 50)
+    with pytest.raises(ResumeTooLargeError, match="300 pages"):
+        parse_resume(_make_pdf(300))
+
+
+def test_extraction_time_budget(monkeypatch):
+    monkeypatch.setattr(core, "PDF_EXTRACTION_BUDGET_S", 0)
+    with pytest.raises(ResumeTooLargeError, match="longer than"):
+        parse_resume(_make_pdf(5))
+
+
+def test_binary_garbage_is_not_decoded_as_text():
+    with pytest.raises(ResumeParseError):
+        parse_resume(os.urandom(4096))
+    with pytest.raises(ResumeParseError):
+        parse_resume(b"%PDF-1.7 truncated python docker")
+
+
+def test_plain_text_resume_still_supported():
+    assert parse_resume(b"Skills: Python, Docker")["skills"] == ["docker", "python"]
+
+
+def _peak_python_memory(raw: bytes) -> tuple:
+    """Returns (peak traced bytes, extracted text length) for one accepted parse."""
+    tracemalloc.start()
+    try:
+        text = parse_resume(raw)["text"]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, len(text)
+
+
+@pytest.fixture
+def serial_extraction(monkeypatch):
+    # Serial path, so all extraction happens in this process where tracemalloc can see it
+    monkeypatch.setattr(executors, "PAGE_WORKERS", 0)
+    monkeypatch.setattr(core, "MAX_PDF_PAGES", 2000)
+    parse_resume(_make_pdf(2))  # load the taxonomy outside the measurement
+
+
+def test_memory_does_not_grow_with_document_size(serial_extraction):
+    plain = _make_pdf(40)
+    # Same text, plus a distinct incompressible image on every page
+    bloated = _make_pdf(40, image_side=150)
+    assert len(bloated) > 100 * len(plain)
+
+    plain_peak, plain_text = _peak_python_memory(plain)
+    bloated_peak, bloated_text = _peak_python_memory(bloated)
+    assert plain_text == bloated_text
+    # The document stays in MuPDF; only page text reaches Python
+    assert bloated_peak < plain_peak + 16 * 1024
+
+
+def test_memory_grows_linearly_with_extracted_text(serial_extraction):
+    small_peak, small_text = _peak_python_memory(_make_pdf(40))
+    huge_peak, huge_text = _peak_python_memory(_make_pdf(1500))
+    assert huge_text > 30 * small_text
+    # Page texts are joined once: a bounded number of copies of the text, nothing quadratic
+    assert huge_peak - small_peak < 16 * (huge_text - small_text)
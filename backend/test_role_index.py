@@ -0,0 +1,67 @@
+"""
+/rank-roles scores a resume against every role at once with RoleIndex, giving the
+same results as calling analyze_skill_match (exact mode) role by role.
+"""
+import random
+
+import pytest
+
+import core
+
+
+def _role_skills() -> dict:
+    rng = random.Random(8)
+    taxonomy = core.get_skill_taxonomy()
+    names = [taxonomy.name(skill_id) for skill_id in taxonomy.ids()]
+    role_skills = dict(core.get_role_store().role_skills())
+    role_skills.update(core.precompute_role_skills())
+    for i in range(200):
+        skills = rng.sample(names, rng.randint(1, 12)) + [f"In-house Tool {i % 7}"]
+        # The same skill twice, in another spelling, counts once
+        skills.append(skills[0].upper())
+        role_skills[f"Synthetic Role {i}"] = skills
+    role_skills["Role Without Skills"] = []
+    return role_skills
+
+
+def _resumes() -> list:
+    rng = random.Random(9)
+    forms = ["k8s", "golang", "node.js", "Python", "in-house tool 3", "PostgreSQL", "cpp", "excel"]
+    ids = core.get_skill_taxonomy().ids()
+    return [[], ["python"], forms] + [rng.sample(ids, rng.randint(1, 25)) + rng.sample(forms, 2) for _ in range(20)]
+
+
+def test_rank_matches_analyze_skill_match_for_every_role():
+    role_skills = _role_skills()
+    index = core.build_role_index(role_skills)
+
+    for resume_skills in _resumes():
+        ranked = index.rank(resume_skills)
+        assert len(ranked) == len(role_skills)
+        percentages = [role["match_percentage"] for role in ranked]
+        assert percentages == sorted(percentages, reverse=True)
+        for role in ranked:
+            expected = core.analyze_skill_match({"skills": resume_skills}, role_skills[role["job_role"]], semantic=False)
+            assert role["match_percentage"] == expected["match_percentage"], role["job_role"]
+            assert sorted(role["matched_skills"]) == sorted(expected["matched_skills"])
+            assert sorted(role["missing_skills"]) == sorted(expected["missing_skills"])
+
+
+def test_top_k_keeps_the_best_roles():
+    index = core.build_role_index(_role_skills())
+    resume_skills = _resumes()[2]
+    full = index.rank(resume_skills)
+    top = index.rank(resume_skills, top_k=5)
+    assert [role["match_percentage"] for role in top] == [role["match_percentage"] for role in full[:5]]
+    assert len(index.rank(resume_skills, top_k=len(index) + 10)) == len(index)
+    for top_k in (0, -1):
+        with pytest.raises(ValueError):
+            index.rank(resume_skills, top_k=top_k)
+
+
+def test_rank_roles_rejects_top_k_below_one(api):
+    for top_k in ("0", "-1"):
+        response = api("POST", "/rank-roles", files={"file": ("resume.pdf", b"%PDF-1.4 fake", "application/pdf")},
+                       data={"top_k": top_k})
+        assert response.status_code == 400
+        assert response.json() == {"error": "top_k must be at least 1."}
@@ -0,0 +1,156 @@
+"""
+Job descriptions come from the indexed role store: role names resolve despite casing
+and punctuation, typos only get "did you mean" suggestions, and imported roles carry
+precomputed skills and keywords that the request path uses instead of running NLP again.
+The store opens on first use, built files are served read-only, and /rank-roles picks
+up roles added after its index was built.
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+import core
+import main
+import role_store
+from role_store import RoleStore, normalize_role
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "roles.jsonl"
+    lines = [
+        {"name": "Backend Engineer", "description": "Go and PostgreSQL services.", "skills": ["Go", "PostgreSQL"]},
+        {"role": "Frontend Engineer", "description": "React and TypeScript apps."},
+        {"name": "Data Engineer", "description": "Spark and Airflow pipelines.", "keywords": ["spark"]},
+        {"name": "Machine Learning Engineer", "description": "PyTorch models."},
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n", encoding="utf-8")
+    roles = RoleStore(str(tmp_path / "roles.sqlite3"))
+    imported = roles.import_jsonl(str(path), derive_skills=lambda text: text.split()[:2],
+                                  derive_keywords=lambda text: ["derived"])
+    assert imported == 4 and len(roles) == 4
+    yield roles
+    roles.close()
+
+
+def test_import_keeps_given_values_and_derives_missing_ones(store):
+    assert store.get("Backend Engineer")["skills"] == ["Go", "PostgreSQL"]
+    assert store.get("Backend Engineer")["keywords"] == ["derived"]
+    assert store.get("Frontend Engineer")["skills"] == ["React", "and"]
+    assert store.get("Data Engineer")["keywords"] == ["spark"]
+
+
+def test_exact_lookup_and_suggestions(store):
+    assert normalize_role("  machine-learning   ENGINEER ") == "machine learning engineer"
+    assert store.get("data-engineer")["name"] == "Data Engineer"
+    assert store.get("Machin Lerning Enginer") is None
+    assert store.search("Machin Lerning Enginer")[0]["name"] == "Machine Learning Engineer"
+    assert store.search("Astronaut") == []
+
+    suggestions = store.search("eng")
+    assert suggestions == []  # no role starts with "eng" and three letters are too few to be close
+    suggestions = store.search("front")
+    assert suggestions[0] == {"name": "Frontend Engineer", "score": 1.0}
+    assert store.search("Bakend Enginer")[0]["name"] == "Backend Engineer"
+
+
+def test_reimport_replaces_and_reindexes(store, tmp_path):
+    store.add_roles([{"name": "backend engineer", "description": "Rust services.", "skills": ["Rust"]}])
+    assert len(store) == 4
+    assert store.get("Backend Engineer") == {"name": "backend engineer", "description": "Rust services.",
+                                               "skills": ["Rust"], "keywords": None}
+    with pytest.raises(ValueError, match="roles.jsonl:1"):
+        bad = tmp_path / "roles.jsonl"
+        bad.write_text('{"description": "no name"}\n', encoding="utf-8")
+        store.import_jsonl(str(bad))
+
+
+def test_builtin_roles_resolve_by_name_only():
+    assert core.get_description_from_db("software developer") == core.job_descriptions_db["Software Developer"]
+    # A close name is another role, not a typo to correct
+    assert core.get_description_from_db("Hardware Developer") == "No description available for this role."
+    assert core.suggest_roles("Sofware Developr")[0] == "Software Developer"
+
+
+def test_unknown_role_is_rejected_with_suggestions(api):
+    for job_role in ("Web Developer", "Hardware Developer"):
+        response = api("POST", "/analyze-resume", files={"file": ("resume.pdf", b"%PDF-1.4 fake", "application/pdf")},
+                       data={"job_role": job_role})
+        assert response.status_code == 400
+        body = response.json()
+        assert body["error"] == f"Unknown job role '{job_role}'. Pick a known role or send a job_description."
+        assert body["suggestions"][0] == "Software Developer"
+
+
+def test_stored_skills_skip_nlp_on_request_path(store, api, monkeypatch):
+    monkeypatch.setattr(core, "get_role_store", lambda: store)
+    monkeypatch.setattr(main, "parse_resume", lambda raw: {"text": "go developer", "skills": ["go"]})
+    monkeypatch.setattr(main, "generate_llm_recommendations", lambda *args: "1. Learn PostgreSQL")
+
+    def no_nlp(job_description):
+        raise AssertionError("skills of a stored role were derived again")
+    monkeypatch.setattr(main, "extract_job_skills", no_nlp)
+
+    analyzed = api("POST", "/analyze-resume", files={"file": ("resume.pdf", b"%PDF-1.4 fake", "application/pdf")},
+                   data={"job_role": "backend-engineer"})
+    roles = api("GET", "/roles", params={"q": "Front"})
+
+    assert analyzed.status_code == 200
+    result = analyzed.json()["result"]
+    assert result["matched_skills"] == ["Go"] and result["missing_skills"] == ["PostgreSQL"]
+    assert roles.json() == {"roles": [{"name": "Frontend Engineer", "score": 1.0}]}
+
+
+def test_importing_core_does_not_open_the_role_store():
+    code = "import core; assert not core.RESOURCES['roles'].is_ready; print('ok')"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=os.path.dirname(core.__file__),
+                            env={**os.environ, "ROLE_STORE_PATH": "/nonexistent/roles.sqlite3"})
+    assert result.returncode == 0 and result.stdout.splitlines()[-1] == "ok", result.stderr
+
+
+def test_built_file_is_served_read_only(tmp_path, monkeypatch):
+    jsonl, path = tmp_path / "roles.jsonl", tmp_path / "roles.sqlite3"
+    jsonl.write_text(json.dumps({"name": "Backend Engineer", "description": "Go services.", "skills": ["Go"],
+                                 "keywords": ["go"]}) + "\n", encoding="utf-8")
+    assert role_store.main([str(jsonl), str(path)]) == 0
+    built = path.read_bytes()
+
+    monkeypatch.setattr(core, "ROLE_STORE_PATH", str(path))
+    store = core._load_role_store()
+    assert store.get("backend engineer")["skills"] == ["Go"]
+    # The built-in roles were seeded when the file was built
+    assert store.get("Software Developer") is not None
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        store.add_roles([{"name": "Intruder", "description": "x"}])
+    store.close()
+    assert path.read_bytes() == built
+    assert sorted(os.listdir(tmp_path)) == ["roles.jsonl", "roles.sqlite3"]
+
+    monkeypatch.setattr(core, "ROLE_STORE_PATH", str(tmp_path / "missing.sqlite3"))
+    with pytest.raises(FileNotFoundError, match="role_store.py"):
+        core._load_role_store()
+
+
+def test_rank_roles_sees_roles_added_after_the_index_was_built(store, in_process, monkeypatch):
+    monkeypatch.setattr(core, "get_role_store", lambda: store)
+    monkeypatch.setattr(main, "role_index", None)
+    reader = RoleStore(store.path, read_only=True)
+
+    async def ranked_roles():
+        return {role["job_role"] for role in (await main.get_role_index()).rank(["go"])}
+
+    try:
+        before = asyncio.run(ranked_roles())
+        assert "Backend Engineer" in before and "Site Reliability Engineer" not in before
+        generation = reader.generation()
+        store.add_roles([{"name": "Site Reliability Engineer", "description": "Go on call.", "skills": ["Go"]}])
+        assert "Site Reliability Engineer" in asyncio.run(ranked_roles())
+        # Another connection (another process) sees the write too
+        assert reader.generation() != generation
+    finally:
+        reader.close()
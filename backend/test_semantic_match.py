@@ -0,0 +1,83 @@
+"""
+Semantic skill matching pairs missing job skills with similar resume skills using
+word vectors: one matrix product per call, scores reported, exact results untouched.
+"""
+import time
+
+import numpy as np
+import pytest
+
+import core
+from semantic_match import SkillVectors, semantic_matches
+
+DIM = 300
+
+
+def _fake_word_vectors(seed: int = 3):
+    # Random directions per word, with "tf" a near-copy of "tensorflow" and "kube" of "kubernetes"
+    rng = np.random.default_rng(seed)
+    table = {}
+
+    def lookup(word: str):
+        if word in ("tf", "kube"):
+            base = lookup({"tf": "tensorflow", "kube": "kubernetes"}[word])
+            return base + rng.normal(scale=0.02, size=DIM).astype(np.float32)
+        if word not in table:
+            table[word] = rng.normal(size=DIM).astype(np.float32)
+        return table[word]
+
+    return lookup
+
+
+@pytest.fixture
+def vectors(monkeypatch):
+    taxonomy = core.get_skill_taxonomy()
+    skill_vectors = SkillVectors(_fake_word_vectors(), DIM, {skill_id: taxonomy.name(skill_id) for skill_id in taxonomy.ids()})
+    monkeypatch.setattr(core, "get_skill_vectors", lambda: skill_vectors)
+    return skill_vectors
+
+
+def test_similar_skills_match_with_their_scores(vectors):
+    matches = semantic_matches(vectors, {"tensorflow": "TensorFlow", "docker": "Docker"}, {"tf": "TF", "go": "go"}, 0.7)
+    assert [(m["job_skill"], m["resume_skill"]) for m in matches] == [("TensorFlow", "TF")]
+    assert 0.95 < matches[0]["similarity"] <= 1.0
+    # "tf" is not a taxonomy skill, so its vector was computed once and cached
+    assert vectors.cache.get("tf") is not None
+
+
+def test_semantic_mode_extends_the_exact_match(vectors):
+    resume = {"skills": ["python", "tf"]}
+    job_skills = ["Python", "TensorFlow", "Docker"]
+
+    exact = core.analyze_skill_match(resume, job_skills, semantic=False)
+    assert "semantic_matches" not in exact
+    assert exact["match_percentage"] == 33.33
+
+    semantic = core.analyze_skill_match(resume, job_skills, semantic=True)
+    assert sorted(semantic["matched_skills"]) == ["Python", "tf"]
+    assert semantic["missing_skills"] == ["Docker"]
+    assert semantic["match_percentage"] == 66.67
+    assert [(m["job_skill"], m["resume_skill"]) for m in semantic["semantic_matches"]] == [("TensorFlow", "tf")]
+    formatted = core.format_for_ui_and_pdf(semantic, "")
+    assert formatted["semantic_matches"] == semantic["semantic_matches"]
+
+
+def test_models_without_vectors_fall_back_to_exact(monkeypatch):
+    monkeypatch.setattr(core, "get_skill_vectors", lambda: SkillVectors(lambda word: None, 0, {"python": "Python"}))
+    result = core.analyze_skill_match({"skills": ["tf"]}, ["TensorFlow"], semantic=True)
+    assert result["missing_skills"] == ["TensorFlow"] and result["semantic_matches"] == []
+
+
+def test_semantic_overhead_is_within_budget(vectors):
+    taxonomy_ids = core.get_skill_taxonomy().ids()
+    resume = {"skills": taxonomy_ids[:30] + ["tf", "custom tooling"]}
+    job_skills = [core.get_skill_taxonomy().name(skill_id) for skill_id in taxonomy_ids[20:40]] + ["TensorFlow", "Team Leadership"]
+    core.analyze_skill_match(resume, job_skills, semantic=True)
+
+    def per_call_ms(semantic: bool) -> float:
+        start = time.perf_counter()
+        for _ in range(200):
+            core.analyze_skill_match(resume, job_skills, semantic=semantic)
+        return (time.perf_counter() - start) / 200 * 1000
+
+    assert per_call_ms(True) - per_call_ms(False) < 1.0
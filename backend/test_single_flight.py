@@ -0,0 +1,92 @@
+"""
+Identical recommendation requests that arrive while an LLM call is in flight share
+that call: one Gemini request, the same answer (or the same fallback) for everyone,
+and a caller that gives up does not cancel the call for the others.
+"""
+import asyncio
+import time
+
+import pytest
+
+import core
+import main
+from benchmarks.stubs import STUB_RECOMMENDATIONS, StubLLMModel
+from single_flight import SingleFlight
+
+CONCURRENT = 20
+RESUME = {"text": "Python developer", "skills": ["python"]}
+MATCH = {"matched_skills": ["python"], "missing_skills": ["Docker", "AWS"]}
+
+
+class FailingLLMModel:
+    def __init__(self, delay_s: float = 0.1):
+        self.delay_s = delay_s
+        self.calls = 0
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay_s)
+        raise RuntimeError("503 model overloaded")
+
+
+@pytest.fixture(autouse=True)
+def fresh_llm(in_process, fresh_llm_cache, monkeypatch):
+    monkeypatch.setattr(core, "LLM_RETRIES", 0)
+    monkeypatch.setattr(main, "_llm_flights", SingleFlight())
+
+
+def test_identical_concurrent_requests_make_one_call(llm_model):
+    stub = llm_model(StubLLMModel(delay_s=0.2))
+    jd = core.job_descriptions_db["Data Scientist"]
+
+    async def scenario():
+        same = [main.get_recommendations(RESUME, jd, MATCH) for _ in range(CONCURRENT)]
+        # Skill lists in another order and spelling give the same prompt key
+        reordered = main.get_recommendations({"skills": ["Python"]}, jd, {"matched_skills": ["Python"], "missing_skills": ["aws", "docker"]})
+        other = main.get_recommendations(RESUME, core.job_descriptions_db["Software Developer"], MATCH)
+        return await asyncio.gather(*same, reordered, other)
+
+    results = asyncio.run(scenario())
+    assert results[:-1] == [(STUB_RECOMMENDATIONS, "llm")] * (CONCURRENT + 1)
+    assert results[-1] == (STUB_RECOMMENDATIONS, "llm")
+    assert stub.calls == 2
+    assert (main._llm_flights.started, main._llm_flights.coalesced) == (2, CONCURRENT)
+    assert len(main._llm_flights) == 0
+
+
+def test_a_failed_call_falls_back_for_every_waiter_and_is_not_reused(llm_model):
+    failing = llm_model(FailingLLMModel())
+    jd = core.job_descriptions_db["Data Scientist"]
+
+    async def scenario():
+        return await asyncio.gather(*(main.get_recommendations(RESUME, jd, MATCH) for _ in range(CONCURRENT)))
+
+    fallback = (main.template_recommendations(MATCH), "fallback")
+    assert asyncio.run(scenario()) == [fallback] * CONCURRENT
+    assert failing.calls == 1
+    # The failure is not remembered: the next request tries again
+    stub = llm_model()
+    assert asyncio.run(main.get_recommendations(RESUME, jd, MATCH)) == (STUB_RECOMMENDATIONS, "llm")
+    assert stub.calls == 1
+
+
+def test_cancelling_one_waiter_does_not_cancel_the_shared_call():
+    flights = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def scenario():
+        waiters = [asyncio.ensure_future(flights.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        waiters[0].cancel()
+        return await asyncio.gather(*waiters, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == ["answer", "answer"]
+    assert calls == [1]
+    assert len(flights) == 0
@@ -0,0 +1,87 @@
+"""
+Resumes and job descriptions resolve skills through one taxonomy: aliases and
+abbreviations map to canonical ids, so "Node.js" on a resume matches "nodejs" in a
+job description and "k8s" counts as Kubernetes.
+"""
+import core
+from skill_taxonomy import SkillTaxonomy
+
+ENTRIES = [
+    {"id": "kubernetes", "name": "Kubernetes", "aliases": ["k8s"]},
+    {"id": "nodejs", "name": "Node.js", "aliases": ["node.js"]},
+    {"id": "docker", "name": "Docker"},
+    {"id": "docker-compose", "name": "Docker Compose"},
+    {"id": "c++", "name": "C++", "aliases": ["cpp"]},
+    {"id": "go", "name": "Go", "aliases": ["golang", "k8s"], "cased_forms": ["Go"]},
+    {"id": "apache", "name": "Apache HTTP Server", "resume_forms": ["apache"]},
+    {"id": "apache kafka", "name": "Apache Kafka", "aliases": ["kafka"]},
+]
+# Ordinary prose made of words that are also skill names
+JD_PROSE = ("We express interest early; go to market in spring with swift delivery. Teams react to "
+            "incidents, steer the helm of rust-belt plants, ride the rails, spark ideas and a lambda of "
+            "angular growth. Carry the torch; the apache helicopter, ruby wine and a flask of celery soup.")
+
+
+def test_aliases_resolve_to_canonical_ids():
+    taxonomy = SkillTaxonomy.from_entries(ENTRIES)
+    assert len(taxonomy) == 8
+    assert taxonomy.canonical("K8S") == "kubernetes"  # the first entry to claim a form keeps it
+    assert taxonomy.canonical("Node JS") == "nodejs"
+    assert taxonomy.canonical("  NODE.JS ") == "nodejs"
+    assert taxonomy.canonical("Rust") is None
+    assert taxonomy.name("nodejs") == "Node.js"
+    assert taxonomy.find("Ran k8s, docker-compose and Node.js; wrote C++, golang (not cppcheck or gopher).") == {
+        "kubernetes", "docker-compose", "nodejs", "c++", "go"
+    }
+
+
+def test_longest_form_hides_the_shorter_ones_it_starts_with():
+    taxonomy = SkillTaxonomy.from_entries(ENTRIES)
+    assert taxonomy.find("Streams on Apache Kafka, builds with docker-compose") == {"apache kafka", "docker-compose"}
+    assert taxonomy.find("Apache Kafka and Apache", job=True) == {"apache kafka"}
+    assert taxonomy.find("Docker, then docker-compose") == {"docker", "docker-compose"}
+
+
+def test_plain_words_only_count_as_skills_on_resumes_or_in_their_spelling():
+    taxonomy = SkillTaxonomy.from_entries(ENTRIES)
+    assert taxonomy.find("go and apache") == {"go", "apache"}
+    assert taxonomy.find("go to market, apache, GO", job=True) == set()
+    assert taxonomy.find("Go, golang or GoLang", job=True) == {"go"}
+    assert taxonomy.allows("Go") and taxonomy.allows("Kubernetes")
+    assert not taxonomy.allows("go") and not taxonomy.allows("Apache")
+
+
+def test_job_description_prose_yields_no_skills():
+    assert core.extract_job_skills(JD_PROSE) == []
+    skills = core.extract_job_skills(JD_PROSE + " Build Go services with Spring Boot on AWS Lambda and Apache Kafka.")
+    assert sorted(skills) == ["AWS Lambda", "Apache Kafka", "Go", "Spring"]
+
+
+def test_compiled_taxonomy_is_memory_mapped(tmp_path):
+    compiled = SkillTaxonomy.from_entries(ENTRIES)
+    path = str(tmp_path / "skills.marisa")
+    compiled.save(path)
+    loaded = SkillTaxonomy.load(path)
+    assert loaded.ids() == compiled.ids()
+    assert loaded.find("golang on K8S") == {"go", "kubernetes"}
+
+
+def test_resume_and_job_sides_meet_on_canonical_ids():
+    resume = core.parse_resume(b"Skills: Node.js, K8s, Postgres, golang")
+    assert resume["skills"] == ["go", "kubernetes", "nodejs", "postgresql"]
+
+    job_skills = core.extract_job_skills("We run NodeJS services on Kubernetes with PostgreSQL and Docker.")
+    assert sorted(job_skills) == ["Docker", "Kubernetes", "Node.js", "PostgreSQL"]
+
+    match = core.analyze_skill_match(resume, job_skills)
+    assert sorted(match["matched_skills"]) == ["Kubernetes", "Node.js", "PostgreSQL"]
+    assert match["missing_skills"] == ["Docker"]
+    assert match["match_percentage"] == 75.0
+
+
+def test_matched_and_missing_skills_use_display_names():
+    match = core.analyze_skill_match({"skills": ["k8s", "nodejs", "In-house tool"]},
+                                     ["kubernetes", "Node.js", "postgres", "In-House Tool", "Team Lead"], semantic=False)
+    assert sorted(match["matched_skills"]) == ["In-house tool", "Kubernetes", "Node.js"]
+    assert sorted(match["missing_skills"]) == ["PostgreSQL", "Team Lead"]
+    assert match["match_percentage"] == 60.0
@@ -0,0 +1,108 @@
+"""
+/analyze-resume/stream sends the deterministic analysis before the LLM has produced
+anything, then the recommendation lines as Gemini streams them, cleaned exactly like
+format_for_ui_and_pdf would clean the whole text. The LLM budget bounds the whole stream.
+"""
+import asyncio
+import io
+import json
+import time
+
+import pytest
+from starlette.datastructures import UploadFile
+
+import core
+import main
+from benchmarks.stubs import STUB_RECOMMENDATIONS, StubLLMModel, StubResponse
+
+LLM_DELAY_S = 0.4
+
+
+@pytest.fixture
+def stream_endpoint(in_process, fresh_llm_cache, monkeypatch):
+    monkeypatch.setattr(main, "parse_resume", lambda raw: {"text": "Python developer", "skills": ["python"]})
+    monkeypatch.setattr(main, "extract_job_skills", lambda jd: ["Python", "Docker", "AWS"])
+
+    async def run():
+        upload = UploadFile(io.BytesIO(b"%PDF-1.4 fake"), filename="resume.pdf")
+        started = time.perf_counter()
+        response = await main.analyze_resume_stream(upload, job_role="Software Developer", job_description=None)
+        events = []
+        async for line in response.body_iterator:
+            events.append((time.perf_counter() - started, json.loads(line)))
+        while main._late_llm_calls:
+            await asyncio.sleep(0.02)
+        return response, events
+
+    return lambda: asyncio.run(run())
+
+
+def test_analysis_arrives_before_llm_lines(stream_endpoint, llm_model):
+    stub = llm_model(StubLLMModel(delay_s=LLM_DELAY_S, chunk_chars=25))
+
+    response, events = stream_endpoint()
+    types = [event["type"] for _, event in events]
+    assert types == ["analysis", "recommendation", "recommendation", "recommendation", "done"]
+
+    first_byte_s, analysis = events[0]
+    assert first_byte_s < LLM_DELAY_S / 2
+    assert analysis["result"]["missing_skills"] and "ats_score" in analysis["result"]
+
+    expected = core.format_for_ui_and_pdf({"match_percentage": 0, "matched_skills": [], "missing_skills": []},
+                                          STUB_RECOMMENDATIONS)["recommendations"]
+    assert [event["text"] for _, event in events[1:4]] == expected
+    # Lines are sent as they complete, not all at the end
+    assert events[1][0] < events[3][0] - LLM_DELAY_S / 4
+
+    done = events[-1][1]
+    assert done["result"]["recommendations"] == expected
+    assert done["result"]["recommendations_source"] == "llm"
+    assert main.result_store.load(done["result_id"]) == done["result"]
+    assert "parse_resume;dur=" in response.headers["server-timing"]
+
+    # The full answer was cached when the stream finished
+    _, again = stream_endpoint()
+    assert [event["text"] for _, event in again[1:4]] == expected
+    assert stub.calls == 1
+
+
+def test_stream_falls_back_when_first_line_misses_budget(stream_endpoint, llm_model, monkeypatch):
+    stub = llm_model(StubLLMModel(delay_s=LLM_DELAY_S))
+    monkeypatch.setattr(core, "LLM_BUDGET_SECONDS", 0.02)
+
+    _, events = stream_endpoint()
+    done = events[-1][1]
+    assert done["result"]["recommendations_source"] == "fallback"
+    assert done["result"]["recommendations"][0] == "Add a personal project using AWS and publish it on GitHub"
+    assert events[-1][0] < LLM_DELAY_S
+    # The abandoned stream was drained in the background and cached
+    assert core.generate_llm_recommendations({"skills": ["python"]}, core.get_description_from_db("Software Developer"),
+                                             {"matched_skills": ["python"], "missing_skills": ["Docker", "AWS"]}) == STUB_RECOMMENDATIONS
+    assert stub.calls == 1
+
+
+class StallingLLMModel(StubLLMModel):
+    """Streams the first line at once, then stalls before the rest."""
+
+    def _stream(self):
+        first, rest = STUB_RECOMMENDATIONS.split("\n", 1)
+        yield StubResponse(first + "\n")
+        time.sleep(self.delay_s)
+        yield StubResponse(rest)
+
+
+def test_stream_falls_back_when_later_chunks_miss_budget(stream_endpoint, llm_model, monkeypatch):
+    llm_model(StallingLLMModel(delay_s=LLM_DELAY_S))
+    monkeypatch.setattr(core, "LLM_BUDGET_SECONDS", 0.1)
+
+    _, events = stream_endpoint()
+    types = [event["type"] for _, event in events]
+    assert types[:2] == ["analysis", "recommendation"] and types[-1] == "done"
+
+    done = events[-1][1]
+    recommendations = done["result"]["recommendations"]
+    assert done["result"]["recommendations_source"] == "fallback"
+    # The line Gemini sent in time is kept and the templates follow it
+    assert recommendations[0] == next(core.iter_recommendation_lines([STUB_RECOMMENDATIONS]))
+    assert recommendations[1] == "Add a personal project using AWS and publish it on GitHub"
+    assert events[-1][0] < LLM_DELAY_S